@@ -0,0 +1,267 @@
+"""백엔드 벤치마크 CLI
+
+합성 데이터(1k/10k/100k ETF, 보유 종목/배당 일정 포함)로 로컬 서버를 띄우고
+문서화된 /api/etfs, /api/portfolios, /api/dividends 엔드포인트를 고정 동시성으로
+호출해 p50/p99 지연 시간, 처리량, 서버 최대 RSS, 요청당 SQL 쿼리 수를 보고합니다.
+
+사용 예:
+    python -m app.benchmark --sizes 1000 10000 --concurrency 16 --requests 500
+    python -m app.benchmark --url http://localhost:8000   # 실행 중인 서버 측정
+
+데이터는 --workdir/<size>/ 아래에 생성되며(app.db, price_history/), 다음 실행 때 재사용합니다.
+서버는 해당 디렉토리를 작업 디렉토리로 해서 실행하므로 개발용 app.db를 건드리지 않습니다.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# 합성 데이터 가격 히스토리 길이 (1y 수익률까지 계산 가능한 최소 길이 근처)
+BENCH_HISTORY_DAYS = 260
+
+# (이름, 경로 생성 함수) - 경로 생성 함수는 ETF 표본(dict: ids, tickers)을 받음
+Endpoint = Callable[[dict, random.Random], str]
+
+
+def _ticker_list(sample: dict, rng: random.Random, k: int = 5) -> str:
+    return ",".join(rng.sample(sample["tickers"], min(k, len(sample["tickers"]))))
+
+
+ENDPOINTS: Dict[str, Endpoint] = {
+    "etfs.list": lambda s, r: "/api/etfs/?limit=50",
+    "etfs.list.filtered": lambda s, r: "/api/etfs/?limit=50&sector=Diversified&sort=dividend_yield&order=desc",
+    "etfs.list.search": lambda s, r: "/api/etfs/?limit=50&q=dividend",
+    "etfs.detail": lambda s, r: f"/api/etfs/{r.choice(s['ids'])}",
+    "etfs.ranking.return": lambda s, r: "/api/etfs/ranking/return/1m?limit=10",
+    "etfs.ranking.dividend": lambda s, r: "/api/etfs/ranking/dividend?limit=10&region=US",
+    "etfs.returns": lambda s, r: f"/api/etfs/returns?tickers={_ticker_list(s, r)}",
+    "etfs.sector_allocation": lambda s, r: "/api/etfs/sector/allocation",
+    "etfs.region_allocation": lambda s, r: "/api/etfs/region/allocation",
+    "etfs.history": lambda s, r: f"/api/etfs/{r.choice(s['ids'])}/history?points=120",
+    "etfs.sparklines": lambda s, r: f"/api/etfs/history/sparklines?tickers={_ticker_list(s, r, 20)}",
+    "portfolios.list": lambda s, r: "/api/portfolios/",
+    "portfolios.summary": lambda s, r: "/api/portfolios/summary",
+    "dividends.calendar": lambda s, r: "/api/dividends/calendar",
+    "dividends.upcoming": lambda s, r: "/api/dividends/upcoming?days=30",
+    "dividends.forecast": lambda s, r: "/api/dividends/forecast",
+}
+
+
+class Client:
+    """스레드별 keep-alive HTTP 연결"""
+
+    def __init__(self, base_url: str, timeout: float = 60):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def request(self, method: str, path: str, retry: bool = True) -> Tuple[int, bytes]:
+        conn = self._connection()
+        try:
+            conn.request(method, path)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            self._local.conn = None
+            # 서버가 유휴 keep-alive 연결을 닫은 경우 새 연결로 한 번 재시도
+            if retry:
+                return self.request(method, path, retry=False)
+            raise
+
+    def get_json(self, path: str):
+        status, body = self.request("GET", path)
+        if status != 200:
+            raise RuntimeError(f"GET {path} -> {status}")
+        return json.loads(body)
+
+
+def run_endpoint(client: Client, make_path: Endpoint, sample: dict, requests: int,
+                 concurrency: int, seed: int = 0) -> dict:
+    """엔드포인트 하나를 고정 동시성으로 requests번 호출"""
+    rng = random.Random(seed)
+    paths = [make_path(sample, rng) for _ in range(requests)]
+    latencies = np.zeros(requests)
+    statuses = np.zeros(requests, dtype=np.int64)  # 0: 연결 오류
+
+    def call(i: int):
+        start = time.perf_counter()
+        try:
+            statuses[i], _ = client.request("GET", paths[i])
+        except (http.client.HTTPException, OSError):
+            pass
+        latencies[i] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    p50, p99 = np.percentile(latencies, [50, 99])
+    return {
+        "requests": requests,
+        "errors": int(((statuses == 0) | (statuses >= 400)).sum()),
+        "p50_ms": round(float(p50) * 1000, 2),
+        "p99_ms": round(float(p99) * 1000, 2),
+        "throughput_rps": round(requests / elapsed, 1),
+    }
+
+
+def discover(client: Client, limit: int = 500) -> dict:
+    """요청 경로에 쓸 ETF ID/티커 표본"""
+    rows = client.get_json(f"/api/etfs/?limit={limit}&fields=id,ticker")
+    if not rows:
+        raise RuntimeError("ETF 데이터가 없습니다.")
+    return {"ids": [row["id"] for row in rows], "tickers": [row["ticker"] for row in rows]}
+
+
+def benchmark_server(base_url: str, requests: int, concurrency: int,
+                     endpoints: Optional[List[str]] = None) -> dict:
+    """실행 중인 서버의 엔드포인트별 지연 시간/처리량 측정"""
+    client = Client(base_url)
+    sample = discover(client)
+    names = endpoints or list(ENDPOINTS)
+
+    # 워밍업: 첫 요청에서 만들어지는 인메모리 인덱스의 생성 시간(콜드 스타트)을 따로 기록
+    cold = {}
+    for name in names:
+        start = time.perf_counter()
+        client.request("GET", ENDPOINTS[name](sample, random.Random(0)))
+        cold[name] = round((time.perf_counter() - start) * 1000, 2)
+    client.request("DELETE", "/metrics")
+
+    results = {}
+    for name in names:
+        results[name] = run_endpoint(client, ENDPOINTS[name], sample, requests, concurrency)
+        results[name]["cold_ms"] = cold[name]
+        print(f"  {name:<24} p50 {results[name]['p50_ms']:>9.2f}ms  p99 {results[name]['p99_ms']:>9.2f}ms  "
+              f"{results[name]['throughput_rps']:>8.1f} req/s", flush=True)
+
+    # 서버 측 통계 (요청당 SQL 쿼리 수, 최대 RSS)
+    server = client.get_json("/metrics")
+    queries = {(r["method"], r["route"]): r["queries_per_request"] for r in server["routes"]}
+    for name in names:
+        route = _route_of(ENDPOINTS[name](sample, random.Random(0)), server["routes"])
+        results[name]["queries_per_request"] = queries.get(("GET", route)) if route else None
+    return {"endpoints": results, "process": server["process"]}
+
+
+def _route_of(path: str, routes: List[dict]) -> Optional[str]:
+    # /metrics의 라우트 템플릿 중 경로와 맞는 것 (고정 세그먼트가 많이 일치하는 라우트 우선)
+    segments = path.split("?")[0].rstrip("/").split("/")
+    best, best_score = None, -1
+    for route in routes:
+        template = route["route"].rstrip("/").split("/")
+        if len(template) != len(segments):
+            continue
+        params = [t.startswith("{") and t.endswith("}") for t in template]
+        if all(p or t == s for t, s, p in zip(template, segments, params)):
+            score = params.count(False)
+            if score > best_score:
+                best, best_score = route["route"], score
+    return best
+
+
+def prepare_data(run_dir: Path, size: int, seed: int, history_days: int, env: dict):
+    """합성 데이터 생성 (이미 있으면 재사용)"""
+    if (run_dir / "app.db").exists():
+        print(f"  기존 데이터 재사용: {run_dir}")
+        return
+    run_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "app.init_sample_data", "--synthetic", str(size),
+         "--seed", str(seed), "--history-days", str(history_days)],
+        cwd=run_dir, env=env, check=True, stdout=subprocess.DEVNULL,
+    )
+    print(f"  합성 데이터 {size:,}개 생성 ({time.perf_counter() - start:.1f}초)")
+
+
+def start_server(run_dir: Path, port: int, env: dict, timeout: float = 300) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=run_dir, env=env,
+    )
+    client = Client(f"http://127.0.0.1:{port}")
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("서버가 시작되지 않았습니다.")
+        try:
+            client.get_json("/metrics")
+            return server
+        except (RuntimeError, OSError, http.client.HTTPException):
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError("서버 시작 대기 시간을 초과했습니다.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="백엔드 API 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 ETF 개수 목록")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=500, help="엔드포인트별 요청 수")
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), help="측정할 엔드포인트 (기본: 전체)")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (지정하면 데이터 생성/서버 실행 생략)")
+    parser.add_argument("--workdir", type=Path, default=BACKEND_DIR / "bench_runs", help="합성 데이터 디렉토리")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history-days", type=int, default=BENCH_HISTORY_DAYS)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = {"concurrency": args.concurrency, "requests": args.requests, "runs": {}}
+    if args.url:
+        print(f"[{args.url}]")
+        report["runs"]["server"] = benchmark_server(args.url, args.requests, args.concurrency, args.endpoints)
+    else:
+        for size in args.sizes:
+            print(f"[{size:,} ETFs]")
+            run_dir = args.workdir / str(size)
+            env = {
+                **os.environ,
+                "PYTHONPATH": os.pathsep.join(filter(None, [str(BACKEND_DIR), os.environ.get("PYTHONPATH")])),
+                "ETF_PRICE_HISTORY_DIR": str(run_dir / "price_history"),
+            }
+            prepare_data(run_dir, size, args.seed, args.history_days, env)
+            server = start_server(run_dir, args.port, env)
+            try:
+                report["runs"][str(size)] = benchmark_server(
+                    f"http://127.0.0.1:{args.port}", args.requests, args.concurrency, args.endpoints
+                )
+            finally:
+                server.terminate()
+                server.wait()
+            print(f"  최대 RSS: {report['runs'][str(size)]['process']['peak_rss_mb']} MB")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""대용량 데이터 적재 CLI
+
+사용 예:
+    python -m app.ingest etfs data/etfs.csv
+    python -m app.ingest dividends data/dividends.jsonl --batch-size 2000
+    python -m app.ingest prices data/prices.csv
+"""
+
+import argparse
+import sys
+
+from app.database import SessionLocal, Base, engine
+from app.services.ingest import BATCH_SIZE, FORMATS, KINDS, IngestError, detect_format, ingest
+from app.services.price_history import PriceHistoryStore
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV/JSONL 파일을 DB/가격 히스토리에 적재합니다.")
+    parser.add_argument("kind", choices=KINDS, help="적재할 데이터 종류")
+    parser.add_argument("path", help="입력 파일 경로 (.csv/.jsonl)")
+    parser.add_argument("--format", choices=FORMATS, help="입력 형식 (기본: 확장자로 추정)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=f"배치 크기 (기본 {BATCH_SIZE})")
+    args = parser.parse_args(argv)
+
+    Base.metadata.create_all(bind=engine)
+    fmt = args.format or detect_format(args.path)
+    store = PriceHistoryStore.load() if args.kind == "prices" else None
+
+    def report(result):
+        print(f"\r{result.rows:,}행 적재 ({result.rows_per_sec:,.0f} rows/sec)", end="", flush=True)
+
+    db = SessionLocal()
+    try:
+        with open(args.path, newline="", encoding="utf-8") as stream:
+            result = ingest(db, stream, fmt, args.kind, args.batch_size, store=store, progress=report)
+    except IngestError as e:
+        print(f"\n에러 발생: {e} (이미 커밋된 행 {e.result.rows:,}개)")
+        return 1
+    except ValueError as e:
+        print(f"\n에러 발생: {e}")
+        return 1
+    finally:
+        db.close()
+
+    print(f"\n{args.kind} 적재 완료: {result.rows:,}행, {result.seconds:.2f}초, "
+          f"{result.rows_per_sec:,.0f} rows/sec (건너뜀 {result.skipped:,}행)")
+    for row in result.skipped_rows[:10]:
+        print(f"  건너뜀: {row['ticker']} {row['date']} - {row['reason']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
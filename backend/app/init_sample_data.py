@@ -1,11 +1,113 @@
 """샘플 데이터 초기화 스크립트"""
 
+import argparse
+import zlib
 from datetime import date, timedelta
+
+import numpy as np
+
+from sqlalchemy import insert
+
 from app.database import SessionLocal, Base, engine
 from app.models import ETF, Portfolio, Dividend
+from app.services.ingest import batched, parse_etf, upsert_etfs
+from app.services.price_history import PriceHistoryStore
+from app.services.returns import DEFAULT_PERIODS
+
+# 샘플 가격 히스토리 길이 (영업일 기준 약 3년, 3y 수익률의 기준 종가까지 포함)
+PRICE_HISTORY_DAYS = max(DEFAULT_PERIODS.values()) + 1
+
+# 수익률 필드별 기준 시점 (영업일 전)
+SAMPLE_RETURN_OFFSETS = {"return_1w": 5, "return_1m": 21, "return_1y": 252}
+
+# 합성 데이터의 보유 종목 수 (ETF당)
+SYNTHETIC_HOLDINGS = 10
+
+
+def generate_price_history(etf_data, end_date, days=PRICE_HISTORY_DAYS):
+    """현재가/전일가/수익률 필드와 일치하는 샘플 일봉 OHLCV 생성
+
+    각 기준 시점의 가격을 수익률에서 역산한 뒤, 기준점 사이를 브라운 브리지로
+    채워서 임의의 경로이면서도 기간 수익률은 원래 값과 같아지도록 합니다.
+    """
+    rng = np.random.default_rng(zlib.crc32(etf_data["ticker"].encode()))
+    daily_vol = 0.01
+    current = etf_data["current_price"]
+
+    # 기준점: {영업일 전: 종가}
+    anchors = {0: current, 1: etf_data["previous_price"]}
+    for field, offset in SAMPLE_RETURN_OFFSETS.items():
+        anchors[offset] = current / (1 + etf_data[field] / 100)
+
+    # 영업일 전(ago) 기준 로그 종가
+    log_close = np.empty(days)
+    log_close[0] = np.log(current)
+    offsets = sorted(anchors)
+    for a, b in zip(offsets, offsets[1:]):
+        walk = np.cumsum(rng.normal(0, daily_vol, b - a))
+        t = np.arange(1, b - a + 1) / (b - a)
+        start, stop = np.log(anchors[a]), np.log(anchors[b])
+        log_close[a + 1:b + 1] = start + t * (stop - start) + walk - t * walk[-1]
+    last = offsets[-1]
+    log_close[last + 1:] = log_close[last] + np.cumsum(rng.normal(0, daily_vol, days - 1 - last))
+
+    closes = np.exp(log_close[::-1])
+    opens = np.empty(days)
+    opens[0] = closes[0]
+    opens[1:] = closes[:-1] * (1 + rng.normal(0, daily_vol / 4, days - 1))
+    highs = np.maximum(opens, closes) * (1 + np.abs(rng.normal(0, daily_vol / 2, days)))
+    lows = np.minimum(opens, closes) * (1 - np.abs(rng.normal(0, daily_vol / 2, days)))
+    volumes = (etf_data["volume"] * rng.lognormal(0, 0.3, days)).astype(np.int64)
+    dates = np.busday_offset(np.datetime64(end_date, "D"), -np.arange(days)[::-1], roll="backward")
 
+    return {"date": dates, "open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes}
 
-def init_sample_data():
+
+def generate_synthetic_etfs(templates, count, seed=0):
+    """벤치마크용 합성 ETF count개 생성
+
+    샘플 ETF를 템플릿으로 순환하며 가격/배당률/수익률에 잡음을 섞고,
+    보유 종목은 공유 종목 풀에서 뽑아 ETF 간 중복이 생기도록 합니다.
+    """
+    rng = np.random.default_rng(seed)
+    pool_size = max(500, count // 2)
+    # 앞쪽 종목일수록 자주 뽑히도록 (대형주 편중)
+    popularity = 1.0 / np.arange(1, pool_size + 1)
+    popularity /= popularity.sum()
+
+    etfs = []
+    for i in range(count):
+        template = templates[i % len(templates)]
+        noise = rng.normal(0, 0.1, 8)
+        price = round(template["current_price"] * float(np.exp(noise[0])), -1)
+        securities = rng.choice(pool_size, size=SYNTHETIC_HOLDINGS, replace=False, p=popularity)
+        weights = np.sort(rng.uniform(1, 10, SYNTHETIC_HOLDINGS))[::-1]
+        etfs.append({
+            **template,
+            "ticker": f"S{i:06d}",
+            "name": f"{template['name']} #{i}",
+            "current_price": price,
+            "previous_price": round(price / (1 + template["return_1d"] / 100 + noise[1] / 100), 2),
+            "dividend_yield": round(max(template["dividend_yield"] * (1 + noise[2]), 0.1), 2),
+            "aum": round(template["aum"] * float(np.exp(noise[3])), 1),
+            "volume": int(template["volume"] * np.exp(noise[4])),
+            "return_1d": round(template["return_1d"] + noise[1], 2),
+            "return_1w": round(template["return_1w"] + noise[5], 2),
+            "return_1m": round(template["return_1m"] + noise[6] * 3, 2),
+            "return_1y": round(template["return_1y"] + noise[7] * 10, 2),
+            "top_holdings": [
+                {"name": f"Synthetic Security {security:06d}", "weight": round(float(weight), 2)}
+                for security, weight in zip(securities, weights)
+            ],
+        })
+    return etfs
+
+
+def init_sample_data(synthetic=None, seed=0, history_days=PRICE_HISTORY_DAYS):
+    """샘플 데이터 초기화
+
+    synthetic=N이면 샘플 ETF를 템플릿으로 N개의 합성 ETF(보유 종목, 배당 일정 포함)를 만듭니다.
+    """
     # 테이블 생성
     print("데이터베이스 테이블 생성 중...")
     Base.metadata.create_all(bind=engine)
@@ -121,61 +223,74 @@ def init_sample_data():
             {"ticker": "IDHD", "name": "Invesco S&P International Developed High Dividend Low Volatility ETF", "current_price": 28000, "previous_price": 27900, "dividend_yield": 5.5, "expense_ratio": 0.30, "aum": 520, "volume": 58000, "sector": "Diversified", "region": "International", "return_1d": 0.36, "return_1w": 0.8, "return_1m": 2.3, "return_1y": 8.5},
         ]
 
-        # ETF 데이터 추가
-        etfs = []
-        for etf_data in sample_etfs:
-            etf = ETF(**etf_data)
-            db.add(etf)
-            etfs.append(etf)
+        if synthetic:
+            sample_etfs = generate_synthetic_etfs(sample_etfs, synthetic, seed)
 
+        # ETF 데이터 추가 (ticker 기준 bulk upsert, RETURNING으로 ID 확보)
+        # 수익률 필드는 저장하지 않고 가격 히스토리 생성에만 사용
+        etf_ids = {}
+        for batch in batched(map(parse_etf, sample_etfs), 500):
+            etf_ids.update(upsert_etfs(db, batch))
         db.commit()
-
-        # ETF ID 갱신
-        for etf in etfs:
-            db.refresh(etf)
+        etfs = [{**etf_data, "id": etf_ids[etf_data["ticker"]]} for etf_data in sample_etfs]
 
         print(f"{len(etfs)}개의 ETF 데이터 생성 완료")
 
+        # 샘플 가격 히스토리 (backend/price_history/)
+        today = date.today()
+        price_store = PriceHistoryStore()
+        for etf_data in sample_etfs:
+            price_store.extend(etf_data["ticker"], generate_price_history(etf_data, today, history_days))
+        price_store.save()
+        print(f"{len(sample_etfs)}개 ETF의 가격 히스토리 생성 완료 ({history_days}일)")
+
         # 샘플 포트폴리오 데이터 (처음 5개 ETF만 보유)
         sample_portfolios = [
-            {"etf_id": etfs[0].id, "shares": 10, "avg_price": 82000, "total_invested": 820000},
-            {"etf_id": etfs[1].id, "shares": 15, "avg_price": 60000, "total_invested": 900000},
-            {"etf_id": etfs[2].id, "shares": 50, "avg_price": 20500, "total_invested": 1025000},
-            {"etf_id": etfs[3].id, "shares": 8, "avg_price": 128000, "total_invested": 1024000},
-            {"etf_id": etfs[4].id, "shares": 20, "avg_price": 44000, "total_invested": 880000},
+            {"etf_id": etfs[0]["id"], "shares": 10, "avg_price": 82000, "total_invested": 820000},
+            {"etf_id": etfs[1]["id"], "shares": 15, "avg_price": 60000, "total_invested": 900000},
+            {"etf_id": etfs[2]["id"], "shares": 50, "avg_price": 20500, "total_invested": 1025000},
+            {"etf_id": etfs[3]["id"], "shares": 8, "avg_price": 128000, "total_invested": 1024000},
+            {"etf_id": etfs[4]["id"], "shares": 20, "avg_price": 44000, "total_invested": 880000},
         ]
 
-        for portfolio_data in sample_portfolios:
-            portfolio = Portfolio(**portfolio_data)
-            db.add(portfolio)
+        if synthetic:
+            # 합성 데이터는 ETF 100개당 1개 보유
+            rng = np.random.default_rng(seed)
+            sample_portfolios = []
+            for etf in etfs[:max(5, len(etfs) // 100)]:
+                shares = int(rng.integers(1, 100))
+                avg_price = round(etf["current_price"] * float(rng.uniform(0.8, 1.2)), -1)
+                sample_portfolios.append({
+                    "etf_id": etf["id"], "shares": shares,
+                    "avg_price": avg_price, "total_invested": shares * avg_price,
+                })
 
+        db.execute(insert(Portfolio), sample_portfolios)
         db.commit()
         print(f"{len(sample_portfolios)}개의 포트폴리오 데이터 생성 완료")
 
         # 샘플 배당 일정 데이터
-        today = date.today()
         sample_dividends = []
 
-        for i, etf in enumerate(etfs[:5]):
+        # 합성 데이터는 모든 ETF에 배당 일정 생성
+        for i, etf in enumerate(etfs if synthetic else etfs[:5]):
             # 각 ETF당 2-3개의 배당 일정 생성
             dividend_dates = [
-                today + timedelta(days=10 + i * 7),
-                today + timedelta(days=40 + i * 7),
-                today + timedelta(days=70 + i * 7),
+                today + timedelta(days=10 + i % 5 * 7),
+                today + timedelta(days=40 + i % 5 * 7),
+                today + timedelta(days=70 + i % 5 * 7),
             ]
 
             for ex_date in dividend_dates:
-                payment_date = ex_date + timedelta(days=14)
-                dividend = Dividend(
-                    etf_id=etf.id,
-                    ex_dividend_date=ex_date,
-                    payment_date=payment_date,
-                    dividend_per_share=etf.current_price * etf.dividend_yield / 100 / 12,
-                    frequency="monthly" if etf.dividend_yield > 5 else "quarterly",
-                )
-                sample_dividends.append(dividend)
-                db.add(dividend)
+                sample_dividends.append({
+                    "etf_id": etf["id"],
+                    "ex_dividend_date": ex_date,
+                    "payment_date": ex_date + timedelta(days=14),
+                    "dividend_per_share": etf["current_price"] * etf["dividend_yield"] / 100 / 12,
+                    "frequency": "monthly" if etf["dividend_yield"] > 5 else "quarterly",
+                })
 
+        db.execute(insert(Dividend), sample_dividends)
         db.commit()
         print(f"{len(sample_dividends)}개의 배당 일정 데이터 생성 완료")
 
@@ -189,4 +304,12 @@ def init_sample_data():
 
 
 if __name__ == "__main__":
-    init_sample_data()
+    parser = argparse.ArgumentParser(description="샘플 데이터를 생성합니다.")
+    parser.add_argument("--synthetic", type=int, help="합성 ETF 개수 (벤치마크용, 예: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--history-days", type=int, default=PRICE_HISTORY_DAYS,
+                        help=f"가격 히스토리 길이 (영업일, 기본 {PRICE_HISTORY_DAYS})")
+    args = parser.parse_args()
+    if args.history_days <= max(SAMPLE_RETURN_OFFSETS.values()):
+        parser.error(f"--history-days는 {max(SAMPLE_RETURN_OFFSETS.values())}보다 커야 합니다.")
+    init_sample_data(args.synthetic, args.seed, args.history_days)
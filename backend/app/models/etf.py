@@ -15,14 +15,8 @@ class ETF(Base):
     expense_ratio = Column(Float)  # 비용 비율 (%)
     aum = Column(Float)  # 운용자산 (억원)
     volume = Column(Integer)  # 거래량
-    sector = Column(String)  # 섹터
-    region = Column(String)  # 지역
-
-    # 수익률
-    return_1d = Column(Float)  # 일간 수익률 (%)
-    return_1w = Column(Float)  # 주간 수익률 (%)
-    return_1m = Column(Float)  # 월간 수익률 (%)
-    return_1y = Column(Float)  # 연간 수익률 (%)
+    sector = Column(String, index=True)  # 섹터
+    region = Column(String, index=True)  # 지역
 
     # 상세 정보
     investment_strategy = Column(Text)  # 투자 전략 설명
@@ -30,3 +24,4 @@ class ETF(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
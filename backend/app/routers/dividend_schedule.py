@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date
+from typing import List, Optional
+
+from app.schemas.dividend_schedule import DividendForecast, DividendScheduleItem, MonthlyCashFlow
+from app.services.aggregates import Aggregates, get_aggregates
+from app.services.dividend_schedule import DividendSchedule, ScheduleEntry, get_dividend_schedule
+
+router = APIRouter(prefix="/api/dividends", tags=["dividends"])
+
+
+def _items(schedule: DividendSchedule, entries: List[ScheduleEntry]) -> List[DividendScheduleItem]:
+    items = []
+    for entry in entries:
+        etf = schedule.etfs.get(entry.etf_id)
+        if etf is None:
+            continue
+        items.append(DividendScheduleItem(
+            id=None if entry.projected else entry.source_id,
+            source_id=entry.source_id,
+            ticker=etf["ticker"],
+            name=etf["name"],
+            ex_dividend_date=entry.ex_dividend_date,
+            payment_date=entry.payment_date,
+            dividend_per_share=entry.dividend_per_share,
+            frequency=entry.frequency,
+            dividend_yield=etf["dividend_yield"],
+            projected=entry.projected,
+        ))
+    return items
+
+
+@router.get("/calendar", response_model=List[DividendScheduleItem])
+def get_dividend_calendar(
+    year: Optional[int] = Query(None, ge=1900, le=2100),
+    month: Optional[int] = Query(None, ge=1, le=12),
+    schedule: DividendSchedule = Depends(get_dividend_schedule),
+):
+    """월별 배당 캘린더 (실제 기록 + 주기 예측, 기본값: 이번 달)"""
+    today = date.today()
+    try:
+        entries = schedule.month(year or today.year, month or today.month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _items(schedule, entries)
+
+
+@router.get("/upcoming", response_model=List[DividendScheduleItem])
+def get_upcoming_dividends(
+    days: int = Query(30, ge=1, le=3660),
+    schedule: DividendSchedule = Depends(get_dividend_schedule),
+):
+    """오늘부터 N일 이내 배당 일정"""
+    return _items(schedule, schedule.upcoming(days))
+
+
+@router.get("/forecast", response_model=DividendForecast)
+def get_dividend_forecast(
+    months: int = Query(12, ge=1, le=120),
+    schedule: DividendSchedule = Depends(get_dividend_schedule),
+    aggregates: Aggregates = Depends(get_aggregates),
+):
+    """보유 포트폴리오의 월별 배당 현금흐름 예측"""
+    with aggregates.lock:
+        shares = aggregates.portfolio.shares()
+    monthly, _ = schedule.forecast(shares, months)
+    total = sum(bucket["amount"] for bucket in monthly)
+    return DividendForecast(
+        months=[MonthlyCashFlow(month=b["month"], amount=round(b["amount"], 2), payments=b["payments"])
+                for b in monthly],
+        total=round(total, 2),
+        monthly_average=round(total / months, 2),
+    )
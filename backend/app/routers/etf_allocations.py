@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import JSONResponse
+
+from app.services.aggregates import Aggregates, get_aggregates
+
+router = APIRouter(prefix="/api/etfs", tags=["etfs"])
+
+
+def conditional_response(request: Request, etag: str, content) -> Response:
+    """If-None-Match가 현재 ETag와 같으면 304, 아니면 ETag를 붙인 JSON 응답"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=content, headers=headers)
+
+
+@router.get("/sector/allocation")
+def get_sector_allocation(request: Request, aggregates: Aggregates = Depends(get_aggregates)):
+    """섹터별 ETF 개수"""
+    with aggregates.lock:
+        etag, content = aggregates.sectors.etag, aggregates.sectors.snapshot()
+    return conditional_response(request, etag, content)
+
+
+@router.get("/region/allocation")
+def get_region_allocation(request: Request, aggregates: Aggregates = Depends(get_aggregates)):
+    """지역별 ETF 개수"""
+    with aggregates.lock:
+        etag, content = aggregates.regions.etag, aggregates.regions.snapshot()
+    return conditional_response(request, etag, content)
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import Optional, List, Dict
+
+from app.database import get_db
+from app.models.etf import ETF
+from app.schemas.etf import PriceHistory
+from app.services.price_history import PriceHistoryStore, get_price_store
+
+router = APIRouter(prefix="/api/etfs", tags=["etfs"])
+
+
+@router.get("/history/sparklines", response_model=Dict[str, List[float]])
+def get_sparklines(
+    points: int = Query(7, ge=2, le=60, description="티커당 종가 포인트 수"),
+    tickers: Optional[str] = Query(None, description="쉼표로 구분된 티커 목록 (없으면 전체)"),
+    store: PriceHistoryStore = Depends(get_price_store),
+):
+    """테이블 미니 차트용 최근 종가 (여러 ETF를 한 번에 조회)"""
+    requested = tickers.split(",") if tickers else store.tickers()
+    sparklines = {}
+    for ticker in requested:
+        ticker = ticker.strip().upper()
+        if ticker not in store:
+            continue
+        series = store.series(ticker)
+        # 최근 points개 종가만 뷰로 잘라서 사용
+        closes = series.columns["close"][max(series.size - points, 0):series.size]
+        sparklines[ticker] = closes.tolist()
+    return sparklines
+
+
+@router.get("/{etf_id}/history", response_model=PriceHistory)
+def get_price_history(
+    etf_id: int,
+    start: Optional[date] = Query(None, description="시작일 (포함)"),
+    end: Optional[date] = Query(None, description="종료일 (포함)"),
+    points: Optional[int] = Query(None, ge=2, le=5000, description="다운샘플링할 포인트 수 (없으면 전체 해상도)"),
+    db: Session = Depends(get_db),
+    store: PriceHistoryStore = Depends(get_price_store),
+):
+    """ETF 일봉 가격 히스토리"""
+    ticker = db.query(ETF.ticker).filter(ETF.id == etf_id).scalar()
+    if ticker is None:
+        raise HTTPException(status_code=404, detail="ETF not found")
+    if ticker not in store:
+        raise HTTPException(status_code=404, detail="Price history not found")
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    bars = store.slice(ticker, start, end, points)
+    return PriceHistory(
+        ticker=ticker,
+        dates=bars["date"].tolist(),
+        open=bars["open"].tolist(),
+        high=bars["high"].tolist(),
+        low=bars["low"].tolist(),
+        close=bars["close"].tolist(),
+        volume=bars["volume"].tolist(),
+    )
@@ -0,0 +1,170 @@
+import base64
+import json
+from typing import Optional, List
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.etf import ETF
+from app.schemas.etf import RETURN_FIELDS
+from app.services.returns import ReturnEngine, get_return_engine
+
+router = APIRouter(prefix="/api/etfs", tags=["etfs"])
+
+# 목록에서 선택할 수 있는 DB 컬럼
+COLUMNS = {
+    column.key: column
+    for column in (
+        ETF.id, ETF.ticker, ETF.name, ETF.current_price, ETF.previous_price,
+        ETF.dividend_yield, ETF.expense_ratio, ETF.aum, ETF.volume, ETF.sector,
+        ETF.region, ETF.investment_strategy, ETF.top_holdings, ETF.created_at, ETF.updated_at,
+    )
+}
+
+# fields를 지정하지 않으면 제외하는 무거운 컬럼 (상세 조회 GET /api/etfs/{etf_id} 에서 제공)
+HEAVY_FIELDS = {"investment_strategy", "top_holdings"}
+
+DEFAULT_FIELDS = [name for name in COLUMNS if name not in HEAVY_FIELDS] + list(RETURN_FIELDS)
+
+SORTABLE = set(COLUMNS) - HEAVY_FIELDS - {"created_at", "updated_at"} | set(RETURN_FIELDS)
+
+
+def _encode_cursor(value, row_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([value, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return value, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()] if value else []
+
+
+@router.get("/")
+def list_etfs(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (없으면 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    sort: str = Query("id", description="정렬 필드"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    sector: Optional[str] = Query(None, description="섹터 (쉼표로 여러 개)"),
+    region: Optional[str] = Query(None, description="지역 (쉼표로 여러 개)"),
+    q: Optional[str] = Query(None, description="티커/이름 검색어"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표로 구분, 없으면 투자전략/보유종목 제외 전체)"),
+    db: Session = Depends(get_db),
+    engine: ReturnEngine = Depends(get_return_engine),
+):
+    """ETF 목록 (keyset 페이지네이션, 필터, 정렬, 필드 선택)
+
+    다음 페이지 커서는 X-Next-Cursor, 필터 적용 후 전체 개수는 X-Total-Count 헤더로 반환합니다.
+    """
+    output = _split(fields) or DEFAULT_FIELDS
+    unknown = [f for f in output if f not in COLUMNS and f not in RETURN_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field: {', '.join(unknown)}")
+    if sort not in SORTABLE:
+        raise HTTPException(status_code=400, detail=f"Cannot sort by: {sort}")
+
+    filters = []
+    if sector:
+        filters.append(ETF.sector.in_(_split(sector)))
+    if region:
+        filters.append(ETF.region.in_(_split(region)))
+    if q:
+        pattern = f"%{q}%"
+        filters.append(or_(ETF.ticker.ilike(pattern), ETF.name.ilike(pattern)))
+
+    response.headers["X-Total-Count"] = str(
+        db.execute(select(func.count(ETF.id)).where(*filters)).scalar_one()
+    )
+
+    # SQL에서는 요청된 컬럼(+ id/ticker/정렬 컬럼)만 조회
+    selected = {"id", "ticker"} | {f for f in output if f in COLUMNS}
+    descending = order == "desc"
+
+    if sort in RETURN_FIELDS:
+        rows, next_cursor = _page_by_return(db, engine, filters, selected, RETURN_FIELDS[sort],
+                                            descending, limit, cursor)
+    else:
+        rows, next_cursor = _page_by_column(db, filters, selected | {sort}, sort,
+                                            descending, limit, cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    returns = {
+        f: engine.lookup([row["ticker"] for row in rows], period)
+        for f, period in RETURN_FIELDS.items() if f in output
+    }
+    items = []
+    for i, row in enumerate(rows):
+        item = {f: row[f] for f in output if f in COLUMNS}
+        for f, values in returns.items():
+            item[f] = None if np.isnan(values[i]) else round(float(values[i]), 2)
+        items.append(item)
+    return jsonable_encoder(items)
+
+
+def _page_by_column(db, filters, selected, sort, descending, limit, cursor):
+    column = COLUMNS[sort]
+    stmt = select(*[COLUMNS[name] for name in selected]).where(*filters)
+    # 값이 NULL인 ETF는 정렬 방향과 관계없이 항상 마지막 (커서 값 null = NULL 구간)
+    if cursor:
+        value, last_id = _decode_cursor(cursor)
+        id_after = ETF.id < last_id if descending else ETF.id > last_id
+        if value is None:
+            stmt = stmt.where(column.is_(None), id_after)
+        else:
+            value_after = column < value if descending else column > value
+            stmt = stmt.where(or_(value_after, and_(column == value, id_after), column.is_(None)))
+    if descending:
+        stmt = stmt.order_by(column.desc().nulls_last(), ETF.id.desc())
+    else:
+        stmt = stmt.order_by(column.asc().nulls_last(), ETF.id.asc())
+    if limit:
+        stmt = stmt.limit(limit + 1)
+
+    rows = [dict(row) for row in db.execute(stmt).mappings()]
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(jsonable_encoder(rows[-1][sort]), rows[-1]["id"])
+    return rows, next_cursor
+
+
+def _page_by_return(db, engine, filters, selected, period, descending, limit, cursor):
+    # 수익률은 DB 컬럼이 아니므로 (id, ticker)만 읽어 엔진 값으로 정렬한 뒤 해당 페이지만 조회
+    keys = db.execute(select(ETF.id, ETF.ticker).where(*filters)).all()
+    ids = np.array([row.id for row in keys], dtype=np.int64)
+    values = engine.lookup([row.ticker for row in keys], period)
+    # 수익률이 없는 ETF는 항상 마지막
+    values = np.where(np.isnan(values), -np.inf if descending else np.inf, values)
+    sign = -1 if descending else 1
+
+    if cursor:
+        value, last_id = _decode_cursor(cursor)
+        value = float(value)
+        after = (sign * values > sign * value) | ((values == value) & (sign * ids > sign * last_id))
+        ids, values = ids[after], values[after]
+
+    order = np.lexsort((sign * ids, sign * values))
+    if limit:
+        order = order[:limit + 1]
+    page_ids = ids[order].tolist()
+
+    next_cursor = None
+    if limit and len(page_ids) > limit:
+        page_ids = page_ids[:limit]
+        next_cursor = _encode_cursor(float(values[order[limit - 1]]), page_ids[-1])
+
+    stmt = select(*[COLUMNS[name] for name in selected]).where(ETF.id.in_(page_ids))
+    by_id = {row["id"]: dict(row) for row in db.execute(stmt).mappings()}
+    return [by_id[i] for i in page_ids], next_cursor
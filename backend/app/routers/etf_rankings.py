@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Optional, List
+
+from app.routers.etf_returns import validate_periods
+from app.schemas.etf import ETFRanking
+from app.services.rankings import DIVIDEND, RankingIndex, get_ranking_index
+from app.services.returns import ReturnEngine, get_return_engine
+
+router = APIRouter(prefix="/api/etfs", tags=["etfs"])
+
+
+@router.get("/ranking/return/{period}", response_model=List[ETFRanking])
+def get_return_ranking(
+    period: str,
+    limit: int = Query(10, ge=1, le=100),
+    sector: Optional[str] = Query(None, description="섹터 필터"),
+    region: Optional[str] = Query(None, description="지역 필터"),
+    engine: ReturnEngine = Depends(get_return_engine),
+    index: RankingIndex = Depends(get_ranking_index),
+):
+    """기간 수익률 랭킹 (1d/1w/1m/3m/1y/3y/ytd)"""
+    validate_periods(engine, [period])
+    return [
+        ETFRanking(
+            ticker=ticker,
+            name=meta["name"],
+            return_value=round(value, 2),
+            dividend_yield=meta["dividend_yield"],
+        )
+        for ticker, value, meta in index.top(period, limit, sector, region)
+    ]
+
+
+@router.get("/ranking/dividend", response_model=List[ETFRanking])
+def get_dividend_ranking(
+    limit: int = Query(10, ge=1, le=100),
+    sector: Optional[str] = Query(None, description="섹터 필터"),
+    region: Optional[str] = Query(None, description="지역 필터"),
+    index: RankingIndex = Depends(get_ranking_index),
+):
+    """배당 수익률 랭킹"""
+    return [
+        ETFRanking(
+            ticker=ticker,
+            name=meta["name"],
+            return_value=value,
+            dividend_yield=value,
+        )
+        for ticker, value, meta in index.top(DIVIDEND, limit, sector, region)
+    ]
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, List
+import warnings
+
+import numpy as np
+
+from app.schemas.etf import ReturnTable
+from app.services.returns import ReturnEngine, get_return_engine
+
+router = APIRouter(prefix="/api/etfs", tags=["etfs"])
+
+
+def validate_periods(engine: ReturnEngine, periods: List[str]):
+    unknown = [p for p in periods if p not in engine.periods]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown period: {', '.join(unknown)} (available: {', '.join(engine.periods)})",
+        )
+
+
+def _to_float(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+@router.get("/returns", response_model=ReturnTable)
+def get_returns(
+    tickers: str = Query(..., description="쉼표로 구분된 티커 목록"),
+    periods: Optional[str] = Query(None, description="쉼표로 구분된 기간 (없으면 전체)"),
+    engine: ReturnEngine = Depends(get_return_engine),
+):
+    """선택한 ETF들의 기간별 수익률과 평균 (성과 비교용)"""
+    period_list = [p.strip() for p in periods.split(",") if p.strip()] if periods else []
+    period_list = period_list or engine.periods
+    validate_periods(engine, period_list)
+
+    found, table = engine.table([t.strip().upper() for t in tickers.split(",")], period_list)
+    with warnings.catch_warnings():
+        # 모든 값이 NaN인 기간은 평균도 NaN (경고 무시)
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        average = np.nanmean(table, axis=0) if len(found) else np.full(len(period_list), np.nan)
+    return ReturnTable(
+        periods=period_list,
+        returns={
+            ticker: {p: _to_float(v) for p, v in zip(period_list, row)}
+            for ticker, row in zip(found, table)
+        },
+        average={p: _to_float(v) for p, v in zip(period_list, average)},
+    )
+
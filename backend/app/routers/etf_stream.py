@@ -0,0 +1,94 @@
+import asyncio
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.schemas.etf import PriceTick
+from app.services.ticks import start_tick_stream
+
+router = APIRouter(prefix="/api/etfs", tags=["etfs"])
+
+# SSE 연결 유지용 주석 전송 간격 (초)
+_KEEPALIVE = 15.0
+
+
+def _parse_tickers(tickers: Optional[str]) -> Optional[List[str]]:
+    if not tickers:
+        return None
+    return [t.strip().upper() for t in tickers.split(",") if t.strip()]
+
+
+@router.post("/ticks")
+async def post_ticks(ticks: List[PriceTick]):
+    """외부 시세 피드 수신 (다음 flush 때 티커별 최신 가격만 반영)"""
+    stream = await start_tick_stream()
+    for tick in ticks:
+        stream.submit(tick.ticker, tick.price)
+    return {"accepted": len(ticks)}
+
+
+@router.get("/stream")
+async def stream_prices(
+    request: Request,
+    tickers: Optional[str] = Query(None, description="쉼표로 구분된 구독 티커 (없으면 전체)"),
+):
+    """실시간 시세 변경분 (Server-Sent Events, flush마다 prices 이벤트 1개)"""
+    stream = await start_tick_stream()
+    subscription = stream.subscribe(_parse_tickers(tickers))
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    deltas = await asyncio.wait_for(subscription.queue.get(), timeout=_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: prices\ndata: {json.dumps(deltas)}\n\n"
+        finally:
+            stream.unsubscribe(subscription)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.websocket("/stream/ws")
+async def stream_prices_ws(websocket: WebSocket, tickers: Optional[str] = None):
+    """실시간 시세 변경분 (WebSocket)
+
+    클라이언트는 {"action": "subscribe" | "unsubscribe", "tickers": [...]}로 구독 티커를 바꿀 수 있습니다.
+    """
+    await websocket.accept()
+    stream = await start_tick_stream()
+    subscription = stream.subscribe(_parse_tickers(tickers))
+
+    async def receive():
+        while True:
+            message = await websocket.receive_json()
+            names = message.get("tickers") or []
+            if message.get("action") == "subscribe":
+                if subscription.tickers is None:
+                    # 전체 구독 중이면 지정한 티커만 받도록 전환
+                    subscription.tickers = set()
+                subscription.subscribe(names)
+            elif message.get("action") == "unsubscribe":
+                subscription.unsubscribe(names)
+
+    async def send():
+        while True:
+            deltas = await subscription.queue.get()
+            await websocket.send_json({"type": "prices", "data": deltas})
+
+    tasks = [asyncio.create_task(receive()), asyncio.create_task(send())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+        stream.unsubscribe(subscription)
@@ -0,0 +1,100 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional, List
+
+import numpy as np
+
+from app.database import get_db
+from app.models import ETF, Portfolio
+from app.schemas.holdings import CommonHolding, Exposure, HoldingsOverlap, Security, SecurityHolder
+from app.services.holdings_index import HoldingsIndex, get_holdings_index
+
+router = APIRouter(prefix="/api/holdings", tags=["holdings"])
+
+
+@router.get("/securities", response_model=List[Security])
+def search_securities(
+    q: str = Query(..., min_length=1, description="종목명 검색어"),
+    limit: int = Query(20, ge=1, le=100),
+    index: HoldingsIndex = Depends(get_holdings_index),
+):
+    """보유 종목 검색 (보유 ETF가 많은 순)"""
+    return [
+        Security(id=security_id, name=name, etf_count=count)
+        for security_id, name, count in index.search(q, limit)
+    ]
+
+
+@router.get("/holders", response_model=List[SecurityHolder])
+def get_holders(
+    name: str = Query(..., min_length=1, description="종목명 (부분 일치)"),
+    limit: int = Query(50, ge=1, le=500),
+    index: HoldingsIndex = Depends(get_holdings_index),
+):
+    """종목을 보유한 ETF와 비중 (예: NVIDIA를 보유한 ETF)"""
+    security_ids = [security_id for security_id, _, _ in index.search(name, limit=100)]
+    return [
+        SecurityHolder(ticker=ticker, security=index.security_name(security_id), weight=weight)
+        for ticker, security_id, weight in index.holders(security_ids)[:limit]
+    ]
+
+
+@router.get("/overlap", response_model=HoldingsOverlap)
+def get_overlap(
+    a: str = Query(..., description="첫 번째 ETF 티커"),
+    b: str = Query(..., description="두 번째 ETF 티커"),
+    index: HoldingsIndex = Depends(get_holdings_index),
+):
+    """두 ETF의 보유 종목 중복도"""
+    a, b = a.upper(), b.upper()
+    missing = [t for t in (a, b) if not index.holdings(t)]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Holdings not found: {', '.join(missing)}")
+
+    overlap, common = index.overlap(a, b)
+    return HoldingsOverlap(
+        ticker_a=a,
+        ticker_b=b,
+        overlap=round(overlap, 2),
+        common=[
+            CommonHolding(name=index.security_name(security_id), weight_a=weight_a, weight_b=weight_b)
+            for security_id, weight_a, weight_b in common
+        ],
+    )
+
+
+@router.get("/exposure", response_model=List[Exposure])
+def get_exposure(
+    tickers: Optional[str] = Query(None, description="쉼표로 구분된 티커 (없으면 보유 포트폴리오)"),
+    weights: Optional[str] = Query(None, description="tickers와 같은 순서의 비중 (없으면 동일 비중)"),
+    limit: int = Query(20, ge=1, le=500),
+    db: Session = Depends(get_db),
+    index: HoldingsIndex = Depends(get_holdings_index),
+):
+    """포트폴리오 룩스루 종목 노출 (보유 ETF를 통한 개별 종목 비중)"""
+    if tickers:
+        names = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+        try:
+            values = [float(w) for w in weights.split(",")] if weights else [1.0] * len(names)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="weights must be numbers")
+        if len(values) != len(names):
+            raise HTTPException(status_code=400, detail="tickers and weights must have the same length")
+    else:
+        # 보유 포트폴리오의 평가금액 비중
+        rows = db.query(ETF.ticker, Portfolio.shares, ETF.current_price).join(
+            ETF, Portfolio.etf_id == ETF.id
+        ).all()
+        names = [row.ticker for row in rows]
+        values = [row.shares * row.current_price for row in rows]
+
+    total = sum(values)
+    if total <= 0:
+        return []
+    exposure = index.exposure({t: v / total for t, v in zip(names, values)})
+    top = np.argsort(-exposure)[:limit]
+    return [
+        Exposure(name=index.security_name(int(security_id)), weight=round(float(exposure[security_id]), 2))
+        for security_id in top
+        if exposure[security_id] > 0
+    ]
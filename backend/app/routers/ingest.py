@@ -0,0 +1,56 @@
+import codecs
+import tempfile
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+
+from app.database import SessionLocal
+from app.services.ingest import FORMATS, KINDS, IngestConflict, IngestError, ingest
+from app.services.price_history import get_price_store
+
+router = APIRouter(prefix="/api/ingest", tags=["ingest"])
+
+# 요청 본문을 메모리에 두지 않도록 이 크기를 넘으면 디스크로 넘김
+_SPOOL_SIZE = 8 * 1024 * 1024
+
+
+def _run_ingest(spool, fmt: str, kind: str, batch_size: int) -> dict:
+    db = SessionLocal()
+    try:
+        stream = codecs.getreader("utf-8")(spool)
+        store = get_price_store() if kind == "prices" else None
+        return ingest(db, stream, fmt, kind, batch_size, store=store).as_dict()
+    finally:
+        db.close()
+
+
+@router.post("/{kind}")
+async def ingest_file(
+    kind: str,
+    request: Request,
+    format: str = Query("csv", description="본문 형식 (csv/jsonl)"),
+    batch_size: int = Query(500, ge=1, le=10000),
+):
+    """요청 본문(CSV/JSONL)을 스트리밍으로 적재 (예: curl --data-binary @etfs.csv)
+
+    중간에 실패하면 파싱 오류는 400, DB 오류(제약 조건 위반 등)는 409로 응답하고
+    detail.result에 그때까지 커밋된 행 수를 담습니다.
+    """
+    if kind not in KINDS:
+        raise HTTPException(status_code=404, detail=f"Unknown kind: {kind}")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        try:
+            return await run_in_threadpool(_run_ingest, spool, format, kind, batch_size)
+        except IngestError as e:
+            status = 409 if isinstance(e, IngestConflict) else 400
+            raise HTTPException(status_code=status,
+                                detail=jsonable_encoder({"message": str(e), "result": e.result.as_dict()}))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
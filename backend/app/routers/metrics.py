@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from app.services.metrics import RequestMetrics, get_metrics
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+def read_metrics(metrics: RequestMetrics = Depends(get_metrics)):
+    """라우트별 요청 수, 지연 시간(p50/p99), 요청당 SQL 쿼리 수, 프로세스 메모리"""
+    return metrics.snapshot()
+
+
+@router.delete("")
+def reset_metrics(metrics: RequestMetrics = Depends(get_metrics)):
+    """누적 통계 초기화 (벤치마크 워밍업 후 등)"""
+    metrics.reset()
+    return {"message": "Metrics reset"}
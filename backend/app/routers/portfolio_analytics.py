@@ -0,0 +1,142 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.database import get_db
+from app.models import ETF, Portfolio
+from app.schemas.analytics import PortfolioAnalytics, WhatIfRequest, WhatIfResult, WhatIfScore
+from app.services.analytics import DEFAULT_LOOKBACK, PortfolioAnalyzer, get_portfolio_analyzer
+from app.services.price_history import get_price_store
+
+router = APIRouter(prefix="/api/portfolios", tags=["portfolios"])
+
+
+def _round(value: float, digits: int = 2) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def _check_history(tickers: List[str]):
+    store = get_price_store()
+    missing = [t for t in tickers if t not in store]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Price history not found: {', '.join(missing)}")
+
+
+def _dividend_yields(db: Session, tickers: List[str]) -> Dict[str, float]:
+    rows = db.query(ETF.ticker, ETF.dividend_yield).filter(ETF.ticker.in_(tickers)).all()
+    return {row.ticker: row.dividend_yield or 0.0 for row in rows}
+
+
+@router.get("/analytics", response_model=PortfolioAnalytics)
+def analyze_portfolio(
+    tickers: Optional[str] = Query(None, description="쉼표로 구분된 티커 (없으면 보유 포트폴리오)"),
+    weights: Optional[str] = Query(None, description="tickers와 같은 순서의 비중 (없으면 동일 비중)"),
+    lookback: int = Query(DEFAULT_LOOKBACK, ge=20, le=2520, description="분석 기간 (영업일)"),
+    as_of: Optional[date] = Query(None, description="기준일 (없으면 오늘)"),
+    risk_free: float = Query(0.0, description="연 무위험 수익률 (%)"),
+    db: Session = Depends(get_db),
+    analyzer: PortfolioAnalyzer = Depends(get_portfolio_analyzer),
+):
+    """포트폴리오 변동성, 최대 낙폭, 샤프 지수, 상관계수 행렬, 배당 수익률"""
+    yield_on_cost = None
+    if tickers:
+        names = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+        try:
+            values = [float(w) for w in weights.split(",")] if weights else [1.0] * len(names)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="weights must be numbers")
+        if len(values) != len(names):
+            raise HTTPException(status_code=400, detail="tickers and weights must have the same length")
+        if any(v < 0 for v in values):
+            raise HTTPException(status_code=400, detail="weights must not be negative")
+        target: Dict[str, float] = {}
+        for name, value in zip(names, values):
+            target[name] = target.get(name, 0.0) + value
+        yields = _dividend_yields(db, list(target))
+    else:
+        # 보유 포트폴리오의 평가금액 비중
+        rows = db.query(
+            ETF.ticker, ETF.current_price, ETF.dividend_yield, Portfolio.shares, Portfolio.total_invested
+        ).join(ETF, Portfolio.etf_id == ETF.id).all()
+        target, yields = {}, {}
+        annual_dividend = invested = 0.0
+        for row in rows:
+            value = row.shares * row.current_price
+            target[row.ticker] = target.get(row.ticker, 0.0) + value
+            yields[row.ticker] = row.dividend_yield or 0.0
+            annual_dividend += value * (row.dividend_yield or 0) / 100
+            invested += row.total_invested or 0
+        if invested:
+            yield_on_cost = round(annual_dividend / invested * 100, 2)
+
+    if not target or sum(target.values()) <= 0:
+        raise HTTPException(status_code=400, detail="Portfolio is empty")
+    _check_history(list(target))
+
+    try:
+        result = analyzer.analyze(target, as_of or date.today(), lookback, risk_free)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    dividend_yield = sum(w * yields.get(t, 0.0) for t, w in zip(result["tickers"], result["weights"]))
+    return PortfolioAnalytics(
+        tickers=result["tickers"],
+        weights=[round(float(w), 4) for w in result["weights"]],
+        as_of=result["as_of"],
+        days=result["days"],
+        annual_return=round(result["annual_return"], 2),
+        volatility=round(result["volatility"], 2),
+        sharpe=_round(result["sharpe"]),
+        max_drawdown=round(result["max_drawdown"], 2),
+        dividend_yield=round(dividend_yield, 2),
+        yield_on_cost=yield_on_cost,
+        correlation=[[_round(v, 4) for v in row] for row in result["correlation"]],
+    )
+
+
+@router.post("/analytics/what-if", response_model=WhatIfResult)
+def score_rebalancing(
+    request: WhatIfRequest,
+    db: Session = Depends(get_db),
+    analyzer: PortfolioAnalyzer = Depends(get_portfolio_analyzer),
+):
+    """여러 후보 비중(리밸런싱안)을 한 번에 평가 (샤프 지수 높은 순)"""
+    names = [t.strip().upper() for t in request.tickers]
+    if len(set(names)) != len(names):
+        raise HTTPException(status_code=400, detail="tickers must be unique")
+    if any(len(c) != len(names) for c in request.candidates):
+        raise HTTPException(status_code=400, detail="each candidate must have one weight per ticker")
+    candidates = np.array(request.candidates, dtype=np.float64)
+    if (candidates < 0).any() or (candidates.sum(axis=1) <= 0).any():
+        raise HTTPException(status_code=400, detail="weights must be non-negative with a positive sum")
+    _check_history(names)
+
+    try:
+        matrix, metrics = analyzer.score(names, candidates, request.as_of or date.today(),
+                                          request.lookback, request.risk_free)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    yields = _dividend_yields(db, names)
+    weights = candidates / candidates.sum(axis=1, keepdims=True)
+    dividend_yield = weights @ np.array([yields.get(t, 0.0) for t in names])
+    order = np.argsort(-np.nan_to_num(metrics["sharpe"], nan=-np.inf), kind="stable")
+    return WhatIfResult(
+        tickers=names,
+        as_of=matrix.as_of,
+        days=len(matrix.returns),
+        scores=[
+            WhatIfScore(
+                index=int(i),
+                annual_return=round(float(metrics["annual_return"][i]), 2),
+                volatility=round(float(metrics["volatility"][i]), 2),
+                sharpe=_round(metrics["sharpe"][i]),
+                max_drawdown=round(float(metrics["max_drawdown"][i]), 2),
+                dividend_yield=round(float(dividend_yield[i]), 2),
+            )
+            for i in order
+        ],
+    )
@@ -0,0 +1,33 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Request
+
+from app.routers.etf_allocations import conditional_response
+from app.services.aggregates import Aggregates, get_aggregates
+from app.services.dividend_schedule import DividendSchedule, get_dividend_schedule
+
+router = APIRouter(prefix="/api/portfolios", tags=["portfolios"])
+
+
+@router.get("/summary")
+def get_portfolio_summary(
+    request: Request,
+    aggregates: Aggregates = Depends(get_aggregates),
+    schedule: DividendSchedule = Depends(get_dividend_schedule),
+):
+    """포트폴리오 요약 (투자금, 평가금액, 손익, 월 예상 배당금)"""
+    with aggregates.lock:
+        portfolio = aggregates.portfolio
+        etag, content = portfolio.etag, portfolio.snapshot()
+        shares = portfolio.shares()
+        # 배당 일정이 없는 ETF는 배당률 기준 추정치 사용
+        scheduled = schedule.scheduled_etfs()
+        fallback = sum(portfolio.estimated_monthly_dividend(etf_id)
+                       for etf_id in shares if etf_id not in scheduled)
+
+    # 월 예상 배당금: 배당 일정 기준 향후 12개월 현금흐름의 월평균
+    _, by_etf = schedule.forecast(shares, months=12)
+    content["monthly_dividend"] = round(sum(by_etf.values()) / 12 + fallback, 2)
+    # 예측 구간은 날짜와 배당 일정에 따라 달라지므로 ETag에 함께 반영
+    etag = f'{etag[:-1]}-{schedule.version}-{date.today():%Y%m%d}"'
+    return conditional_response(request, etag, content)
@@ -0,0 +1,45 @@
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import Optional, List
+
+
+class PortfolioAnalytics(BaseModel):
+    """포트폴리오 위험/성과 지표 (수익률/변동성/낙폭/배당률은 %)"""
+    tickers: List[str]
+    weights: List[float]  # 정규화된 비중 (합계 1)
+    as_of: date  # 분석에 사용한 마지막 거래일
+    days: int  # 분석에 사용한 영업일 수
+    annual_return: float  # 연환산 수익률
+    volatility: float  # 연환산 변동성
+    sharpe: Optional[float] = None
+    max_drawdown: float  # 최대 낙폭
+    dividend_yield: float  # 현재가 기준 가중 배당 수익률
+    yield_on_cost: Optional[float] = None  # 투자 원금 대비 연 배당 수익률 (보유 포트폴리오)
+    correlation: List[List[Optional[float]]]  # tickers 순서의 상관계수 행렬
+
+
+class WhatIfRequest(BaseModel):
+    """후보 비중 일괄 평가 요청"""
+    tickers: List[str] = Field(..., min_length=1)
+    candidates: List[List[float]] = Field(..., min_length=1, max_length=1000)  # 후보별 tickers 순서 비중
+    lookback: int = Field(252, ge=20, le=2520)
+    as_of: Optional[date] = None
+    risk_free: float = 0.0  # 연 무위험 수익률 (%)
+
+
+class WhatIfScore(BaseModel):
+    """후보 비중 하나의 평가 결과"""
+    index: int  # candidates 내 위치
+    annual_return: float
+    volatility: float
+    sharpe: Optional[float] = None
+    max_drawdown: float
+    dividend_yield: float
+
+
+class WhatIfResult(BaseModel):
+    """후보 비중 일괄 평가 결과 (샤프 지수 높은 순)"""
+    tickers: List[str]
+    as_of: date
+    days: int
+    scores: List[WhatIfScore]
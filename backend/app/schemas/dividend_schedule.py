@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional, List
+
+
+class DividendScheduleItem(BaseModel):
+    """배당 캘린더 항목 (실제 기록 또는 예측 일정)"""
+    id: Optional[int] = None  # 배당 기록 ID (예측 일정은 None)
+    source_id: int  # 실제 기록은 자기 ID, 예측 일정은 기준이 된 기록 ID
+    ticker: str
+    name: str
+    ex_dividend_date: date
+    payment_date: date
+    dividend_per_share: float
+    frequency: str
+    dividend_yield: Optional[float] = None
+    projected: bool = False  # 주기로 예측한 일정 여부
+
+
+class MonthlyCashFlow(BaseModel):
+    """월별 예상 배당 현금흐름"""
+    month: str  # YYYY-MM (지급월)
+    amount: float
+    payments: int
+
+
+class DividendForecast(BaseModel):
+    """포트폴리오 배당 현금흐름 예측"""
+    months: List[MonthlyCashFlow]
+    total: float
+    monthly_average: float
@@ -1,7 +1,12 @@
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, model_validator
+from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 
+from app.services.returns import get_return_engine
+
+# 응답 필드 -> 수익률 엔진 기간
+RETURN_FIELDS = {"return_1d": "1d", "return_1w": "1w", "return_1m": "1m", "return_1y": "1y"}
+
 
 class Holding(BaseModel):
     """보유 종목 정보"""
@@ -20,10 +25,6 @@ class ETFBase(BaseModel):
     volume: int
     sector: str
     region: str
-    return_1d: float
-    return_1w: float
-    return_1m: float
-    return_1y: float
 
 
 class ETFCreate(ETFBase):
@@ -33,6 +34,11 @@ class ETFCreate(ETFBase):
 
 class ETFResponse(ETFBase):
     id: int
+    # 수익률은 가격 히스토리에서 계산 (히스토리가 부족하면 None)
+    return_1d: Optional[float] = None
+    return_1w: Optional[float] = None
+    return_1m: Optional[float] = None
+    return_1y: Optional[float] = None
     investment_strategy: Optional[str] = None
     top_holdings: Optional[List[Dict[str, Any]]] = None
     created_at: datetime
@@ -41,6 +47,15 @@ class ETFResponse(ETFBase):
     class Config:
         from_attributes = True
 
+    @model_validator(mode="after")
+    def fill_returns(self):
+        """수익률은 DB 컬럼이 아니므로 수익률 엔진에서 채움 (직접 넘긴 값은 유지)"""
+        engine = get_return_engine()
+        for field, period in RETURN_FIELDS.items():
+            if getattr(self, field) is None:
+                setattr(self, field, engine.get(self.ticker, period))
+        return self
+
 
 class ETFRanking(BaseModel):
     """수익률 랭킹용 간소화 스키마"""
@@ -51,3 +66,38 @@ class ETFRanking(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ReturnTable(BaseModel):
+    """선택한 ETF들의 기간별 수익률과 평균"""
+    periods: List[str]
+    returns: Dict[str, Dict[str, Optional[float]]]  # {ticker: {period: 수익률}}
+    average: Dict[str, Optional[float]]  # {period: 평균 수익률}
+
+
+class PriceHistory(BaseModel):
+    """일봉 가격 히스토리 (컬럼형 OHLCV)"""
+    ticker: str
+    dates: List[date]
+    open: List[float]
+    high: List[float]
+    low: List[float]
+    close: List[float]
+    volume: List[int]
+
+
+class PriceTick(BaseModel):
+    """외부 시세 피드 1건"""
+    ticker: str
+    price: float
+
+
+class PriceDelta(BaseModel):
+    """실시간 시세 변경분"""
+    id: int
+    ticker: str
+    current_price: float
+    previous_price: Optional[float] = None
+    change: Optional[float] = None
+    return_1d: Optional[float] = None
+    timestamp: float  # 반영 시각 (epoch 초)
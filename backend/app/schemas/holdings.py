@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class Security(BaseModel):
+    """보유 종목 검색 결과"""
+    id: int
+    name: str
+    etf_count: int  # 보유 ETF 수
+
+
+class SecurityHolder(BaseModel):
+    """종목을 보유한 ETF"""
+    ticker: str
+    security: str
+    weight: float  # ETF 내 비중 (%)
+
+
+class CommonHolding(BaseModel):
+    """두 ETF의 공통 보유 종목"""
+    name: str
+    weight_a: float
+    weight_b: float
+
+
+class HoldingsOverlap(BaseModel):
+    """두 ETF의 보유 종목 중복도"""
+    ticker_a: str
+    ticker_b: str
+    overlap: float  # 종목별 min(비중) 합계 (%)
+    common: List[CommonHolding]
+
+
+class Exposure(BaseModel):
+    """룩스루 종목 노출"""
+    name: str
+    weight: float  # 포트폴리오 대비 비중 (%)
@@ -0,0 +1 @@
+"""인메모리 데이터 엔진 (가격 히스토리 등)"""
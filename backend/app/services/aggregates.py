@@ -0,0 +1,223 @@
+"""섹터/지역 분산도 및 포트폴리오 요약 집계
+
+매 요청마다 GROUP BY/합계를 다시 계산하지 않도록 집계 결과를 메모리에 유지하고,
+ETF/포트폴리오 행이 바뀌면 변경분(delta)만 반영합니다.
+변경 반영은 행별로 마지막에 반영한 값을 기준으로 하므로, 이미 반영된 변경이
+다시 들어와도(초기 적재 직후 늦게 도착한 커밋 알림 등) 중복 집계되지 않습니다.
+각 집계는 버전 번호를 가지며 값이 바뀔 때마다 증가하므로 ETag로 사용할 수 있습니다.
+"""
+
+import threading
+import uuid
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from app.database import SessionLocal
+from app.models import ETF, Portfolio
+from app.services.events import LoadGuard, on_bulk_change, on_commit
+
+# 서버 재시작 후 이전 ETag가 재사용되지 않도록 프로세스마다 다른 값
+_EPOCH = uuid.uuid4().hex[:8]
+
+
+class AllocationCounter:
+    """카테고리(섹터/지역)별 ETF 개수"""
+
+    def __init__(self, name: str, categories: Dict[int, Optional[str]]):
+        self.name = name
+        # etf_id -> 마지막으로 반영한 카테고리
+        self._rows = dict(categories)
+        self._counts = Counter(categories.values())
+        self.version = 0
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.name}-{_EPOCH}-{self.version}"'
+
+    def set(self, etf_id: int, category: Optional[str]):
+        """ETF 하나의 카테고리 반영 (이미 같은 값이면 무시)"""
+        if etf_id in self._rows and self._rows[etf_id] == category:
+            return
+        self.remove(etf_id)
+        self._rows[etf_id] = category
+        self._counts[category] += 1
+        self.version += 1
+
+    def remove(self, etf_id: int):
+        """ETF 삭제 반영 (반영된 적 없으면 무시)"""
+        if etf_id not in self._rows:
+            return
+        old = self._rows.pop(etf_id)
+        self._counts[old] -= 1
+        if self._counts[old] <= 0:
+            del self._counts[old]
+        self.version += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+
+class PortfolioTotals:
+    """포트폴리오 누적 합계 (투자금, 평가금액, 월 예상 배당금)"""
+
+    def __init__(self):
+        self.total_invested = 0.0
+        self.total_value = 0.0
+        self.monthly_dividend = 0.0
+        # holding id -> (etf_id, shares, total_invested)
+        self._holdings: Dict[int, Tuple[int, int, float]] = {}
+        # etf_id -> 보유 주식 수 합계
+        self._shares: Counter = Counter()
+        # etf_id -> (current_price, dividend_yield)
+        self._prices: Dict[int, Tuple[float, float]] = {}
+        self.version = 0
+
+    @property
+    def etag(self) -> str:
+        return f'"portfolio-{_EPOCH}-{self.version}"'
+
+    @staticmethod
+    def _monthly(price: float, dividend_yield: float) -> float:
+        return (price or 0) * (dividend_yield or 0) / 100 / 12
+
+    def set_price(self, etf_id: int, price: Optional[float], dividend_yield: Optional[float]):
+        """ETF 가격/배당률 변경 반영 (보유 주식 수만큼 평가금액/배당금 조정)"""
+        price, dividend_yield = price or 0, dividend_yield or 0
+        old_price, old_yield = self._prices.get(etf_id, (0, 0))
+        self._prices[etf_id] = (price, dividend_yield)
+        shares = self._shares.get(etf_id, 0)
+        if shares and (old_price, old_yield) != (price, dividend_yield):
+            self.total_value += shares * (price - old_price)
+            self.monthly_dividend += shares * (self._monthly(price, dividend_yield) - self._monthly(old_price, old_yield))
+            self.version += 1
+
+    def set_current_prices(self, prices: Dict[int, float]):
+        """배당률은 그대로 두고 현재가만 반영 (실시간 시세)"""
+        for etf_id, price in prices.items():
+            if etf_id in self._prices:
+                self.set_price(etf_id, price, self._prices[etf_id][1])
+
+    def remove_etf(self, etf_id: int):
+        self.set_price(etf_id, 0, 0)
+        self._prices.pop(etf_id, None)
+
+    def set_holding(self, holding_id: int, etf_id: Optional[int], shares: int = 0, invested: float = 0):
+        """보유 종목 추가/수정/삭제 반영 (삭제: etf_id=None)"""
+        old = self._holdings.pop(holding_id, None)
+        if old is not None:
+            self._add(*old, sign=-1)
+        if etf_id is not None:
+            self._holdings[holding_id] = (etf_id, shares or 0, invested or 0)
+            self._add(etf_id, shares or 0, invested or 0, sign=1)
+        self.version += 1
+
+    def _add(self, etf_id: int, shares: int, invested: float, sign: int):
+        price, dividend_yield = self._prices.get(etf_id, (0, 0))
+        self._shares[etf_id] += sign * shares
+        self.total_invested += sign * invested
+        self.total_value += sign * shares * price
+        self.monthly_dividend += sign * shares * self._monthly(price, dividend_yield)
+
+    def shares(self) -> Dict[int, int]:
+        """etf_id -> 보유 주식 수 (보유 중인 ETF만)"""
+        return {etf_id: shares for etf_id, shares in self._shares.items() if shares > 0}
+
+    def estimated_monthly_dividend(self, etf_id: int) -> float:
+        """배당률 기준 ETF 하나의 월 예상 배당금 (배당 일정이 없을 때 사용)"""
+        price, dividend_yield = self._prices.get(etf_id, (0, 0))
+        return self._shares.get(etf_id, 0) * self._monthly(price, dividend_yield)
+
+    def snapshot(self) -> dict:
+        profit = self.total_value - self.total_invested
+        return {
+            "total_invested": round(self.total_invested, 2),
+            "total_value": round(self.total_value, 2),
+            "total_profit": round(profit, 2),
+            "profit_rate": round(profit / self.total_invested * 100, 2) if self.total_invested else 0.0,
+            "unrealized_profit": round(profit, 2),
+            "monthly_dividend": round(self.monthly_dividend, 2),
+        }
+
+
+class Aggregates:
+    """분산도/포트폴리오 집계 묶음"""
+
+    def __init__(self, sectors: AllocationCounter, regions: AllocationCounter, portfolio: PortfolioTotals):
+        self.sectors = sectors
+        self.regions = regions
+        self.portfolio = portfolio
+        self.lock = threading.Lock()
+
+    def reload(self):
+        """DB에서 다시 계산 (bulk 적재 후)"""
+        fresh = build_aggregates()
+        with self.lock:
+            # 버전은 계속 증가해야 이전 ETag와 겹치지 않음
+            for name in ("sectors", "regions", "portfolio"):
+                counter = getattr(fresh, name)
+                counter.version = getattr(self, name).version + 1
+                setattr(self, name, counter)
+
+    def on_etf_changed(self, old: Optional[dict], new: Optional[dict]):
+        with self.lock:
+            if new is None:
+                self.sectors.remove(old["id"])
+                self.regions.remove(old["id"])
+                self.portfolio.remove_etf(old["id"])
+            else:
+                self.sectors.set(new["id"], new["sector"])
+                self.regions.set(new["id"], new["region"])
+                self.portfolio.set_price(new["id"], new["current_price"], new["dividend_yield"])
+
+    def on_prices_changed(self, prices: Dict[int, float]):
+        """Core bulk update로 바뀐 현재가 반영 (etf_id -> current_price)"""
+        with self.lock:
+            self.portfolio.set_current_prices(prices)
+
+    def on_holding_changed(self, old: Optional[dict], new: Optional[dict]):
+        with self.lock:
+            if new is None:
+                self.portfolio.set_holding(old["id"], None)
+            else:
+                self.portfolio.set_holding(new["id"], new["etf_id"], new["shares"], new["total_invested"])
+
+
+def build_aggregates() -> Aggregates:
+    """DB에서 집계를 한 번 계산"""
+    db = SessionLocal()
+    try:
+        etfs = db.query(ETF.id, ETF.sector, ETF.region, ETF.current_price, ETF.dividend_yield).all()
+        holdings = db.query(Portfolio.id, Portfolio.etf_id, Portfolio.shares, Portfolio.total_invested).all()
+    finally:
+        db.close()
+
+    portfolio = PortfolioTotals()
+    for row in etfs:
+        portfolio.set_price(row.id, row.current_price, row.dividend_yield)
+    for holding_id, etf_id, shares, invested in holdings:
+        portfolio.set_holding(holding_id, etf_id, shares, invested)
+    sectors = AllocationCounter("sector", {row.id: row.sector for row in etfs})
+    regions = AllocationCounter("region", {row.id: row.region for row in etfs})
+    return Aggregates(sectors, regions, portfolio)
+
+
+_aggregates: Optional[Aggregates] = None
+_aggregates_lock = threading.Lock()
+
+
+def get_aggregates() -> Aggregates:
+    """전역 집계 (ETF/포트폴리오 커밋 변경을 구독)"""
+    global _aggregates
+    if _aggregates is None:
+        with _aggregates_lock:
+            if _aggregates is None:
+                # 적재 중 커밋된 변경을 놓치지 않도록 리스너를 먼저 등록 (aggregates는 적재 후 바인딩)
+                guard = LoadGuard()
+                on_commit(ETF, guard.wrap(lambda old, new: aggregates.on_etf_changed(old, new)))
+                on_commit(Portfolio, guard.wrap(lambda old, new: aggregates.on_holding_changed(old, new)))
+                on_bulk_change(ETF, guard.wrap(lambda: aggregates.reload()))
+                on_bulk_change(Portfolio, guard.wrap(lambda: aggregates.reload()))
+                aggregates = build_aggregates()
+                guard.finish(aggregates.reload)
+                _aggregates = aggregates
+    return _aggregates
@@ -0,0 +1,193 @@
+"""포트폴리오 위험/성과 분석
+
+가격 히스토리에서 선택한 티커들의 일간 수익률 행렬(영업일 x 티커)을 만들고,
+비중 벡터로 변동성, 최대 낙폭(MDD), 샤프 지수, 상관계수 행렬을 한 번의 NumPy
+연산으로 계산합니다. 여러 후보 비중(what-if 리밸런싱)은 비중 행렬 하나로 묶어
+(영업일 x 티커) @ (티커 x 후보) 행렬 곱 한 번으로 평가합니다.
+
+결과는 (비중, 기준일, 기간, 무위험 수익률) 키로 LRU 캐시에 보관하며,
+가격 히스토리에 새 봉이 추가되면 캐시를 비웁니다.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.price_history import PriceHistoryStore, get_price_store
+
+# 연환산 기준 영업일 수
+TRADING_DAYS = 252
+
+# 기본 분석 기간 (영업일)
+DEFAULT_LOOKBACK = 252
+
+# 캐시 크기 (분석 결과 / 수익률 행렬)
+RESULT_CACHE_SIZE = 512
+MATRIX_CACHE_SIZE = 32
+
+
+class LRUCache:
+    """스레드 안전 LRU 캐시"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class ReturnMatrix:
+    """날짜 정렬된 일간 수익률 행렬"""
+
+    def __init__(self, tickers: List[str], dates: np.ndarray, returns: np.ndarray):
+        self.tickers = tickers
+        self.dates = dates  # 각 수익률 행의 날짜
+        self.returns = returns  # (영업일, 티커)
+
+    @property
+    def as_of(self) -> Optional[date]:
+        return self.dates[-1].astype(date) if len(self.dates) else None
+
+
+def _risk_metrics(returns: np.ndarray, risk_free: float) -> Dict[str, np.ndarray]:
+    """포트폴리오 일간 수익률 (영업일, 후보)에서 후보별 지표 계산 (% 단위)"""
+    days = len(returns)
+    wealth = np.cumprod(1 + returns, axis=0)
+    annual_return = wealth[-1] ** (TRADING_DAYS / days) - 1
+    volatility = returns.std(axis=0, ddof=1) * np.sqrt(TRADING_DAYS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (returns.mean(axis=0) * TRADING_DAYS - risk_free / 100) / volatility
+    peak = np.maximum.accumulate(np.vstack([np.ones((1, returns.shape[1])), wealth]), axis=0)[1:]
+    max_drawdown = (1 - wealth / peak).max(axis=0)
+    return {
+        "annual_return": annual_return * 100,
+        "volatility": volatility * 100,
+        "sharpe": np.where(volatility > 0, sharpe, np.nan),
+        "max_drawdown": max_drawdown * 100,
+    }
+
+
+class PortfolioAnalyzer:
+    """가격 히스토리 기반 포트폴리오 분석기"""
+
+    def __init__(self, store: PriceHistoryStore):
+        self._store = store
+        self._matrices = LRUCache(MATRIX_CACHE_SIZE)
+        self._results = LRUCache(RESULT_CACHE_SIZE)
+        store.subscribe(self._on_extend)
+
+    def _on_extend(self, ticker: str, bars: Dict[str, np.ndarray]):
+        # 새 봉이 추가되면 기준일 이후 결과가 바뀔 수 있으므로 전부 비움
+        self._matrices.clear()
+        self._results.clear()
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        return {"hits": self._results.hits, "misses": self._results.misses}
+
+    def return_matrix(self, tickers: Tuple[str, ...], as_of: date, lookback: int) -> ReturnMatrix:
+        """as_of 이전 최근 lookback 영업일의 일간 수익률 행렬 (모든 티커에 가격이 있는 날만)"""
+        key = (tickers, as_of, lookback)
+        matrix = self._matrices.get(key)
+        if matrix is not None:
+            return matrix
+
+        tails = []
+        for ticker in tickers:
+            bars = self._store.series(ticker).view(end=as_of)
+            tails.append((bars["date"][-(lookback + 1):], bars["close"][-(lookback + 1):]))
+
+        # 날짜 합집합 위에 종가를 배치하고 빈 날은 직전 종가로 채움
+        grid = np.unique(np.concatenate([dates for dates, _ in tails]))[-(lookback + 1):]
+        closes = np.full((len(grid), len(tickers)), np.nan)
+        for col, (dates, values) in enumerate(tails):
+            keep = np.searchsorted(dates, grid[0]) if len(grid) else len(dates)
+            closes[np.searchsorted(grid, dates[keep:]), col] = values[keep:]
+        filled = np.where(np.isnan(closes), 0, np.arange(len(grid))[:, None])
+        closes = closes[np.maximum.accumulate(filled, axis=0), np.arange(len(tickers))]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = closes[1:] / closes[:-1] - 1
+        valid = ~np.isnan(returns).any(axis=1)
+        matrix = ReturnMatrix(list(tickers), grid[1:][valid], returns[valid])
+        self._matrices.put(key, matrix)
+        return matrix
+
+    def analyze(self, weights: Dict[str, float], as_of: date, lookback: int = DEFAULT_LOOKBACK,
+                risk_free: float = 0.0) -> dict:
+        """비중 {ticker: weight}의 위험/성과 지표와 상관계수 행렬 (LRU 캐시)"""
+        tickers = tuple(sorted(weights))
+        total = sum(weights.values())
+        w = np.array([weights[t] / total for t in tickers])
+        key = (tuple(zip(tickers, w.round(10))), as_of, lookback, risk_free)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        matrix = self.return_matrix(tickers, as_of, lookback)
+        if len(matrix.returns) < 2:
+            raise ValueError("분석할 가격 히스토리가 부족합니다")
+        metrics = _risk_metrics(matrix.returns @ w[:, None], risk_free)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = np.corrcoef(matrix.returns, rowvar=False).reshape(len(tickers), len(tickers))
+        result = {
+            "tickers": list(tickers),
+            "weights": w,
+            "as_of": matrix.as_of,
+            "days": len(matrix.returns),
+            **{name: float(values[0]) for name, values in metrics.items()},
+            "correlation": correlation,
+        }
+        self._results.put(key, result)
+        return result
+
+    def score(self, tickers: List[str], candidates: np.ndarray, as_of: date,
+              lookback: int = DEFAULT_LOOKBACK, risk_free: float = 0.0) -> Tuple[ReturnMatrix, Dict[str, np.ndarray]]:
+        """후보 비중 행렬 (후보, 티커)을 한 번에 평가 (각 행은 합이 1이 되도록 정규화)"""
+        order = np.argsort(tickers)
+        sorted_tickers = tuple(tickers[i] for i in order)
+        candidates = candidates[:, order]
+        candidates = candidates / candidates.sum(axis=1, keepdims=True)
+        matrix = self.return_matrix(sorted_tickers, as_of, lookback)
+        if len(matrix.returns) < 2:
+            raise ValueError("분석할 가격 히스토리가 부족합니다")
+        return matrix, _risk_metrics(matrix.returns @ candidates.T, risk_free)
+
+
+_analytics: Optional[PortfolioAnalyzer] = None
+_analytics_lock = threading.Lock()
+
+
+def get_portfolio_analyzer() -> PortfolioAnalyzer:
+    """전역 포트폴리오 분석기 (전역 가격 저장소 기반)"""
+    global _analytics
+    if _analytics is None:
+        with _analytics_lock:
+            if _analytics is None:
+                _analytics = PortfolioAnalyzer(get_price_store())
+    return _analytics
@@ -0,0 +1,286 @@
+"""배당 일정 예측 인덱스
+
+ETF별 배당 기록(Dividend 행) 중 가장 최근 기록을 기준으로 배당 주기
+(monthly/quarterly/annual)에 따라 이후 일정을 예측하고, 실제 기록과 예측 일정을
+배당락일 순으로 정렬한 하나의 인덱스로 유지합니다.
+월별 캘린더, 다가오는 배당, 포트폴리오 현금흐름 예측은 모두 이 인덱스를
+bisect로 구간 조회해서 응답합니다.
+
+공유 인덱스에는 오늘부터 DEFAULT_HORIZON_DAYS까지의 예측만 보관하고, 그보다 먼
+구간은 조회할 때마다 기준 기록에서 계산합니다 (인덱스는 커지지 않음).
+오늘부터 MAX_PROJECTION_DAYS 이후의 일정은 조회할 수 없습니다.
+배당/ETF 행이 바뀌면 해당 ETF만 다시 생성하고 정렬 인덱스는 다음 조회 때 재구성합니다.
+"""
+
+import calendar
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.database import SessionLocal
+from app.models import ETF, Dividend
+from app.services.events import LoadGuard, on_bulk_change, on_commit
+
+# 배당 주기 -> 개월 수
+FREQUENCY_MONTHS = {"monthly": 1, "quarterly": 3, "semiannual": 6, "annual": 12}
+
+# 인덱스에 보관하는 예측 기간 (오늘부터)
+DEFAULT_HORIZON_DAYS = 400
+
+# 조회 가능한 최대 예측 기간 (오늘부터, 약 10년)
+MAX_PROJECTION_DAYS = 3660
+
+
+def add_months(day: date, months: int) -> date:
+    """월 단위 이동 (말일 보정)"""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+class ScheduleEntry:
+    """배당 일정 1건 (실제 기록 또는 예측)"""
+
+    __slots__ = ("etf_id", "ex_dividend_date", "payment_date", "dividend_per_share",
+                 "frequency", "source_id", "projected")
+
+    def __init__(self, etf_id: int, ex_dividend_date: date, payment_date: date,
+                 dividend_per_share: float, frequency: str, source_id: int, projected: bool):
+        self.etf_id = etf_id
+        self.ex_dividend_date = ex_dividend_date
+        self.payment_date = payment_date
+        self.dividend_per_share = dividend_per_share
+        self.frequency = frequency
+        self.source_id = source_id  # 실제 기록 ID 또는 예측의 기준 기록 ID
+        self.projected = projected
+
+
+class DividendSchedule:
+    """배당락일 순 배당 일정 인덱스"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # etf_id -> {dividend_id: row dict}
+        self._records: Dict[int, Dict[int, dict]] = defaultdict(dict)
+        # etf_id -> {"ticker", "name", "dividend_yield"}
+        self.etfs: Dict[int, dict] = {}
+        self._entries: Dict[int, List[ScheduleEntry]] = {}
+        # etf_id -> 예측 기준 기록 (마지막 실제 기록)
+        self._anchors: Dict[int, dict] = {}
+        self._horizon = date.today() + timedelta(days=DEFAULT_HORIZON_DAYS)
+        self._sorted: Optional[Tuple[List[int], List[ScheduleEntry]]] = None
+        self.version = 0
+
+    def _expand(self, etf_id: int):
+        # 실제 기록 + 마지막 기록 이후 horizon까지의 예측 일정
+        records = sorted(self._records.get(etf_id, {}).values(), key=lambda r: r["ex_dividend_date"])
+        entries = [
+            ScheduleEntry(etf_id, r["ex_dividend_date"], r["payment_date"], r["dividend_per_share"],
+                          r["frequency"], r["id"], False)
+            for r in records
+        ]
+        if records:
+            self._anchors[etf_id] = records[-1]
+            entries.extend(_project(etf_id, records[-1], date.min, self._horizon))
+        else:
+            self._anchors.pop(etf_id, None)
+        if entries:
+            self._entries[etf_id] = entries
+        else:
+            self._entries.pop(etf_id, None)
+
+    def _invalidate(self, etf_id: Optional[int] = None):
+        if etf_id is None:
+            for known in set(self._records) | set(self._entries):
+                self._expand(known)
+        else:
+            self._expand(etf_id)
+        self._sorted = None
+        self.version += 1
+
+    def set_record(self, dividend_id: int, row: Optional[dict], old_etf_id: Optional[int] = None):
+        """배당 기록 추가/수정/삭제 (삭제: row=None)"""
+        with self._lock:
+            if old_etf_id is not None:
+                self._records[old_etf_id].pop(dividend_id, None)
+                self._invalidate(old_etf_id)
+            if row is not None:
+                self._records[row["etf_id"]][dividend_id] = row
+                self._invalidate(row["etf_id"])
+
+    def set_etf(self, etf_id: int, meta: Optional[dict]):
+        with self._lock:
+            if meta is None:
+                self.etfs.pop(etf_id, None)
+            else:
+                self.etfs[etf_id] = meta
+            self.version += 1
+
+    def load(self, records: List[dict], etfs: Dict[int, dict]):
+        """전체 다시 적재"""
+        with self._lock:
+            self._records = defaultdict(dict)
+            for row in records:
+                self._records[row["etf_id"]][row["id"]] = row
+            self.etfs = etfs
+            self._entries = {}
+            self._anchors = {}
+            self._invalidate()
+
+    def _index(self) -> Tuple[List[int], List[ScheduleEntry]]:
+        with self._lock:
+            if self._sorted is None:
+                entries = sorted(
+                    (e for etf_entries in self._entries.values() for e in etf_entries),
+                    key=lambda e: (e.ex_dividend_date, e.etf_id),
+                )
+                self._sorted = ([e.ex_dividend_date.toordinal() for e in entries], entries)
+            return self._sorted
+
+    def window(self, start: date, end: date) -> List[ScheduleEntry]:
+        """배당락일이 [start, end]인 일정 (이진 탐색)
+
+        인덱스 예측 기간 이후 구간은 기준 기록에서 바로 계산합니다.
+        end가 오늘부터 MAX_PROJECTION_DAYS를 넘으면 ValueError.
+        """
+        if end > date.today() + timedelta(days=MAX_PROJECTION_DAYS):
+            raise ValueError(f"Dividend schedule is available up to {MAX_PROJECTION_DAYS} days ahead")
+        with self._lock:
+            keys, entries = self._index()
+            horizon = self._horizon
+            anchors = list(self._anchors.items()) if end > horizon else []
+        found = entries[bisect_left(keys, start.toordinal()):bisect_right(keys, end.toordinal())]
+        if anchors:
+            # 인덱스 밖 구간: 이번 조회에만 쓰고 보관하지 않음
+            lo = max(start, horizon + timedelta(days=1))
+            extra = [e for etf_id, anchor in anchors for e in _project(etf_id, anchor, lo, end)]
+            extra.sort(key=lambda e: (e.ex_dividend_date, e.etf_id))
+            found = found + extra
+        return found
+
+    def month(self, year: int, month: int) -> List[ScheduleEntry]:
+        return self.window(date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1]))
+
+    def upcoming(self, days: int, today: Optional[date] = None) -> List[ScheduleEntry]:
+        today = today or date.today()
+        return self.window(today, today + timedelta(days=days))
+
+    def forecast(self, shares: Dict[int, float], months: int = 12,
+                 today: Optional[date] = None) -> Tuple[List[dict], Dict[int, float]]:
+        """보유 주식 수 기준 월별 배당 현금흐름 예측
+
+        오늘 이후 배당락일 일정을 지급월별로 합산합니다.
+        (월별 [{month, amount, payments}], ETF별 합계) 반환
+        """
+        today = today or date.today()
+        end = add_months(today, months)
+        buckets = {}
+        for i in range(months + 1):
+            month_start = add_months(date(today.year, today.month, 1), i)
+            buckets[(month_start.year, month_start.month)] = {"month": f"{month_start:%Y-%m}", "amount": 0.0, "payments": 0}
+        by_etf: Dict[int, float] = defaultdict(float)
+        for entry in self.window(today, end - timedelta(days=1)):
+            held = shares.get(entry.etf_id)
+            if not held:
+                continue
+            amount = held * entry.dividend_per_share
+            bucket = buckets.setdefault(
+                (entry.payment_date.year, entry.payment_date.month),
+                {"month": f"{entry.payment_date:%Y-%m}", "amount": 0.0, "payments": 0},
+            )
+            bucket["amount"] += amount
+            bucket["payments"] += 1
+            by_etf[entry.etf_id] += amount
+        monthly = sorted(buckets.values(), key=lambda b: b["month"])
+        return monthly, dict(by_etf)
+
+    def scheduled_etfs(self) -> Set[int]:
+        """배당 일정(기록)이 있는 ETF ID"""
+        return set(self._entries)
+
+
+def _project(etf_id: int, anchor: dict, start: date, end: date) -> List[ScheduleEntry]:
+    """기준 기록 이후 배당 주기대로 예측한 일정 중 배당락일이 [start, end]인 것"""
+    step = FREQUENCY_MONTHS.get(anchor["frequency"])
+    if not step:
+        return []
+    origin = anchor["ex_dividend_date"]
+    lag = anchor["payment_date"] - origin
+    k = 1
+    if start > origin:
+        # start 직전 주기부터 시작 (말일 보정 때문에 한 주기 여유)
+        k = max(1, ((start.year - origin.year) * 12 + start.month - origin.month) // step - 1)
+    projected = []
+    while True:
+        ex_date = add_months(origin, step * k)
+        if ex_date > end:
+            break
+        if ex_date >= start:
+            projected.append(ScheduleEntry(etf_id, ex_date, ex_date + lag, anchor["dividend_per_share"],
+                                           anchor["frequency"], anchor["id"], True))
+        k += 1
+    return projected
+
+
+def _dividend_row(values) -> dict:
+    return {key: values[key] for key in (
+        "id", "etf_id", "ex_dividend_date", "payment_date", "dividend_per_share", "frequency",
+    )}
+
+
+def _etf_meta(row) -> dict:
+    return {"ticker": row["ticker"], "name": row["name"], "dividend_yield": row["dividend_yield"]}
+
+
+def load_schedule(schedule: DividendSchedule):
+    """DB의 배당 기록/ETF 정보로 인덱스 다시 적재"""
+    db = SessionLocal()
+    try:
+        records = [_dividend_row(row._mapping) for row in db.query(
+            Dividend.id, Dividend.etf_id, Dividend.ex_dividend_date, Dividend.payment_date,
+            Dividend.dividend_per_share, Dividend.frequency,
+        )]
+        etfs = {
+            row.id: _etf_meta(row._mapping)
+            for row in db.query(ETF.id, ETF.ticker, ETF.name, ETF.dividend_yield)
+        }
+    finally:
+        db.close()
+    schedule.load(records, etfs)
+
+
+_schedule: Optional[DividendSchedule] = None
+_schedule_lock = threading.Lock()
+
+
+def get_dividend_schedule() -> DividendSchedule:
+    """전역 배당 일정 인덱스 (배당/ETF 커밋 변경을 구독)"""
+    global _schedule
+    if _schedule is None:
+        with _schedule_lock:
+            if _schedule is None:
+                schedule = DividendSchedule()
+
+                def on_dividend_changed(old: Optional[dict], new: Optional[dict]):
+                    dividend_id = (new or old)["id"]
+                    schedule.set_record(dividend_id, new and _dividend_row(new),
+                                        old_etf_id=old and old["etf_id"])
+
+                def on_etf_changed(old: Optional[dict], new: Optional[dict]):
+                    if new is None:
+                        schedule.set_etf(old["id"], None)
+                    else:
+                        schedule.set_etf(new["id"], _etf_meta(new))
+
+                # 적재 중 커밋된 변경을 놓치지 않도록 리스너를 먼저 등록
+                guard = LoadGuard()
+                on_commit(Dividend, guard.wrap(on_dividend_changed))
+                on_commit(ETF, guard.wrap(on_etf_changed))
+                on_bulk_change(Dividend, guard.wrap(lambda: load_schedule(schedule)))
+                on_bulk_change(ETF, guard.wrap(lambda: load_schedule(schedule)))
+                load_schedule(schedule)
+                guard.finish(lambda: load_schedule(schedule))
+                _schedule = schedule
+    return _schedule
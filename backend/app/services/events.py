@@ -0,0 +1,145 @@
+"""커밋된 모델 변경 알림
+
+인메모리 인덱스/집계가 DB와 어긋나지 않도록, 세션 flush 시점에 변경 내용을
+모아 두었다가 커밋이 성공한 뒤에만 리스너에 전달합니다 (롤백되면 버림).
+리스너는 listener(old, new)로 호출되며 각 인자는 컬럼 값 dict입니다.
+INSERT는 old=None, DELETE는 new=None입니다.
+
+Core 레벨 bulk insert/update는 ORM 이벤트를 거치지 않으므로, 호출한 쪽에서
+notify_bulk_change(model)로 알리면 on_bulk_change 리스너가 전체를 다시 읽습니다.
+
+인덱스를 처음 적재할 때는 LoadGuard로 리스너를 적재 전에 등록해야
+적재 중에 커밋된 변경을 놓치지 않습니다.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+Listener = Callable[[Optional[dict], Optional[dict]], None]
+
+_listeners: Dict[type, List[Listener]] = defaultdict(list)
+_bulk_listeners: Dict[type, List[Callable[[], None]]] = defaultdict(list)
+
+_PENDING_KEY = "committed_model_changes"
+
+
+# 이전 값 추적을 켠 모델
+_tracked: Set[type] = set()
+
+
+def _on_set(target, value, oldvalue, initiator):
+    pass
+
+
+def on_commit(model: type, listener: Listener):
+    """model 행이 추가/수정/삭제되어 커밋되면 listener 호출"""
+    if model not in _tracked:
+        # 커밋 후 만료된 인스턴스를 수정해도 old에 이전 값이 오도록
+        # (active_history: 값을 바꾸기 전에 만료된 컬럼을 다시 읽어 history에 남김)
+        for attr in inspect(model).column_attrs:
+            event.listen(getattr(model, attr.key), "set", _on_set, active_history=True)
+        _tracked.add(model)
+    _listeners[model].append(listener)
+
+
+def on_bulk_change(model: type, listener: Callable[[], None]):
+    """model 테이블이 bulk 작업으로 바뀌면 listener() 호출"""
+    _bulk_listeners[model].append(listener)
+
+
+def notify_bulk_change(model: type):
+    """bulk insert/update 커밋 후 호출"""
+    for listener in _bulk_listeners[model]:
+        listener()
+
+
+class LoadGuard:
+    """초기 적재와 리스너 등록 사이에 커밋된 변경 유실 방지
+
+    리스너를 wrap()으로 감싸 적재 전에 등록하면, 적재가 끝날 때까지 들어온 알림은
+    적용하지 않고 표시만 해 둡니다. finish(reload)는 그동안 알림이 있었으면
+    (적재 결과에 반영됐는지 알 수 없으므로) 알림이 멈출 때까지 reload()를 다시 호출한 뒤
+    리스너를 활성화합니다.
+
+    적재 전에 커밋된 변경의 알림이 finish 이후에 도착할 수도 있으므로, 리스너는
+    행별 최종 값을 덮어쓰는 방식(같은 알림을 두 번 적용해도 결과가 같음)이어야 합니다.
+
+        guard = LoadGuard()
+        on_commit(ETF, guard.wrap(index.on_etf_changed))
+        load(index)
+        guard.finish(lambda: load(index))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loading = True
+        self._missed = False
+
+    def wrap(self, listener: Callable) -> Callable:
+        def guarded(*args):
+            if self._loading:
+                with self._lock:
+                    if self._loading:
+                        self._missed = True
+                        return
+            listener(*args)
+        return guarded
+
+    def finish(self, reload: Callable[[], None]):
+        while True:
+            with self._lock:
+                if not self._missed:
+                    self._loading = False
+                    return
+                self._missed = False
+            reload()
+
+
+def _current(obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def _previous(obj) -> dict:
+    state = inspect(obj)
+    values = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if history.deleted:
+            values[attr.key] = history.deleted[0]
+        elif history.unchanged:
+            values[attr.key] = history.unchanged[0]
+        else:
+            values[attr.key] = getattr(obj, attr.key)
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    if not _listeners:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    for obj in session.new:
+        if type(obj) in _listeners:
+            pending.append((type(obj), None, _current(obj)))
+    for obj in session.dirty:
+        if type(obj) in _listeners and session.is_modified(obj, include_collections=False):
+            pending.append((type(obj), _previous(obj), _current(obj)))
+    for obj in session.deleted:
+        if type(obj) in _listeners:
+            pending.append((type(obj), _previous(obj), None))
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session):
+    for model, old, new in session.info.pop(_PENDING_KEY, []):
+        for listener in _listeners[model]:
+            listener(old, new)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,191 @@
+"""보유 종목 룩스루 인덱스
+
+각 ETF의 top_holdings JSON을 한 번만 파싱해 종목명을 정수 ID로 인터닝하고,
+ETF x 종목 비중 희소 행렬(COO + 종목별 정렬 인덱스)로 유지합니다.
+- 역조회: 종목 -> 보유 ETF와 비중
+- 중복도: 두 ETF가 공통으로 보유한 비중 (종목별 min(비중) 합)
+- 룩스루 노출: 포트폴리오 비중 벡터 x 비중 행렬 (희소 행렬-벡터 곱)
+
+ETF 보유 종목이 바뀌면 해당 행만 다시 파싱하고, 압축 배열은 다음 조회 때 재구성합니다.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.database import SessionLocal
+from app.models.etf import ETF
+from app.services.events import LoadGuard, on_bulk_change, on_commit
+
+
+def normalize_name(name: str) -> str:
+    """종목명 비교용 정규화 (공백 정리, 대소문자 무시)"""
+    return " ".join(name.split()).casefold()
+
+
+class _Compiled:
+    """조회용 압축 배열"""
+
+    def __init__(self, rows: Dict[str, Dict[int, float]], n_securities: int):
+        self.tickers = list(rows)
+        self.row_of = {ticker: i for i, ticker in enumerate(self.tickers)}
+        counts = np.array([len(rows[t]) for t in self.tickers], dtype=np.intp)
+        self.rows = np.repeat(np.arange(len(self.tickers)), counts)
+        self.cols = np.fromiter((s for t in self.tickers for s in rows[t]), dtype=np.intp, count=counts.sum())
+        self.vals = np.fromiter((w for t in self.tickers for w in rows[t].values()), dtype=np.float64, count=counts.sum())
+        # 종목(열) 기준 정렬 인덱스: col_ptr[s]:col_ptr[s+1] 구간이 종목 s를 보유한 항목
+        self.by_col = np.argsort(self.cols, kind="stable")
+        self.col_ptr = np.searchsorted(self.cols[self.by_col], np.arange(n_securities + 1))
+        self.n_securities = n_securities
+
+
+class HoldingsIndex:
+    """ETF x 종목 비중 인덱스"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._security_ids: Dict[str, int] = {}
+        self._security_names: List[str] = []
+        # ticker -> {security_id: 비중(%)}
+        self._rows: Dict[str, Dict[int, float]] = {}
+        self._compiled: Optional[_Compiled] = None
+
+    def _intern(self, name: str) -> int:
+        key = normalize_name(name)
+        security_id = self._security_ids.get(key)
+        if security_id is None:
+            security_id = self._security_ids[key] = len(self._security_names)
+            self._security_names.append(" ".join(name.split()))
+        return security_id
+
+    def tickers(self) -> List[str]:
+        return list(self._rows)
+
+    def security_name(self, security_id: int) -> str:
+        return self._security_names[security_id]
+
+    def set_holdings(self, ticker: str, holdings: Optional[List[dict]]):
+        """ETF 보유 종목 갱신 (없으면 제거)"""
+        with self._lock:
+            row: Dict[int, float] = {}
+            for holding in holdings or []:
+                if holding.get("name") and holding.get("weight") is not None:
+                    security_id = self._intern(holding["name"])
+                    row[security_id] = row.get(security_id, 0.0) + float(holding["weight"])
+            if row:
+                self._rows[ticker] = row
+            else:
+                self._rows.pop(ticker, None)
+            self._compiled = None
+
+    def remove(self, ticker: str):
+        with self._lock:
+            if self._rows.pop(ticker, None) is not None:
+                self._compiled = None
+
+    def _matrix(self) -> _Compiled:
+        with self._lock:
+            if self._compiled is None:
+                self._compiled = _Compiled(self._rows, len(self._security_names))
+            return self._compiled
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[int, str, int]]:
+        """이름에 검색어가 포함된 종목 (ID, 이름, 보유 ETF 수), 보유 ETF 많은 순
+
+        인터닝된 이름은 지우지 않으므로 지금 보유한 ETF가 없는 종목은 건너뜁니다.
+        """
+        key = normalize_name(query)
+        with self._lock:
+            # 커밋 리스너가 다른 스레드에서 이름을 추가할 수 있으므로 잠금 안에서 복사
+            matrix = self._matrix()
+            securities = list(self._security_ids.items())
+        counts = np.diff(matrix.col_ptr)
+        found = [
+            (security_id, self._security_names[security_id], int(counts[security_id]))
+            for normalized, security_id in securities
+            if key in normalized and security_id < matrix.n_securities and counts[security_id] > 0
+        ]
+        found.sort(key=lambda item: (-item[2], item[1]))
+        return found[:limit]
+
+    def holders(self, security_ids: List[int]) -> List[Tuple[str, int, float]]:
+        """종목을 보유한 ETF (ticker, 종목 ID, 비중), 비중 큰 순"""
+        matrix = self._matrix()
+        result = []
+        for security_id in security_ids:
+            entries = matrix.by_col[matrix.col_ptr[security_id]:matrix.col_ptr[security_id + 1]]
+            result.extend(
+                (matrix.tickers[matrix.rows[i]], security_id, float(matrix.vals[i])) for i in entries
+            )
+        result.sort(key=lambda item: -item[2])
+        return result
+
+    def holdings(self, ticker: str) -> Dict[int, float]:
+        return dict(self._rows.get(ticker, {}))
+
+    def overlap(self, ticker_a: str, ticker_b: str) -> Tuple[float, List[Tuple[int, float, float]]]:
+        """두 ETF의 중복 비중 합계와 공통 종목 (종목 ID, A 비중, B 비중)"""
+        row_a, row_b = self._rows.get(ticker_a, {}), self._rows.get(ticker_b, {})
+        if len(row_a) > len(row_b):
+            common = [(s, row_a[s], row_b[s]) for s in row_b if s in row_a]
+        else:
+            common = [(s, row_a[s], row_b[s]) for s in row_a if s in row_b]
+        common.sort(key=lambda item: -min(item[1], item[2]))
+        return sum(min(a, b) for _, a, b in common), common
+
+    def exposure(self, weights: Dict[str, float]) -> np.ndarray:
+        """포트폴리오 룩스루 노출 (종목별 %)
+
+        weights는 {ticker: 포트폴리오 내 비중(0~1)}이며 결과는 종목 ID로 인덱싱된 배열입니다.
+        """
+        matrix = self._matrix()
+        vector = np.zeros(len(matrix.tickers))
+        for ticker, weight in weights.items():
+            row = matrix.row_of.get(ticker)
+            if row is not None:
+                vector[row] = weight
+        return np.bincount(matrix.cols, weights=matrix.vals * vector[matrix.rows],
+                           minlength=matrix.n_securities)
+
+
+def load_holdings(index: HoldingsIndex):
+    """DB의 모든 ETF 보유 종목을 인덱스에 반영 (보유 종목 컬럼만 조회)"""
+    db = SessionLocal()
+    try:
+        rows = db.query(ETF.ticker, ETF.top_holdings).all()
+    finally:
+        db.close()
+    for ticker in set(index.tickers()) - {row.ticker for row in rows}:
+        index.remove(ticker)
+    for row in rows:
+        index.set_holdings(row.ticker, row.top_holdings)
+
+
+_index: Optional[HoldingsIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_holdings_index() -> HoldingsIndex:
+    """전역 보유 종목 인덱스 (ETF 커밋 변경을 구독)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = HoldingsIndex()
+
+                def on_etf_changed(old: Optional[dict], new: Optional[dict]):
+                    if old is not None and (new is None or old["ticker"] != new["ticker"]):
+                        index.remove(old["ticker"])
+                    if new is not None and (old is None or old["top_holdings"] != new["top_holdings"]
+                                            or old["ticker"] != new["ticker"]):
+                        index.set_holdings(new["ticker"], new["top_holdings"])
+
+                # 적재 중 커밋된 변경을 놓치지 않도록 리스너를 먼저 등록
+                guard = LoadGuard()
+                on_commit(ETF, guard.wrap(on_etf_changed))
+                on_bulk_change(ETF, guard.wrap(lambda: load_holdings(index)))
+                load_holdings(index)
+                guard.finish(lambda: load_holdings(index))
+                _index = index
+    return _index
@@ -0,0 +1,289 @@
+"""대용량 데이터 적재 파이프라인
+
+CSV/JSONL 파일을 한 행씩 읽어 제너레이터로 파싱하고, 일정 크기 배치로 묶어
+bulk insert/upsert 합니다. 파일 전체를 메모리에 올리지 않으므로 파일 크기와
+관계없이 메모리 사용량이 배치 크기로 일정합니다.
+
+지원하는 종류:
+- etfs: ticker 기준 upsert, RETURNING으로 ID 확보 (top_holdings는 JSON 문자열/배열)
+- dividends: ticker로 ETF를 찾아 배당 일정 bulk insert
+- prices: ticker,date,open,high,low,close,volume 일봉을 가격 히스토리 저장소에 추가
+"""
+
+import csv
+import json
+import time
+from datetime import date, datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models import ETF, Dividend
+from app.schemas.etf import ETFCreate
+from app.services.events import notify_bulk_change
+from app.services.price_history import COLUMNS, PriceHistoryStore
+
+BATCH_SIZE = 500
+
+# 결과에 담는 건너뛴 행 상세 정보 최대 개수 (개수는 전부 셈)
+MAX_SKIPPED_ROWS = 100
+
+KINDS = ("etfs", "dividends", "prices")
+FORMATS = ("csv", "jsonl")
+
+
+class IngestResult:
+    """적재 결과 (행 수, 소요 시간, 초당 처리 행 수)"""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.rows = 0
+        self.batches = 0
+        self.skipped = 0
+        self.skipped_rows: List[dict] = []  # {"ticker", "date", "reason"} (최대 MAX_SKIPPED_ROWS개)
+        self._started = time.perf_counter()
+        self.seconds = 0.0
+
+    def skip(self, rows: List[dict]):
+        """건너뛴 행 기록"""
+        self.skipped += len(rows)
+        self.skipped_rows.extend(rows[:MAX_SKIPPED_ROWS - len(self.skipped_rows)])
+
+    def tick(self):
+        self.seconds = time.perf_counter() - self._started
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "rows": self.rows,
+            "batches": self.batches,
+            "skipped": self.skipped,
+            "skipped_rows": self.skipped_rows,
+            "seconds": round(self.seconds, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+        }
+
+
+class IngestError(ValueError):
+    """적재 중단 (result: 중단 전까지 커밋된 배치의 결과)"""
+
+    def __init__(self, message: str, result: IngestResult):
+        super().__init__(message)
+        self.result = result
+
+
+class IngestConflict(IngestError):
+    """DB 제약 조건 위반 등으로 배치 커밋 실패"""
+
+
+def detect_format(filename: str) -> str:
+    """파일 확장자로 형식 추정"""
+    if filename.endswith(".csv"):
+        return "csv"
+    if filename.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    raise ValueError(f"형식을 알 수 없는 파일입니다: {filename} (csv/jsonl)")
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[dict]:
+    """파일에서 한 행씩 dict로 읽기"""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+
+def batched(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _clean(record: dict) -> dict:
+    # CSV의 빈 칸은 None으로
+    return {key: (None if value == "" else value) for key, value in record.items()}
+
+
+def _as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def parse_etf(record: dict) -> dict:
+    record = _clean(record)
+    if isinstance(record.get("top_holdings"), str):
+        record["top_holdings"] = json.loads(record["top_holdings"])
+    return ETFCreate.model_validate(record).model_dump()
+
+
+def parse_dividend(record: dict) -> dict:
+    record = _clean(record)
+    return {
+        "ticker": record["ticker"],
+        "ex_dividend_date": _as_date(record["ex_dividend_date"]),
+        "payment_date": _as_date(record["payment_date"]),
+        "dividend_per_share": float(record["dividend_per_share"]),
+        "frequency": record.get("frequency") or "quarterly",
+    }
+
+
+def parse_price(record: dict) -> dict:
+    record = _clean(record)
+    return {
+        "ticker": record["ticker"],
+        "date": _as_date(record["date"]),
+        "open": float(record["open"]),
+        "high": float(record["high"]),
+        "low": float(record["low"]),
+        "close": float(record["close"]),
+        "volume": int(float(record["volume"] or 0)),
+    }
+
+
+PARSERS: Dict[str, Callable[[dict], dict]] = {
+    "etfs": parse_etf,
+    "dividends": parse_dividend,
+    "prices": parse_price,
+}
+
+
+def parse_records(records: Iterable[dict], parser: Callable[[dict], dict]) -> Iterator[dict]:
+    """각 행을 파싱 (오류 시 행 번호를 포함한 ValueError)"""
+    for row_number, record in enumerate(records, start=1):
+        try:
+            yield parser(record)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"{row_number}번째 행 파싱 실패: {e}") from e
+
+
+def upsert_etfs(db: Session, rows: List[dict]) -> Dict[str, int]:
+    """ticker 기준 bulk upsert 후 {ticker: id} 반환
+
+    한 문장에서 같은 행을 두 번 갱신할 수 없으므로(Postgres ON CONFLICT) 배치 안의
+    중복 ticker는 마지막 행만 남깁니다.
+    """
+    rows = list({row["ticker"]: row for row in rows}.values())
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(ETF).values(rows)
+    updates = {key: stmt.excluded[key] for key in rows[0] if key != "ticker"}
+    updates["updated_at"] = datetime.utcnow()
+    stmt = stmt.on_conflict_do_update(index_elements=[ETF.ticker], set_=updates)
+    result = db.execute(stmt.returning(ETF.ticker, ETF.id))
+    return {ticker: etf_id for ticker, etf_id in result}
+
+
+def insert_dividends(db: Session, rows: List[dict], etf_ids: Dict[str, int]) -> List[dict]:
+    """배당 일정 bulk insert (없는 티커는 건너뜀), 건너뛴 행 목록 반환"""
+    skipped = [
+        {"ticker": row["ticker"], "date": row["ex_dividend_date"], "reason": "unknown ticker"}
+        for row in rows if row["ticker"] not in etf_ids
+    ]
+    values = [
+        {"etf_id": etf_ids[row.pop("ticker")], **row}
+        for row in rows
+        if row["ticker"] in etf_ids
+    ]
+    if values:
+        db.execute(insert(Dividend), values)
+    return skipped
+
+
+def append_prices(store: PriceHistoryStore, rows: List[dict]) -> List[dict]:
+    """티커별로 묶어 가격 저장소에 추가, 마지막 봉 날짜 이하인 행은 건너뛰고 그 목록을 반환
+
+    저장소는 뒤에만 추가할 수 있으므로 이전 배치보다 과거 날짜(순서가 뒤섞인 행)도 건너뜁니다.
+    """
+    skipped: List[dict] = []
+    by_ticker: Dict[str, List[dict]] = {}
+    for row in rows:
+        by_ticker.setdefault(row["ticker"], []).append(row)
+    for ticker, bars in by_ticker.items():
+        bars.sort(key=lambda bar: bar["date"])
+        if ticker in store:
+            last = store.series(ticker).last_date
+            if last is not None:
+                last = last.item()
+                fresh = [bar for bar in bars if bar["date"] > last]
+                skipped.extend(
+                    {"ticker": ticker, "date": bar["date"], "reason": f"not after last stored bar ({last})"}
+                    for bar in bars if bar["date"] <= last
+                )
+                bars = fresh
+        if bars:
+            store.extend(ticker, {name: [bar[name] for bar in bars] for name in COLUMNS})
+    return skipped
+
+
+def ingest(db: Session, stream: TextIO, fmt: str, kind: str, batch_size: int = BATCH_SIZE,
+           store: Optional[PriceHistoryStore] = None,
+           progress: Optional[Callable[[IngestResult], None]] = None) -> IngestResult:
+    """파일 스트림을 배치 단위로 적재 (배치마다 커밋)
+
+    중간에 실패하면 그때까지 커밋된 결과를 담은 IngestError(파싱 오류) 또는
+    IngestConflict(DB 오류)를 발생시킵니다.
+    """
+    if kind not in PARSERS:
+        raise ValueError(f"지원하지 않는 종류입니다: {kind} ({'/'.join(KINDS)})")
+    if kind == "prices" and store is None:
+        raise ValueError("prices 적재에는 가격 히스토리 저장소가 필요합니다")
+
+    result = IngestResult(kind)
+    etf_ids: Dict[str, int] = {}
+    if kind == "dividends":
+        # 티커 -> ID 맵은 ETF 수에 비례 (파일 크기와 무관)
+        etf_ids = dict(db.query(ETF.ticker, ETF.id).all())
+
+    records = parse_records(read_records(stream, fmt), PARSERS[kind])
+    try:
+        for batch in batched(records, batch_size):
+            if kind == "etfs":
+                upsert_etfs(db, batch)
+            elif kind == "dividends":
+                result.skip(insert_dividends(db, batch, etf_ids))
+            else:
+                result.skip(append_prices(store, batch))
+            db.commit()
+
+            result.rows += len(batch)
+            result.batches += 1
+            result.tick()
+            if progress:
+                progress(result)
+    except ValueError as e:
+        db.rollback()
+        result.tick()
+        raise IngestError(str(e), result) from e
+    except SQLAlchemyError as e:
+        db.rollback()
+        result.tick()
+        raise IngestConflict(f"{result.batches + 1}번째 배치 적재 실패: {getattr(e, 'orig', None) or e}", result) from e
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        # 중간에 실패해도 이미 커밋된 배치는 인메모리 인덱스에 반영
+        if result.batches:
+            if kind == "etfs":
+                notify_bulk_change(ETF)
+            elif kind == "dividends":
+                notify_bulk_change(Dividend)
+            else:
+                store.save()
+
+    result.tick()
+    return result
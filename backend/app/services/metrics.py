@@ -0,0 +1,174 @@
+"""요청 처리 시간/SQL 쿼리 수 계측
+
+MetricsMiddleware가 요청마다 라우트 템플릿(/api/etfs/{etf_id} 등) 단위로
+처리 시간과 실행된 SQL 쿼리 수를 기록합니다. 쿼리 수는 SQLAlchemy
+before_cursor_execute 이벤트에서 현재 요청의 카운터(contextvar)를 올려 셉니다.
+라우트별 최근 지연 시간 샘플로 p50/p99를 계산하므로 N+1 쿼리나 지연 회귀가
+/metrics에서 바로 보입니다.
+"""
+
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 라우트별로 보관하는 최근 지연 시간 샘플 수
+SAMPLE_SIZE = 2048
+
+
+class _RequestCounter:
+    __slots__ = ("queries",)
+
+    def __init__(self):
+        self.queries = 0
+
+
+_current: ContextVar[Optional[_RequestCounter]] = ContextVar("request_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _current.get()
+    if counter is not None:
+        counter.queries += 1
+
+
+class RouteStats:
+    """라우트 하나의 누적 통계와 최근 지연 시간 샘플 (링 버퍼)"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self._samples = np.zeros(SAMPLE_SIZE)
+
+    def record(self, seconds: float, queries: int, error: bool):
+        self._samples[self.count % SAMPLE_SIZE] = seconds
+        self.count += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.queries += queries
+        self.max_queries = max(self.max_queries, queries)
+
+    def snapshot(self) -> dict:
+        samples = self._samples[:min(self.count, SAMPLE_SIZE)]
+        p50, p99 = np.percentile(samples, [50, 99]) if len(samples) else (0.0, 0.0)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_seconds / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(float(p50) * 1000, 3),
+            "p99_ms": round(float(p99) * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "queries_per_request": round(self.queries / self.count, 2) if self.count else 0.0,
+            "max_queries": self.max_queries,
+        }
+
+
+class RequestMetrics:
+    """(method, 라우트 템플릿) -> RouteStats"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.started = time.time()
+
+    def record(self, method: str, route: str, seconds: float, queries: int, error: bool):
+        with self._lock:
+            stats = self._routes.get((method, route))
+            if stats is None:
+                stats = self._routes[(method, route)] = RouteStats()
+            stats.record(seconds, queries, error)
+
+    def reset(self):
+        with self._lock:
+            self._routes = {}
+            self.started = time.time()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            routes: List[dict] = [
+                {"method": method, "route": route, **stats.snapshot()}
+                for (method, route), stats in sorted(self._routes.items(), key=lambda item: item[0][1])
+            ]
+        return {"uptime_seconds": round(time.time() - self.started, 1), "process": process_memory(), "routes": routes}
+
+
+def process_memory() -> dict:
+    """현재/최대 RSS (MB, 확인할 수 없으면 None)"""
+    rss = peak = None
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1]) / 1024
+                elif line.startswith("VmHWM:"):
+                    peak = int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if peak is None and resource is not None:
+        # Linux는 KB, macOS는 byte 단위
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = maxrss / 1024 / (1024 if sys.platform == "darwin" else 1)
+    return {
+        "rss_mb": None if rss is None else round(rss, 1),
+        "peak_rss_mb": None if peak is None else round(peak, 1),
+    }
+
+
+_metrics = RequestMetrics()
+
+
+def get_metrics() -> RequestMetrics:
+    return _metrics
+
+
+class MetricsMiddleware:
+    """요청별 처리 시간/SQL 쿼리 수를 RequestMetrics에 기록하는 ASGI 미들웨어
+
+    main.py에서 app.add_middleware(MetricsMiddleware)로 등록합니다.
+    응답 본문 전송이 끝날 때까지를 처리 시간으로 봅니다 (SSE 등 스트리밍은 연결 시간).
+    """
+
+    def __init__(self, app, metrics: Optional[RequestMetrics] = None):
+        self.app = app
+        self.metrics = metrics or _metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = _RequestCounter()
+        token = _current.set(counter)
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            # 라우팅 후 scope["route"]에 매칭된 라우트가 들어 있음 (경로 파라미터 대신 템플릿으로 집계)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "(unmatched)"
+            self.metrics.record(scope["method"], path, elapsed, counter.queries, status[0] >= 500)
@@ -0,0 +1,217 @@
+"""가격 히스토리 저장소
+
+티커별 일봉 OHLCV를 컬럼형 NumPy 배열로 보관합니다.
+행 단위 ORM 객체 대신 연속 배열을 사용하므로 수천 개 티커 x 수년치 데이터도
+적은 메모리로 다룰 수 있고, 날짜 구간 조회는 복사 없이 배열 뷰로 반환됩니다.
+"""
+
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# 저장 디렉토리 (backend/price_history/<TICKER>/<column>.npy, ETF_PRICE_HISTORY_DIR로 변경 가능)
+HISTORY_DIR = Path(
+    os.environ.get("ETF_PRICE_HISTORY_DIR") or Path(__file__).resolve().parents[2] / "price_history"
+)
+
+COLUMNS = ("date", "open", "high", "low", "close", "volume")
+_DTYPES = {
+    "date": "datetime64[D]",
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.int64,
+}
+
+
+class PriceSeries:
+    """단일 티커의 일봉 시계열 (append-only)"""
+
+    def __init__(self, capacity: int = 256):
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=_DTYPES[name]) for name in COLUMNS
+        }
+        self.size = 0
+
+    @classmethod
+    def from_arrays(cls, columns: Dict[str, np.ndarray]) -> "PriceSeries":
+        """이미 정렬된 컬럼 배열(또는 memmap)을 그대로 감싸서 생성"""
+        series = cls(capacity=0)
+        series.columns = columns
+        series.size = len(columns["date"])
+        return series
+
+    @property
+    def capacity(self) -> int:
+        return len(self.columns["date"])
+
+    @property
+    def last_date(self) -> Optional[np.datetime64]:
+        return self.columns["date"][self.size - 1] if self.size else None
+
+    def _reserve(self, extra: int):
+        # 용량을 2배씩 늘려 append 비용을 상각 O(1)로 유지
+        needed = self.size + extra
+        if needed <= self.capacity:
+            return
+        capacity = max(needed, self.capacity * 2, 16)
+        for name, old in self.columns.items():
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self.size] = old[:self.size]
+            self.columns[name] = grown
+
+    def extend(self, bars: Dict[str, Sequence]):
+        """여러 봉을 한 번에 추가 (날짜 오름차순이어야 함)"""
+        dates = np.asarray(bars["date"], dtype="datetime64[D]")
+        if len(dates) == 0:
+            return
+        if np.any(dates[1:] <= dates[:-1]):
+            raise ValueError("날짜는 오름차순이어야 합니다")
+        if self.size and dates[0] <= self.last_date:
+            raise ValueError(f"{dates[0]} 이전 데이터는 추가할 수 없습니다 (append-only)")
+
+        self._reserve(len(dates))
+        end = self.size + len(dates)
+        for name in COLUMNS:
+            self.columns[name][self.size:end] = dates if name == "date" else bars[name]
+        self.size = end
+
+    def view(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, np.ndarray]:
+        """[start, end] 구간의 컬럼 뷰 반환 (복사 없음)"""
+        dates = self.columns["date"][:self.size]
+        lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start, "D"), side="left"))
+        hi = self.size if end is None else int(np.searchsorted(dates, np.datetime64(end, "D"), side="right"))
+        return {name: column[lo:hi] for name, column in self.columns.items()}
+
+
+def downsample(bars: Dict[str, np.ndarray], points: int) -> Dict[str, np.ndarray]:
+    """OHLCV를 points개의 구간으로 집계 (스파크라인/요약 차트용)
+
+    각 구간은 시가=첫 봉, 고가=최대, 저가=최소, 종가=마지막 봉, 거래량=합계,
+    날짜=마지막 봉 날짜로 집계합니다.
+    """
+    n = len(bars["close"])
+    if points >= n:
+        return bars
+
+    starts = np.linspace(0, n, points, endpoint=False).astype(np.intp)
+    ends = np.append(starts[1:], n) - 1
+    return {
+        "date": bars["date"][ends],
+        "open": bars["open"][starts],
+        "high": np.maximum.reduceat(bars["high"], starts),
+        "low": np.minimum.reduceat(bars["low"], starts),
+        "close": bars["close"][ends],
+        "volume": np.add.reduceat(bars["volume"], starts),
+    }
+
+
+class PriceHistoryStore:
+    """티커 -> PriceSeries 저장소"""
+
+    def __init__(self):
+        self._series: Dict[str, PriceSeries] = {}
+        self._listeners: List[Callable[[str, Dict[str, np.ndarray]], None]] = []
+        self._dirty = set()  # 마지막 저장 이후 봉이 추가된 티커
+        self._lock = threading.RLock()
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._series
+
+    def tickers(self) -> List[str]:
+        return list(self._series)
+
+    def series(self, ticker: str) -> PriceSeries:
+        return self._series[ticker]
+
+    def subscribe(self, listener: Callable[[str, Dict[str, np.ndarray]], None]):
+        """봉 추가 시 호출될 콜백 등록 (listener(ticker, 추가된 봉 뷰))"""
+        self._listeners.append(listener)
+
+    def extend(self, ticker: str, bars: Dict[str, Sequence]):
+        """티커에 봉 데이터 추가 (없으면 새 시계열 생성)"""
+        with self._lock:
+            series = self._series.get(ticker)
+            if series is None:
+                series = self._series[ticker] = PriceSeries(capacity=max(len(bars["date"]), 16))
+            start = series.size
+            series.extend(bars)
+            self._dirty.add(ticker)
+            if self._listeners and series.size > start:
+                added = {name: column[start:series.size] for name, column in series.columns.items()}
+                for listener in self._listeners:
+                    listener(ticker, added)
+
+    def append_bar(self, ticker: str, day: date, open: float, high: float,
+                   low: float, close: float, volume: int):
+        """일봉 1개 추가"""
+        self.extend(ticker, {
+            "date": [day], "open": [open], "high": [high],
+            "low": [low], "close": [close], "volume": [volume],
+        })
+
+    def slice(self, ticker: str, start: Optional[date] = None, end: Optional[date] = None,
+              points: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """날짜 구간 조회 후 필요하면 다운샘플링"""
+        bars = self._series[ticker].view(start, end)
+        if points is not None:
+            bars = downsample(bars, points)
+        return bars
+
+    def save(self, directory: Path = HISTORY_DIR):
+        """변경된 티커를 컬럼별 .npy 파일로 저장
+
+        기존 파일이 memory-map으로 열려 있을 수 있으므로 임시 파일에 쓴 뒤 교체합니다.
+        """
+        with self._lock:
+            for ticker in sorted(self._dirty):
+                series = self._series[ticker]
+                ticker_dir = Path(directory) / ticker
+                ticker_dir.mkdir(parents=True, exist_ok=True)
+                for name, column in series.columns.items():
+                    path = ticker_dir / f"{name}.npy"
+                    tmp_path = path.with_suffix(".npy.tmp")
+                    with open(tmp_path, "wb") as f:
+                        np.save(f, column[:series.size])
+                    os.replace(tmp_path, path)
+            self._dirty.clear()
+
+    @classmethod
+    def load(cls, directory: Path = HISTORY_DIR, mmap: bool = True) -> "PriceHistoryStore":
+        """저장된 히스토리 로드
+
+        mmap=True이면 파일을 읽기 전용 memory-map으로 열어 실제로 조회되는
+        페이지만 메모리에 올라갑니다. 새 봉이 추가되면 해당 티커만 메모리로 복사됩니다.
+        """
+        store = cls()
+        directory = Path(directory)
+        if not directory.exists():
+            return store
+
+        mmap_mode = "r" if mmap else None
+        for ticker_dir in sorted(p for p in directory.iterdir() if p.is_dir()):
+            columns = {
+                name: np.load(ticker_dir / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in COLUMNS
+            }
+            store._series[ticker_dir.name] = PriceSeries.from_arrays(columns)
+        return store
+
+
+_store: Optional[PriceHistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_price_store() -> PriceHistoryStore:
+    """전역 가격 히스토리 저장소 (최초 호출 시 디스크에서 로드)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PriceHistoryStore.load()
+    return _store
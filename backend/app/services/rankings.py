@@ -0,0 +1,188 @@
+"""랭킹 인덱스
+
+지표(기간 수익률, 배당 수익률)별로 티커를 값 내림차순으로 정렬해 둔 인덱스입니다.
+전체/섹터별/지역별 파티션을 따로 유지하므로 필터가 있는 랭킹도 테이블을
+다시 스캔하지 않고 정렬된 배열 앞부분만 읽어서 응답합니다.
+값이 바뀌면 bisect로 위치를 찾아 해당 항목만 빼고 다시 넣습니다.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.database import SessionLocal
+from app.models.etf import ETF
+from app.services.events import LoadGuard, on_bulk_change, on_commit
+from app.services.returns import get_return_engine
+
+# 배당 수익률 지표 이름 (수익률 기간 이름과 겹치지 않음)
+DIVIDEND = "dividend_yield"
+
+ALL = "all"
+
+
+def _valid(value) -> bool:
+    return value is not None and not np.isnan(value)
+
+
+class RankingIndex:
+    """지표 x 파티션별 정렬 인덱스"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # ticker -> {"name", "sector", "region", "dividend_yield"}
+        self._meta: Dict[str, dict] = {}
+        # metric -> {ticker: value}
+        self._values: Dict[str, Dict[str, float]] = defaultdict(dict)
+        # (metric, partition) -> [(-value, ticker), ...] 오름차순 = 값 내림차순
+        self._sorted: Dict[Tuple[str, str], List[Tuple[float, str]]] = defaultdict(list)
+
+    def tickers(self) -> List[str]:
+        return list(self._meta)
+
+    def _partitions(self, ticker: str) -> List[str]:
+        meta = self._meta.get(ticker)
+        if meta is None:
+            return [ALL]
+        return [ALL, f"sector:{meta['sector']}", f"region:{meta['region']}"]
+
+    def _remove(self, metric: str, ticker: str):
+        old = self._values[metric].pop(ticker, None)
+        if old is None:
+            return
+        key = (-old, ticker)
+        for partition in self._partitions(ticker):
+            keys = self._sorted[(metric, partition)]
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+
+    def _insert(self, metric: str, ticker: str, value: float):
+        self._values[metric][ticker] = value
+        for partition in self._partitions(ticker):
+            insort(self._sorted[(metric, partition)], (-value, ticker))
+
+    def set_value(self, metric: str, ticker: str, value: Optional[float]):
+        """티커의 지표 값 갱신 (None/NaN이면 랭킹에서 제외)"""
+        with self._lock:
+            self._remove(metric, ticker)
+            if _valid(value):
+                self._insert(metric, ticker, float(value))
+
+    def set_meta(self, ticker: str, name: str, sector: str, region: str, dividend_yield: Optional[float]):
+        """ETF 기본 정보 갱신 (섹터/지역이 바뀌면 파티션 이동)"""
+        with self._lock:
+            old = self._meta.get(ticker)
+            meta = {"name": name, "sector": sector, "region": region, "dividend_yield": dividend_yield}
+            if old is None or (old["sector"], old["region"]) != (sector, region):
+                values = {metric: vals[ticker] for metric, vals in self._values.items() if ticker in vals}
+                for metric in values:
+                    self._remove(metric, ticker)
+                self._meta[ticker] = meta
+                for metric, value in values.items():
+                    self._insert(metric, ticker, value)
+            else:
+                self._meta[ticker] = meta
+            self.set_value(DIVIDEND, ticker, dividend_yield)
+
+    def remove(self, ticker: str):
+        """ETF 삭제"""
+        with self._lock:
+            for metric in list(self._values):
+                self._remove(metric, ticker)
+            self._meta.pop(ticker, None)
+
+    def load_metric(self, metric: str, tickers: List[str], values: np.ndarray):
+        """지표 전체를 한 번에 다시 적재 (정렬 1회)"""
+        with self._lock:
+            self._values[metric] = {t: float(v) for t, v in zip(tickers, values) if _valid(v)}
+            for key in [key for key in self._sorted if key[0] == metric]:
+                del self._sorted[key]
+            for ticker, value in self._values[metric].items():
+                for partition in self._partitions(ticker):
+                    self._sorted[(metric, partition)].append((-value, ticker))
+            for key in [key for key in self._sorted if key[0] == metric]:
+                self._sorted[key].sort()
+
+    def top(self, metric: str, limit: int, sector: Optional[str] = None,
+            region: Optional[str] = None) -> List[Tuple[str, float, dict]]:
+        """상위 limit개 (ticker, 값, 기본 정보)"""
+        if sector is not None:
+            partition = f"sector:{sector}"
+        elif region is not None:
+            partition = f"region:{region}"
+        else:
+            partition = ALL
+
+        result = []
+        with self._lock:
+            for neg_value, ticker in self._sorted.get((metric, partition), []):
+                meta = self._meta.get(ticker)
+                if meta is None:
+                    continue
+                # 섹터+지역 동시 필터는 섹터 파티션에서 지역만 추가로 거름
+                if sector is not None and region is not None and meta["region"] != region:
+                    continue
+                result.append((ticker, -neg_value, meta))
+                if len(result) == limit:
+                    break
+        return result
+
+
+def load_etf_meta(index: RankingIndex):
+    """DB의 ETF 기본 정보/배당률을 인덱스에 반영 (삭제된 ETF는 제거)"""
+    db = SessionLocal()
+    try:
+        rows = db.query(ETF.ticker, ETF.name, ETF.sector, ETF.region, ETF.dividend_yield).all()
+    finally:
+        db.close()
+    for ticker in set(index.tickers()) - {row.ticker for row in rows}:
+        index.remove(ticker)
+    for row in rows:
+        index.set_meta(row.ticker, row.name, row.sector, row.region, row.dividend_yield)
+
+
+_index: Optional[RankingIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_ranking_index() -> RankingIndex:
+    """전역 랭킹 인덱스 (수익률 엔진/ETF 커밋 변경을 구독)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                engine = get_return_engine()
+                index = RankingIndex()
+
+                def on_returns_changed(ticker: Optional[str]):
+                    if ticker is None:
+                        for period in engine.periods:
+                            index.load_metric(period, *engine.column(period))
+                    else:
+                        for period, value in engine.values(ticker).items():
+                            index.set_value(period, ticker, value)
+
+                def on_etf_changed(old: Optional[dict], new: Optional[dict]):
+                    if old is not None and (new is None or old["ticker"] != new["ticker"]):
+                        index.remove(old["ticker"])
+                    if new is not None:
+                        index.set_meta(new["ticker"], new["name"], new["sector"],
+                                       new["region"], new["dividend_yield"])
+
+                def reload():
+                    load_etf_meta(index)
+                    on_returns_changed(None)
+
+                # 적재 중 바뀐 값을 놓치지 않도록 리스너를 먼저 등록
+                guard = LoadGuard()
+                engine.subscribe(guard.wrap(on_returns_changed))
+                on_commit(ETF, guard.wrap(on_etf_changed))
+                on_bulk_change(ETF, guard.wrap(lambda: load_etf_meta(index)))
+                reload()
+                guard.finish(reload)
+                _index = index
+    return _index
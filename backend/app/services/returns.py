@@ -0,0 +1,270 @@
+"""기간 수익률 엔진
+
+가격 히스토리에서 모든 티커의 기간 수익률(1d/1w/1m/1y 등)을 한 번에 계산합니다.
+티커 x 최근 N영업일 종가를 링 버퍼 행렬로 유지하므로, 새 종가가 추가되면
+해당 티커 행의 마지막 칸만 갱신하고 그 행의 수익률만 다시 계산합니다.
+기간은 영업일 오프셋으로 정의되어 스키마 변경 없이 추가할 수 있습니다.
+"""
+
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.price_history import PriceHistoryStore, get_price_store
+
+# 기간 -> 영업일 오프셋
+DEFAULT_PERIODS = {
+    "1d": 1,
+    "1w": 5,
+    "1m": 21,
+    "3m": 63,
+    "1y": 252,
+    "3y": 756,
+}
+
+# 연초 대비 수익률 (전년도 마지막 종가 기준)
+YTD = "ytd"
+
+
+def _year(day: np.datetime64) -> int:
+    return int(day.astype("datetime64[Y]").astype(int)) + 1970
+
+
+class ReturnEngine:
+    """티커별 기간 수익률(%) 계산기"""
+
+    def __init__(self, store: PriceHistoryStore, periods: Optional[Dict[str, int]] = None):
+        self._store = store
+        self._periods: Dict[str, int] = dict(periods or DEFAULT_PERIODS)
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self.rebuild()
+        store.subscribe(self._on_extend)
+
+    def subscribe(self, listener: Callable[[Optional[str]], None]):
+        """수익률 변경 시 호출될 콜백 등록
+
+        listener(ticker)는 해당 티커 행이 갱신되었을 때,
+        listener(None)은 전체가 다시 계산되었을 때 호출됩니다.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, ticker: Optional[str]):
+        for listener in self._listeners:
+            listener(ticker)
+
+    @property
+    def periods(self) -> List[str]:
+        return list(self._periods) + [YTD]
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._tickers)
+
+    def rebuild(self):
+        """저장소 전체에서 종가 행렬을 다시 구성 (초기 로드/긴 기간 추가 시)"""
+        with self._lock:
+            # 다시 구성해도 장중 현재가는 유지
+            live = self._live_prices() if hasattr(self, "_live") else {}
+            self._window = max(self._periods.values()) + 1
+            self._offsets = np.array(list(self._periods.values()), dtype=np.intp)
+            self._tickers: List[str] = []
+            self._index: Dict[str, int] = {}
+            n = len(self._store.tickers())
+            self._closes = np.full((n, self._window), np.nan)
+            self._heads = np.full(n, self._window - 1, dtype=np.intp)
+            self._ytd_base = np.full(n, np.nan)
+            self._years = np.zeros(n, dtype=np.int64)
+            self._last_days = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+            self._live = np.full(n, np.nan)
+            self._live_days = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+            self._returns = np.full((n, len(self.periods)), np.nan)
+            for ticker in self._store.tickers():
+                self._load_row(ticker)
+            for ticker, (day, price) in live.items():
+                row = self._index.get(ticker)
+                if row is not None and not day < self._last_days[row]:
+                    self._live[row], self._live_days[row] = price, day
+            self._recompute_all()
+            self._notify(None)
+
+    def _load_row(self, ticker: str):
+        # 행 하나를 저장소의 최근 window개 종가로 채움 (행렬이 부족하면 확장)
+        row = len(self._tickers)
+        if row == len(self._closes):
+            self._grow_rows(max(row, 16))
+        self._tickers.append(ticker)
+        self._index[ticker] = row
+
+        series = self._store.series(ticker)
+        if series.size == 0:
+            return
+        closes = series.columns["close"][:series.size]
+        dates = series.columns["date"][:series.size]
+        tail = closes[-self._window:]
+        self._closes[row, self._window - len(tail):] = tail
+        self._heads[row] = self._window - 1
+
+        year = _year(dates[-1])
+        first_of_year = int(np.searchsorted(dates, np.datetime64(f"{year}-01-01", "D")))
+        self._ytd_base[row] = closes[first_of_year - 1] if first_of_year > 0 else np.nan
+        self._years[row] = year
+        self._last_days[row] = dates[-1]
+
+    def _grow_rows(self, extra: int):
+        self._closes = np.vstack([self._closes, np.full((extra, self._window), np.nan)])
+        self._heads = np.append(self._heads, np.full(extra, self._window - 1, dtype=np.intp))
+        self._ytd_base = np.append(self._ytd_base, np.full(extra, np.nan))
+        self._years = np.append(self._years, np.zeros(extra, dtype=np.int64))
+        self._last_days = np.append(self._last_days, np.full(extra, np.datetime64("NaT"), dtype="datetime64[D]"))
+        self._live = np.append(self._live, np.full(extra, np.nan))
+        self._live_days = np.append(self._live_days, np.full(extra, np.datetime64("NaT"), dtype="datetime64[D]"))
+        self._returns = np.vstack([self._returns, np.full((extra, len(self.periods)), np.nan)])
+
+    def _recompute_all(self):
+        self._returns = np.full((len(self._closes), len(self.periods)), np.nan)
+        self._returns[:len(self._tickers)] = self._compute(np.arange(len(self._tickers)))
+
+    def _compute(self, rows: np.ndarray) -> np.ndarray:
+        """주어진 행들의 모든 기간 수익률을 한 번의 gather로 계산
+
+        장중 현재가가 있으면 그 값을 최신가로 씁니다. 현재가 날짜가 마지막 봉 이후이면
+        (마지막 봉이 전일 봉) 현재가를 마지막 봉 다음 칸의 가상 봉으로 보고 기준가를 한 칸 당깁니다.
+        """
+        heads = self._heads[rows]
+        stored = self._closes[rows, heads]
+        live = self._live[rows]
+        has_live = ~np.isnan(live)
+        ahead = has_live & (self._live_days[rows] > self._last_days[rows])
+        latest = np.where(has_live, live, stored)
+        base_cols = (heads[:, None] + ahead[:, None] - self._offsets[None, :]) % self._window
+        bases = self._closes[rows[:, None], base_cols]
+        # 현재가가 새해 첫 거래일이면 마지막 종가(전년도 마지막 종가)가 YTD 기준가
+        live_years = self._live_days[rows].astype("datetime64[Y]").astype(np.int64) + 1970
+        ytd_base = np.where(ahead & (live_years != self._years[rows]), stored, self._ytd_base[rows])
+        out = np.empty((len(rows), len(self._offsets) + 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[:, :-1] = (latest[:, None] / bases - 1) * 100
+            out[:, -1] = (latest / ytd_base - 1) * 100
+        return out
+
+    def _on_extend(self, ticker: str, bars: Dict[str, np.ndarray]):
+        """저장소에 새 봉이 추가되면 해당 행만 갱신"""
+        with self._lock:
+            row = self._index.get(ticker)
+            if row is None:
+                self._load_row(ticker)
+                row = self._index[ticker]
+            else:
+                for day, close in zip(bars["date"], bars["close"]):
+                    head = self._heads[row]
+                    year = _year(day)
+                    if year != self._years[row]:
+                        # 해가 바뀌면 직전 종가가 새 YTD 기준가
+                        self._ytd_base[row] = self._closes[row, head]
+                        self._years[row] = year
+                    head = (head + 1) % self._window
+                    self._closes[row, head] = close
+                    self._heads[row] = head
+                    self._last_days[row] = day
+                if self._live_days[row] <= self._last_days[row]:
+                    # 현재가 날짜의 봉이 들어오면 저장된 종가를 우선
+                    self._live[row] = np.nan
+                    self._live_days[row] = np.datetime64("NaT")
+            self._returns[row] = self._compute(np.array([row]))[0]
+            self._notify(ticker)
+
+    def set_live_prices(self, prices: Dict[str, float]) -> List[str]:
+        """장중 현재가(당일)를 반영해 해당 행만 다시 계산
+
+        저장된 종가는 바꾸지 않고 행별 현재가로 따로 보관합니다. 마지막 봉이 전일 봉이면
+        1d 수익률은 현재가/마지막 종가, 당일 봉이면 현재가/전일 종가 기준이 됩니다.
+        당일 봉이 저장소에 추가되면 현재가는 버립니다. 갱신된 티커 목록을 반환합니다.
+        """
+        today = np.datetime64(date.today(), "D")
+        with self._lock:
+            found = [t for t in prices if t in self._index]
+            if not found:
+                return []
+            rows = np.array([self._index[t] for t in found], dtype=np.intp)
+            self._live[rows] = [prices[t] for t in found]
+            self._live_days[rows] = today
+            self._returns[rows] = self._compute(rows)
+            for ticker in found:
+                self._notify(ticker)
+            return found
+
+    def _live_prices(self) -> Dict[str, Tuple[np.datetime64, float]]:
+        return {
+            ticker: (self._live_days[row], float(self._live[row]))
+            for ticker, row in self._index.items() if not np.isnan(self._live[row])
+        }
+
+    def add_period(self, name: str, offset: int):
+        """새 기간 추가 (예: add_period("6m", 126))"""
+        if name == YTD or offset < 1:
+            raise ValueError(f"잘못된 기간입니다: {name}")
+        with self._lock:
+            self._periods[name] = offset
+            if offset < self._window:
+                self._offsets = np.array(list(self._periods.values()), dtype=np.intp)
+                self._recompute_all()
+                self._notify(None)
+            else:
+                self.rebuild()
+
+    def get(self, ticker: str, period: str) -> Optional[float]:
+        """티커의 기간 수익률 (히스토리가 부족하면 None)"""
+        row = self._index.get(ticker)
+        if row is None:
+            return None
+        value = self._returns[row, self.periods.index(period)]
+        return None if np.isnan(value) else round(float(value), 2)
+
+    def values(self, ticker: str) -> Dict[str, Optional[float]]:
+        """티커의 전체 기간 수익률 (반올림하지 않은 값)"""
+        row = self._index.get(ticker)
+        if row is None:
+            return {period: None for period in self.periods}
+        return {
+            period: None if np.isnan(value) else float(value)
+            for period, value in zip(self.periods, self._returns[row])
+        }
+
+    def column(self, period: str) -> Tuple[List[str], np.ndarray]:
+        """전체 티커의 특정 기간 수익률 (티커 목록, 값 배열 복사본)"""
+        with self._lock:
+            n = len(self._tickers)
+            return list(self._tickers), self._returns[:n, self.periods.index(period)].copy()
+
+    def lookup(self, tickers: List[str], period: str) -> np.ndarray:
+        """티커 순서대로 기간 수익률 배열 (없는 티커는 NaN)"""
+        with self._lock:
+            col = self.periods.index(period)
+            rows = np.array([self._index.get(t, -1) for t in tickers], dtype=np.intp)
+            values = self._returns[rows, col] if len(rows) else np.empty(0)
+            return np.where(rows >= 0, values, np.nan)
+
+    def table(self, tickers: List[str], periods: List[str]) -> Tuple[List[str], np.ndarray]:
+        """선택한 티커 x 기간 수익률 행렬 (존재하는 티커만)"""
+        with self._lock:
+            found = [t for t in tickers if t in self._index]
+            rows = np.array([self._index[t] for t in found], dtype=np.intp)
+            cols = np.array([self.periods.index(p) for p in periods], dtype=np.intp)
+            return found, self._returns[rows[:, None], cols[None, :]]
+
+
+_engine: Optional[ReturnEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_return_engine() -> ReturnEngine:
+    """전역 수익률 엔진 (전역 가격 저장소 기반)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ReturnEngine(get_price_store())
+    return _engine
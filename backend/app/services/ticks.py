@@ -0,0 +1,280 @@
+"""실시간 시세 수신/배포
+
+시세 피드(tick)를 받아 티커별 최신 가격만 남기고(coalescing), 일정 주기마다
+모인 가격을 한 번의 배치 트랜잭션으로 etfs 테이블에 반영합니다.
+반영 후 1d 수익률(수익률 엔진)과 포트폴리오 집계를 변경분만 갱신하고,
+구독 중인 클라이언트에게 구독한 티커의 변경분(delta)만 전달합니다.
+
+테스트용으로 DB의 현재가에서 출발하는 랜덤 워크 시뮬레이터 피드를 제공합니다.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, update
+
+from app.database import SessionLocal
+from app.models import ETF
+from app.services.aggregates import get_aggregates
+from app.services.events import LoadGuard, on_bulk_change, on_commit
+from app.services.returns import get_return_engine
+
+logger = logging.getLogger(__name__)
+
+# DB 반영/배포 주기 (초)
+FLUSH_INTERVAL = 1.0
+
+# 1이면 시뮬레이터 피드로 시세 생성 (로컬 테스트용)
+SIMULATOR_ENV = "ETF_TICK_SIMULATOR"
+
+# 구독자별 대기 배치 수 (느린 클라이언트는 오래된 배치부터 버림)
+SUBSCRIBER_QUEUE_SIZE = 32
+
+
+class Subscription:
+    """티커 집합 단위 구독 (tickers=None이면 전체)"""
+
+    def __init__(self, tickers: Optional[Iterable[str]] = None):
+        self.tickers: Optional[Set[str]] = None if tickers is None else {t.upper() for t in tickers}
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def subscribe(self, tickers: Iterable[str]):
+        if self.tickers is not None:
+            self.tickers |= {t.upper() for t in tickers}
+
+    def unsubscribe(self, tickers: Iterable[str]):
+        if self.tickers is None:
+            return
+        self.tickers -= {t.upper() for t in tickers}
+
+    def offer(self, deltas: List[dict]):
+        """구독 티커의 변경분만 큐에 넣음"""
+        if self.tickers is not None:
+            deltas = [d for d in deltas if d["ticker"] in self.tickers]
+        if not deltas:
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(deltas)
+
+
+class TickStream:
+    """시세 병합 -> 배치 반영 -> 변경분 배포"""
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # ticker -> 마지막으로 받은 가격 (다음 flush까지 병합)
+        self._pending: Dict[str, float] = {}
+        # ticker -> (etf_id, current_price, previous_price)
+        self._meta: Dict[str, Tuple[int, float, float]] = {}
+        self._subscribers: Set[Subscription] = set()
+        self._tasks: List[asyncio.Task] = []
+        self.ticks_received = 0
+        self.flushes = 0
+        self.flush_errors = 0
+
+    def reload_meta(self):
+        """DB에서 티커별 ID/현재가/전일가 다시 읽기"""
+        db = SessionLocal()
+        try:
+            rows = db.query(ETF.id, ETF.ticker, ETF.current_price, ETF.previous_price).all()
+        finally:
+            db.close()
+        with self._lock:
+            self._meta = {row.ticker: (row.id, row.current_price, row.previous_price) for row in rows}
+
+    def on_etf_changed(self, old: Optional[dict], new: Optional[dict]):
+        with self._lock:
+            if old is not None:
+                self._meta.pop(old["ticker"], None)
+            if new is not None:
+                self._meta[new["ticker"]] = (new["id"], new["current_price"], new["previous_price"])
+
+    def prices(self) -> Dict[str, float]:
+        """티커별 마지막으로 반영된 현재가"""
+        with self._lock:
+            return {ticker: price for ticker, (_, price, _) in self._meta.items()}
+
+    def submit(self, ticker: str, price: float):
+        """시세 1건 수신 (같은 티커는 다음 flush까지 최신 가격만 유지)"""
+        if not price or price <= 0 or not math.isfinite(price):
+            return
+        with self._lock:
+            self._pending[ticker.upper()] = float(price)
+            self.ticks_received += 1
+
+    async def consume(self, feed: AsyncIterator[Tuple[str, float]]):
+        """(ticker, price) 비동기 피드를 끝날 때까지 수신"""
+        async for ticker, price in feed:
+            self.submit(ticker, price)
+
+    def subscribe(self, tickers: Optional[Iterable[str]] = None) -> Subscription:
+        subscription = Subscription(tickers)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    def _write(self, prices: Dict[str, float]) -> List[dict]:
+        """병합된 가격을 한 트랜잭션으로 반영하고 변경분 목록 반환 (스레드에서 실행)"""
+        with self._lock:
+            batch = {
+                ticker: (self._meta[ticker], price)
+                for ticker, price in prices.items()
+                if ticker in self._meta and self._meta[ticker][1] != price
+            }
+        if not batch:
+            return []
+
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(ETF.__table__)
+                .where(ETF.__table__.c.id == bindparam("b_id"))
+                .values(current_price=bindparam("b_price"), updated_at=now),
+                [{"b_id": meta[0], "b_price": price} for meta, price in batch.values()],
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        # Core update는 ORM 커밋 이벤트를 거치지 않으므로 가격에 의존하는 인덱스만 직접 갱신
+        engine = get_return_engine()
+        engine.set_live_prices({ticker: price for ticker, (_, price) in batch.items()})
+        get_aggregates().on_prices_changed({meta[0]: price for meta, price in batch.values()})
+
+        # 파생 인덱스까지 반영된 뒤에만 반영 완료로 기록 (실패하면 다음 flush에서 같은 배치를 다시 반영)
+        with self._lock:
+            for ticker, ((etf_id, _, previous_price), price) in batch.items():
+                if ticker in self._meta:
+                    self._meta[ticker] = (etf_id, price, previous_price)
+
+        timestamp = time.time()
+        deltas = []
+        for ticker, ((etf_id, _, previous_price), price) in batch.items():
+            change = price - previous_price if previous_price else None
+            deltas.append({
+                "id": etf_id,
+                "ticker": ticker,
+                "current_price": price,
+                "previous_price": previous_price,
+                "change": None if change is None else round(change, 4),
+                "return_1d": engine.get(ticker, "1d"),
+                "timestamp": timestamp,
+            })
+        return deltas
+
+    async def flush(self) -> List[dict]:
+        """대기 중인 가격을 반영하고 구독자에게 배포"""
+        with self._lock:
+            prices, self._pending = self._pending, {}
+        if not prices:
+            return []
+        try:
+            deltas = await asyncio.to_thread(self._write, prices)
+        except BaseException:
+            # 실패한 배치를 되돌려 다음 flush에서 재시도 (그 사이 들어온 시세가 우선)
+            with self._lock:
+                self._pending = {**prices, **self._pending}
+            raise
+        self.flushes += 1
+        for subscription in list(self._subscribers):
+            subscription.offer(deltas)
+        return deltas
+
+    async def run(self):
+        """flush_interval마다 flush (취소될 때까지, 실패한 배치는 다음 주기에 재시도)"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                self.flush_errors += 1
+                logger.exception("시세 반영 실패 (다음 주기에 재시도)")
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self, feed: Optional[AsyncIterator[Tuple[str, float]]] = None):
+        """실행 중인 이벤트 루프에서 flush 루프 시작 (이미 실행 중이면 무시)
+
+        feed를 주면 함께 수신합니다 (예: simulate(stream)).
+        """
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self.run())]
+        if feed is not None:
+            self._tasks.append(loop.create_task(self.consume(feed)))
+
+    async def stop(self):
+        """flush 루프/피드 중지 후 남은 가격 반영"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.flush()
+
+
+async def simulate(stream: TickStream, interval: float = 0.05, volatility: float = 0.0005,
+                   seed: Optional[int] = None) -> AsyncIterator[Tuple[str, float]]:
+    """테스트용 시세 피드: 현재가에서 출발하는 티커별 랜덤 워크
+
+    interval마다 일부 티커의 시세를 만들어 flush 주기 안에 같은 티커가 여러 번 들어오게 합니다.
+    """
+    rng = random.Random(seed)
+    prices: Dict[str, float] = {}
+    while True:
+        await asyncio.sleep(interval)
+        # 새로 추가/삭제된 ETF 반영
+        known = stream.prices()
+        prices = {ticker: prices.get(ticker, price) for ticker, price in known.items() if price}
+        if not prices:
+            continue
+        for ticker in rng.sample(list(prices), k=max(1, len(prices) // 4)):
+            prices[ticker] = round(prices[ticker] * math.exp(rng.gauss(0, volatility)), 2)
+            yield ticker, prices[ticker]
+
+
+_stream: Optional[TickStream] = None
+_stream_lock = threading.Lock()
+
+
+def get_tick_stream() -> TickStream:
+    """전역 시세 스트림 (ETF 커밋 변경을 구독, 처음 호출 시 DB 조회)"""
+    global _stream
+    if _stream is None:
+        with _stream_lock:
+            if _stream is None:
+                stream = TickStream()
+                # 적재 중 커밋된 ETF를 놓치지 않도록 리스너를 먼저 등록
+                guard = LoadGuard()
+                on_commit(ETF, guard.wrap(stream.on_etf_changed))
+                on_bulk_change(ETF, guard.wrap(stream.reload_meta))
+                stream.reload_meta()
+                guard.finish(stream.reload_meta)
+                _stream = stream
+    return _stream
+
+
+async def start_tick_stream() -> TickStream:
+    """전역 시세 스트림 시작 (앱 startup 또는 첫 구독 시 호출, 이미 실행 중이면 무시)
+
+    처음 호출할 때의 DB 조회는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+    stream = _stream or await asyncio.to_thread(get_tick_stream)
+    if not stream.running:
+        simulator = os.environ.get(SIMULATOR_ENV) == "1"
+        stream.start(simulate(stream) if simulator else None)
+    return stream
@@ -0,0 +1,92 @@
+"""테스트 공통 설정
+
+가격 히스토리 저장 위치는 app을 import하기 전에 임시 디렉토리로 바꾸고,
+app.database는 현재 디렉토리의 app.db를 쓰므로 첫 DB 연결 전에 임시 디렉토리로 이동합니다.
+"""
+
+import os
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="etf-dashboard-tests-")
+os.environ["ETF_PRICE_HISTORY_DIR"] = os.path.join(_TMP_DIR, "price_history")
+
+from datetime import date  # noqa: E402
+from typing import List, Optional  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import ETF  # noqa: E402
+from app.services import events  # noqa: E402
+from app.services.price_history import PriceHistoryStore  # noqa: E402
+
+
+def business_days(count: int, end: date = date(2024, 6, 28)) -> np.ndarray:
+    """end까지(포함) 최근 count개 영업일"""
+    end_day = np.datetime64(end, "D")
+    days = np.arange(end_day - count * 2 - 10, end_day + 1)
+    return days[np.is_busday(days)][-count:]
+
+
+def add_closes(store: PriceHistoryStore, ticker: str, closes: List[float],
+               end: date = date(2024, 6, 28), days: Optional[np.ndarray] = None):
+    """종가 목록으로 일봉 추가 (시가/고가/저가 = 종가)"""
+    if days is None:
+        days = business_days(len(closes), end)
+    store.extend(ticker, {
+        "date": days, "open": closes, "high": closes, "low": closes,
+        "close": closes, "volume": [1000] * len(closes),
+    })
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tmp_workdir():
+    cwd = os.getcwd()
+    os.chdir(_TMP_DIR)
+    yield
+    engine.dispose()
+    os.chdir(cwd)
+
+
+@pytest.fixture(autouse=True)
+def isolated_listeners():
+    """테스트에서 등록한 커밋 리스너가 다음 테스트로 남지 않도록 복원"""
+    listeners = {model: list(items) for model, items in events._listeners.items()}
+    bulk_listeners = {model: list(items) for model, items in events._bulk_listeners.items()}
+    yield
+    events._listeners.clear()
+    events._listeners.update(listeners)
+    events._bulk_listeners.clear()
+    events._bulk_listeners.update(bulk_listeners)
+
+
+@pytest.fixture
+def db():
+    """테스트마다 빈 테이블로 시작하는 세션"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def add_etf(db):
+    """ETF 1개 추가 후 반환 (필요한 값만 덮어씀)"""
+    def add(ticker: str, **values) -> ETF:
+        etf = ETF(**{
+            "ticker": ticker, "name": f"{ticker} ETF", "current_price": 10000.0,
+            "previous_price": 10000.0, "dividend_yield": 3.0, "expense_ratio": 0.1,
+            "aum": 1000.0, "volume": 1000, "sector": "Diversified", "region": "US",
+            **values,
+        })
+        db.add(etf)
+        db.commit()
+        return etf
+    return add
+
+
+@pytest.fixture
+def store():
+    return PriceHistoryStore()
@@ -0,0 +1,131 @@
+import pytest
+
+from app.models import ETF, Portfolio
+from app.services.aggregates import AllocationCounter, build_aggregates
+from app.services.events import LoadGuard, on_commit
+
+
+@pytest.fixture
+def aggregates(db, add_etf):
+    add_etf("SCHD", sector="Diversified", region="US", current_price=100.0, dividend_yield=12.0)
+    add_etf("JEPI", sector="Income", region="US", current_price=50.0, dividend_yield=6.0)
+    aggregates = build_aggregates()
+    on_commit(ETF, aggregates.on_etf_changed)
+    on_commit(Portfolio, aggregates.on_holding_changed)
+    return aggregates
+
+
+def test_commit_listener_receives_old_and_new_rows(db, add_etf):
+    events = []
+    on_commit(ETF, lambda old, new: events.append((old and old["sector"], new and new["sector"])))
+
+    etf = add_etf("SCHD", sector="Diversified")
+    etf.sector = "Income"
+    db.commit()
+    db.delete(etf)
+    db.commit()
+
+    assert events == [(None, "Diversified"), ("Diversified", "Income"), ("Income", None)]
+
+
+def test_rolled_back_changes_are_not_dispatched(db, add_etf):
+    events = []
+    on_commit(ETF, lambda old, new: events.append(new))
+
+    etf = add_etf("SCHD")
+    events.clear()
+    etf.sector = "Income"
+    db.flush()
+    db.rollback()
+
+    assert events == []
+
+
+def test_load_guard_reloads_until_no_event_is_missed():
+    guard = LoadGuard()
+    applied, reloads = [], []
+    listener = guard.wrap(applied.append)
+
+    listener("during load")
+    listener("again")
+
+    def reload():
+        reloads.append(len(reloads))
+        if len(reloads) == 1:
+            listener("during reload")
+
+    guard.finish(reload)
+    assert reloads == [0, 1]
+    assert applied == []
+
+    listener("after")
+    assert applied == ["after"]
+
+
+def test_load_guard_without_missed_events_does_not_reload():
+    guard = LoadGuard()
+    reloads = []
+    guard.finish(lambda: reloads.append(1))
+    assert reloads == []
+
+
+def test_allocation_counts_follow_insert_update_delete(db, add_etf, aggregates):
+    assert aggregates.sectors.snapshot() == {"Diversified": 1, "Income": 1}
+
+    etf = add_etf("VNQ", sector="Real Estate", region="US")
+    assert aggregates.sectors.snapshot() == {"Diversified": 1, "Income": 1, "Real Estate": 1}
+
+    etf.sector = "Income"
+    etf.region = "Global"
+    db.commit()
+    assert aggregates.sectors.snapshot() == {"Diversified": 1, "Income": 2}
+    assert aggregates.regions.snapshot() == {"US": 2, "Global": 1}
+
+    db.delete(etf)
+    db.commit()
+    assert aggregates.sectors.snapshot() == {"Diversified": 1, "Income": 1}
+    assert aggregates.regions.snapshot() == {"US": 2}
+
+
+def test_duplicate_events_do_not_double_count():
+    counter = AllocationCounter("sector", {1: "Income"})
+    version = counter.version
+
+    # 적재 결과에 이미 반영된 변경이 늦게 다시 들어온 경우
+    counter.set(1, "Income")
+    counter.set(2, "Diversified")
+    counter.set(2, "Diversified")
+    counter.remove(3)
+    counter.remove(2)
+    counter.remove(2)
+
+    assert counter.snapshot() == {"Income": 1}
+    assert counter.version == version + 2
+
+
+def test_portfolio_totals_follow_holdings_and_prices(db, aggregates):
+    etf_id = db.query(ETF.id).filter(ETF.ticker == "SCHD").scalar()
+    holding = Portfolio(etf_id=etf_id, shares=10, avg_price=80.0, total_invested=800.0)
+    db.add(holding)
+    db.commit()
+
+    summary = aggregates.portfolio.snapshot()
+    assert summary["total_value"] == 1000.0
+    assert summary["total_profit"] == 200.0
+    assert summary["monthly_dividend"] == 10.0
+
+    aggregates.on_prices_changed({etf_id: 120.0})
+    assert aggregates.portfolio.snapshot()["total_value"] == 1200.0
+
+    etag = aggregates.portfolio.etag
+    db.delete(holding)
+    db.commit()
+    assert aggregates.portfolio.snapshot()["total_value"] == 0.0
+    assert aggregates.portfolio.etag != etag
+
+
+def test_reload_keeps_versions_increasing(aggregates):
+    etag = aggregates.sectors.etag
+    aggregates.reload()
+    assert aggregates.sectors.etag != etag
+    assert aggregates.sectors.snapshot() == {"Diversified": 1, "Income": 1}
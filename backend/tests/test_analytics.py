@@ -0,0 +1,115 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.routers import portfolio_analytics
+from app.services.analytics import TRADING_DAYS, PortfolioAnalyzer, get_portfolio_analyzer
+
+from conftest import add_closes, business_days
+
+AS_OF = date(2024, 6, 28)
+
+
+@pytest.fixture
+def analyzer(store):
+    rng = np.random.default_rng(1)
+    days = business_days(300, AS_OF)
+    for ticker in ("SCHD", "JEPI", "VIG"):
+        closes = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, 300))
+        add_closes(store, ticker, closes.tolist(), days=days)
+    return PortfolioAnalyzer(store)
+
+
+def test_single_ticker_metrics_match_direct_calculation(store):
+    closes = [100.0, 110.0, 99.0, 108.9, 119.79]
+    add_closes(store, "SCHD", closes, end=AS_OF)
+    analyzer = PortfolioAnalyzer(store)
+
+    result = analyzer.analyze({"SCHD": 1.0}, AS_OF, lookback=10)
+    returns = np.diff(closes) / closes[:-1]
+    assert result["days"] == 4
+    assert result["volatility"] == pytest.approx(returns.std(ddof=1) * np.sqrt(TRADING_DAYS) * 100)
+    assert result["max_drawdown"] == pytest.approx(10.0)
+    assert result["annual_return"] == pytest.approx(((closes[-1] / closes[0]) ** (TRADING_DAYS / 4) - 1) * 100)
+
+
+def test_missing_days_are_forward_filled(store):
+    days = business_days(4, AS_OF)
+    add_closes(store, "SCHD", [100.0, 110.0, 121.0, 133.1], days=days)
+    add_closes(store, "JEPI", [100.0, 100.0, 100.0], days=days[[0, 1, 3]])
+    analyzer = PortfolioAnalyzer(store)
+
+    matrix = analyzer.return_matrix(("JEPI", "SCHD"), AS_OF, 10)
+    np.testing.assert_allclose(matrix.returns, [[0.0, 0.1], [0.0, 0.1], [0.0, 0.1]])
+    assert matrix.as_of == AS_OF
+
+
+def test_results_are_cached_until_new_bars_arrive(analyzer, store):
+    first = analyzer.analyze({"SCHD": 1, "JEPI": 1}, AS_OF, lookback=60)
+    assert analyzer.analyze({"JEPI": 2, "SCHD": 2}, AS_OF, lookback=60) is first
+    assert analyzer.cache_stats == {"hits": 1, "misses": 1}
+
+    store.append_bar("SCHD", date(2024, 7, 1), 1.0, 1.0, 1.0, 1.0, 1)
+    assert analyzer.analyze({"SCHD": 1, "JEPI": 1}, AS_OF, lookback=60) is not first
+
+
+def test_correlation_matrix_is_symmetric(analyzer):
+    result = analyzer.analyze({"SCHD": 0.5, "JEPI": 0.3, "VIG": 0.2}, AS_OF, lookback=250)
+
+    correlation = result["correlation"]
+    assert correlation.shape == (3, 3)
+    np.testing.assert_allclose(np.diag(correlation), 1.0)
+    np.testing.assert_allclose(correlation, correlation.T)
+    assert result["weights"].sum() == pytest.approx(1.0)
+
+
+def test_score_matches_analyze_for_each_candidate(analyzer):
+    candidates = np.array([[1.0, 0.0, 0.0], [1.0, 1.0, 2.0], [0.2, 0.3, 0.5]])
+    tickers = ["VIG", "SCHD", "JEPI"]
+
+    matrix, metrics = analyzer.score(tickers, candidates, AS_OF, lookback=120)
+    assert matrix.tickers == ["JEPI", "SCHD", "VIG"]
+    for i, weights in enumerate(candidates):
+        expected = analyzer.analyze(dict(zip(tickers, weights)), AS_OF, lookback=120)
+        assert metrics["sharpe"][i] == pytest.approx(expected["sharpe"])
+        assert metrics["max_drawdown"][i] == pytest.approx(expected["max_drawdown"])
+
+
+def test_short_history_is_rejected(store):
+    add_closes(store, "SCHD", [100.0, 101.0], end=AS_OF)
+    with pytest.raises(ValueError):
+        PortfolioAnalyzer(store).analyze({"SCHD": 1.0}, AS_OF)
+
+
+def test_analytics_endpoints(db, add_etf, store, analyzer, monkeypatch):
+    add_etf("SCHD", dividend_yield=4.0)
+    add_etf("JEPI", dividend_yield=8.0)
+    monkeypatch.setattr(portfolio_analytics, "get_price_store", lambda: store)
+    app = FastAPI()
+    app.include_router(portfolio_analytics.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_portfolio_analyzer] = lambda: analyzer
+    client = TestClient(app)
+
+    body = client.get("/api/portfolios/analytics", params={
+        "tickers": "schd,jepi", "weights": "3,1", "as_of": AS_OF.isoformat(),
+    }).json()
+    assert body["tickers"] == ["JEPI", "SCHD"]
+    assert body["weights"] == [0.25, 0.75]
+    assert body["dividend_yield"] == 5.0
+
+    response = client.post("/api/portfolios/analytics/what-if", json={
+        "tickers": ["SCHD", "JEPI"], "candidates": [[1, 0], [0, 1], [1, 1]], "as_of": AS_OF.isoformat(),
+    })
+    scores = response.json()["scores"]
+    assert sorted(score["index"] for score in scores) == [0, 1, 2]
+    sharpes = [score["sharpe"] for score in scores]
+    assert sharpes == sorted(sharpes, reverse=True)
+
+    assert client.get("/api/portfolios/analytics", params={"tickers": "NOPE"}).status_code == 404
+    assert client.get("/api/portfolios/analytics", params={"tickers": "SCHD", "weights": "1,2"}).status_code == 400
+    assert client.get("/api/portfolios/analytics").status_code == 400
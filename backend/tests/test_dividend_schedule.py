@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models import Dividend
+from app.routers import dividend_schedule as dividend_router
+from app.services import dividend_schedule
+from app.services.dividend_schedule import MAX_PROJECTION_DAYS, DividendSchedule, add_months
+
+TODAY = date.today()
+
+
+def _record(dividend_id: int, etf_id: int, ex_date: date, amount: float = 1.0, frequency: str = "quarterly") -> dict:
+    return {
+        "id": dividend_id, "etf_id": etf_id, "ex_dividend_date": ex_date,
+        "payment_date": ex_date + timedelta(days=5), "dividend_per_share": amount, "frequency": frequency,
+    }
+
+
+@pytest.fixture
+def schedule() -> DividendSchedule:
+    schedule = DividendSchedule()
+    schedule.load(
+        [
+            _record(1, 1, TODAY - timedelta(days=60), 0.5, "monthly"),
+            _record(2, 1, TODAY - timedelta(days=30), 0.6, "monthly"),
+            _record(3, 2, TODAY - timedelta(days=10), 2.0, "quarterly"),
+        ],
+        {1: {"ticker": "JEPI", "name": "JEPI ETF", "dividend_yield": 8.0},
+         2: {"ticker": "SCHD", "name": "SCHD ETF", "dividend_yield": 3.5}},
+    )
+    return schedule
+
+
+def test_add_months_clamps_to_month_end():
+    assert add_months(date(2024, 1, 31), 1) == date(2024, 2, 29)
+    assert add_months(date(2024, 11, 30), 3) == date(2025, 2, 28)
+
+
+def test_window_is_sorted_and_projects_from_last_record(schedule):
+    entries = schedule.window(TODAY - timedelta(days=90), TODAY + timedelta(days=100))
+    days = [e.ex_dividend_date for e in entries]
+    assert days == sorted(days)
+
+    real = [e for e in entries if not e.projected]
+    assert [e.source_id for e in real] == [1, 2, 3]
+    projected_jepi = [e for e in entries if e.projected and e.etf_id == 1]
+    assert projected_jepi[0].ex_dividend_date == add_months(TODAY - timedelta(days=30), 1)
+    assert {e.source_id for e in projected_jepi} == {2}
+    assert all(e.dividend_per_share == 0.6 for e in projected_jepi)
+
+
+def test_window_beyond_horizon_matches_projection_rule(schedule):
+    start, end = TODAY + timedelta(days=1000), TODAY + timedelta(days=1100)
+    entries = schedule.window(start, end)
+
+    jepi = [e.ex_dividend_date for e in entries if e.etf_id == 1]
+    assert jepi and all(start <= day <= end for day in jepi)
+    origin = TODAY - timedelta(days=30)
+    assert all(day in {add_months(origin, k) for k in range(30, 40)} for day in jepi)
+
+    with pytest.raises(ValueError):
+        schedule.window(TODAY, TODAY + timedelta(days=MAX_PROJECTION_DAYS + 1))
+
+
+def test_records_move_between_etfs_and_delete(schedule):
+    version = schedule.version
+    schedule.set_record(3, _record(3, 1, TODAY - timedelta(days=10)), old_etf_id=2)
+    assert 2 not in schedule.scheduled_etfs()
+
+    schedule.set_record(1, None, old_etf_id=1)
+    schedule.set_record(2, None, old_etf_id=1)
+    schedule.set_record(3, None, old_etf_id=1)
+    assert schedule.scheduled_etfs() == set()
+    assert schedule.upcoming(365) == []
+    assert schedule.version > version
+
+
+def test_forecast_sums_payments_by_month(schedule):
+    monthly, by_etf = schedule.forecast({1: 10, 2: 100}, months=3)
+
+    assert len(monthly) >= 4
+    entries = schedule.window(TODAY, add_months(TODAY, 3) - timedelta(days=1))
+    expected = sum((10 if e.etf_id == 1 else 100) * e.dividend_per_share for e in entries)
+    assert sum(bucket["amount"] for bucket in monthly) == pytest.approx(expected)
+    assert sum(by_etf.values()) == pytest.approx(expected)
+    assert sum(bucket["payments"] for bucket in monthly) == len(entries)
+
+
+def test_endpoint_ids_are_unique_and_projected_rows_have_no_id(schedule):
+    app = FastAPI()
+    app.include_router(dividend_router.router)
+    app.dependency_overrides[dividend_schedule.get_dividend_schedule] = lambda: schedule
+    client = TestClient(app)
+
+    items = client.get("/api/dividends/upcoming", params={"days": 365}).json()
+    assert any(item["projected"] for item in items)
+    for item in items:
+        assert (item["id"] is None) == item["projected"]
+    keys = [item["id"] or f"{item['source_id']}-{item['ex_dividend_date']}" for item in items]
+    assert len(keys) == len(set(keys))
+
+    far = TODAY + timedelta(days=MAX_PROJECTION_DAYS + 40)
+    response = client.get("/api/dividends/calendar", params={"year": far.year, "month": far.month})
+    assert response.status_code == 400
+
+
+def test_global_schedule_follows_commits(db, add_etf, monkeypatch):
+    etf = add_etf("SCHD")
+    monkeypatch.setattr(dividend_schedule, "_schedule", None)
+    schedule = dividend_schedule.get_dividend_schedule()
+    assert schedule.scheduled_etfs() == set()
+
+    dividend = Dividend(etf_id=etf.id, ex_dividend_date=TODAY + timedelta(days=3),
+                        payment_date=TODAY + timedelta(days=8), dividend_per_share=0.7, frequency="quarterly")
+    db.add(dividend)
+    db.commit()
+    upcoming = schedule.upcoming(30)
+    assert [(e.source_id, e.projected) for e in upcoming] == [(dividend.id, False)]
+
+    etf.name = "Renamed"
+    db.commit()
+    assert schedule.etfs[etf.id]["name"] == "Renamed"
+
+    db.delete(dividend)
+    db.commit()
+    assert schedule.upcoming(30) == []
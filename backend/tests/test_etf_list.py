@@ -0,0 +1,76 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.routers import etf_list
+from app.services.returns import ReturnEngine, get_return_engine
+
+from conftest import add_closes
+
+
+@pytest.fixture
+def client(db, store):
+    add_closes(store, "A", [100.0, 110.0])
+    add_closes(store, "B", [100.0, 90.0])
+    add_closes(store, "C", [100.0, 110.0])
+    engine = ReturnEngine(store)
+    app = FastAPI()
+    app.include_router(etf_list.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_return_engine] = lambda: engine
+    return TestClient(app)
+
+
+def _pages(client, **params):
+    """커서를 따라 모든 페이지의 티커 목록"""
+    pages, cursor = [], None
+    while True:
+        response = client.get("/api/etfs/", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages.append([item["ticker"] for item in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_cursor_round_trip_with_null_sort_keys(client, add_etf, order):
+    for ticker, aum in [("A", 300.0), ("B", None), ("C", 100.0), ("D", None), ("E", 100.0), ("F", 200.0)]:
+        add_etf(ticker, aum=aum)
+
+    pages = _pages(client, sort="aum", order=order, limit=2, fields="ticker,aum")
+    tickers = [ticker for page in pages for ticker in page]
+    if order == "asc":
+        assert tickers == ["C", "E", "F", "A", "B", "D"]
+    else:
+        assert tickers == ["A", "F", "E", "C", "D", "B"]
+    assert all(len(page) == 2 for page in pages)
+
+
+def test_cursor_round_trip_by_return_keeps_missing_last(client, add_etf):
+    for ticker in ["A", "B", "C", "D"]:
+        add_etf(ticker)
+
+    pages = _pages(client, sort="return_1d", order="desc", limit=1)
+    # 같은 값은 id도 정렬 방향을 따름
+    assert [ticker for page in pages for ticker in page] == ["C", "A", "B", "D"]
+
+
+def test_filters_fields_and_total_count(client, add_etf):
+    add_etf("A", sector="Income", name="Alpha")
+    add_etf("B", sector="Income", name="Beta")
+    add_etf("C", sector="Diversified", name="Gamma")
+
+    response = client.get("/api/etfs/", params={"sector": "Income", "q": "bet", "fields": "ticker,return_1d"})
+    assert response.headers["X-Total-Count"] == "1"
+    assert response.json() == [{"ticker": "B", "return_1d": -10.0}]
+
+    item = client.get("/api/etfs/", params={"limit": 1}).json()[0]
+    assert "top_holdings" not in item and "return_1y" in item
+
+
+def test_invalid_parameters_are_rejected(client):
+    assert client.get("/api/etfs/", params={"fields": "nope"}).status_code == 400
+    assert client.get("/api/etfs/", params={"sort": "top_holdings"}).status_code == 400
+    assert client.get("/api/etfs/", params={"cursor": "not-a-cursor"}).status_code == 400
@@ -0,0 +1,92 @@
+import threading
+
+import numpy as np
+import pytest
+
+from app.services import holdings_index
+from app.services.holdings_index import HoldingsIndex, load_holdings
+
+
+@pytest.fixture
+def index() -> HoldingsIndex:
+    index = HoldingsIndex()
+    index.set_holdings("SCHD", [{"name": "Apple Inc", "weight": 4.0}, {"name": "Pepsico", "weight": 3.0}])
+    index.set_holdings("VIG", [{"name": "apple  inc", "weight": 5.0}, {"name": "Microsoft", "weight": 4.5}])
+    index.set_holdings("JEPI", [{"name": "Microsoft", "weight": 1.5}, {"name": "", "weight": 9.0}])
+    return index
+
+
+def test_names_are_normalized_and_weights_merged(index):
+    index.set_holdings("DUP", [{"name": "Pepsico", "weight": 1.0}, {"name": "PEPSICO ", "weight": 2.0}])
+
+    pepsico = index.search("pepsico")[0][0]
+    assert index.holdings("DUP") == {pepsico: 3.0}
+    assert index.security_name(pepsico) == "Pepsico"
+
+
+def test_search_orders_by_holder_count_and_skips_unheld(index):
+    assert [(name, count) for _, name, count in index.search("")] == [
+        ("Apple Inc", 2), ("Microsoft", 2), ("Pepsico", 1),
+    ]
+
+    index.remove("SCHD")
+    assert [name for _, name, _ in index.search("")] == ["Microsoft", "Apple Inc"]
+    assert index.search("pepsi") == []
+
+
+def test_holders_overlap_and_exposure(index):
+    apple = index.search("apple")[0][0]
+    microsoft = index.search("micro")[0][0]
+
+    assert index.holders([apple]) == [("VIG", apple, 5.0), ("SCHD", apple, 4.0)]
+    total, common = index.overlap("SCHD", "VIG")
+    assert total == 4.0
+    assert common == [(apple, 4.0, 5.0)]
+
+    exposure = index.exposure({"VIG": 0.5, "JEPI": 0.5, "NOPE": 1.0})
+    assert exposure[apple] == pytest.approx(2.5)
+    assert exposure[microsoft] == pytest.approx(3.0)
+    assert exposure.sum() == pytest.approx(5.5)
+
+
+def test_search_while_holdings_change_from_another_thread(index):
+    errors = []
+
+    def writer():
+        for i in range(2000):
+            index.set_holdings(f"NEW{i % 50}", [{"name": f"Security {i % 200}", "weight": 1.0}])
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while thread.is_alive():
+        try:
+            assert all(count > 0 for _, _, count in index.search("security"))
+        except Exception as e:
+            errors.append(e)
+    thread.join()
+    assert errors == []
+    assert len(index.search("security", limit=100)) == 50
+
+
+def test_load_holdings_and_commit_listener(db, add_etf, monkeypatch):
+    etf = add_etf("SCHD", top_holdings=[{"name": "Apple Inc", "weight": 4.0}])
+    add_etf("EMPTY", top_holdings=None)
+    monkeypatch.setattr(holdings_index, "_index", None)
+
+    index = holdings_index.get_holdings_index()
+    assert index.tickers() == ["SCHD"]
+
+    etf.ticker = "SCHD2"
+    etf.top_holdings = [{"name": "Pepsico", "weight": 3.0}]
+    db.commit()
+    assert index.tickers() == ["SCHD2"]
+    assert [name for _, name, _ in index.search("")] == ["Pepsico"]
+
+    db.delete(etf)
+    db.commit()
+    assert index.tickers() == []
+
+    index.set_holdings("GONE", [{"name": "Apple Inc", "weight": 1.0}])
+    load_holdings(index)
+    assert index.tickers() == []
+    assert np.all(index.exposure({}) == 0)
@@ -0,0 +1,118 @@
+import io
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from app.models import ETF, Dividend
+from app.routers import ingest as ingest_router
+from app.services import ingest as ingest_service
+from app.services.events import on_bulk_change
+from app.services.ingest import IngestConflict, IngestError, ingest
+
+from conftest import add_closes
+
+ETF_HEADER = "ticker,name,current_price,previous_price,dividend_yield,expense_ratio,aum,volume,sector,region\n"
+
+
+def _etf_line(ticker: str, price: float = 100.0, sector: str = "Income") -> str:
+    return f"{ticker},{ticker} ETF,{price},{price},5.0,0.3,1000,100,{sector},US\n"
+
+
+def test_etfs_are_upserted_and_last_duplicate_wins(db):
+    reloads = []
+    on_bulk_change(ETF, lambda: reloads.append(1))
+    csv = ETF_HEADER + _etf_line("SCHD", 100) + _etf_line("JEPI", 50) + _etf_line("SCHD", 110, "Diversified")
+
+    result = ingest(db, io.StringIO(csv), "csv", "etfs", batch_size=10)
+    assert (result.rows, result.batches) == (3, 1)
+    ingest(db, io.StringIO(ETF_HEADER + _etf_line("JEPI", 55)), "csv", "etfs")
+
+    rows = {etf.ticker: (etf.current_price, etf.sector) for etf in db.query(ETF)}
+    assert rows == {"SCHD": (110.0, "Diversified"), "JEPI": (55.0, "Income")}
+    assert reloads == [1, 1]
+
+
+def test_dividends_with_unknown_ticker_are_listed_as_skipped(db, add_etf):
+    add_etf("SCHD")
+    jsonl = "\n".join([
+        '{"ticker": "SCHD", "ex_dividend_date": "2024-03-20", "payment_date": "2024-03-25", "dividend_per_share": 0.6}',
+        '{"ticker": "NOPE", "ex_dividend_date": "2024-03-21", "payment_date": "2024-03-26", "dividend_per_share": 1.0}',
+    ])
+
+    result = ingest(db, io.StringIO(jsonl), "jsonl", "dividends").as_dict()
+    assert result["skipped"] == 1
+    assert result["skipped_rows"] == [{"ticker": "NOPE", "date": date(2024, 3, 21), "reason": "unknown ticker"}]
+    dividend = db.query(Dividend).one()
+    assert (dividend.dividend_per_share, dividend.frequency) == (0.6, "quarterly")
+
+
+def test_prices_not_after_last_bar_are_listed_as_skipped(db, store):
+    add_closes(store, "SCHD", [100.0], end=date(2024, 1, 5))
+    csv = ("ticker,date,open,high,low,close,volume\n"
+           "SCHD,2024-01-08,1,1,1,101,10\n"
+           "SCHD,2024-01-04,1,1,1,99,10\n"
+           "JEPI,2024-01-08,1,1,1,50,10\n")
+
+    result = ingest(db, io.StringIO(csv), "csv", "prices", store=store)
+    assert result.skipped == 1
+    assert result.skipped_rows[0]["date"] == date(2024, 1, 4)
+    assert result.skipped_rows[0]["reason"] == "not after last stored bar (2024-01-05)"
+    assert store.slice("SCHD")["close"].tolist() == [100.0, 101.0]
+    assert store.slice("JEPI")["close"].tolist() == [50.0]
+
+
+def test_parse_error_reports_committed_batches(db):
+    csv = ETF_HEADER + _etf_line("SCHD") + "JEPI,JEPI ETF,not-a-number,1,1,1,1,1,Income,US\n"
+
+    with pytest.raises(IngestError) as excinfo:
+        ingest(db, io.StringIO(csv), "csv", "etfs", batch_size=1)
+    assert "2번째 행" in str(excinfo.value)
+    assert excinfo.value.result.rows == 1
+    assert [etf.ticker for etf in db.query(ETF)] == ["SCHD"]
+
+
+def test_db_error_raises_conflict_with_committed_rows(db, monkeypatch):
+    upsert = ingest_service.upsert_etfs
+    calls = []
+
+    def failing_upsert(session, rows):
+        calls.append(rows)
+        if len(calls) == 2:
+            raise IntegrityError("INSERT INTO etfs", {}, Exception("constraint failed"))
+        return upsert(session, rows)
+
+    monkeypatch.setattr(ingest_service, "upsert_etfs", failing_upsert)
+    csv = ETF_HEADER + _etf_line("SCHD") + _etf_line("JEPI")
+
+    with pytest.raises(IngestConflict) as excinfo:
+        ingest(db, io.StringIO(csv), "csv", "etfs", batch_size=1)
+    assert excinfo.value.result.rows == 1
+    assert "2번째 배치" in str(excinfo.value)
+
+
+def test_router_maps_ingest_errors_to_status_codes(db, monkeypatch):
+    app = FastAPI()
+    app.include_router(ingest_router.router)
+    client = TestClient(app)
+    csv = ETF_HEADER + _etf_line("SCHD") + _etf_line("JEPI")
+
+    response = client.post("/api/ingest/etfs", content=csv)
+    assert response.status_code == 200
+    assert response.json()["rows"] == 2
+
+    response = client.post("/api/ingest/etfs", content=ETF_HEADER + "SCHD,x,bad,1,1,1,1,1,Income,US\n")
+    assert response.status_code == 400
+    assert response.json()["detail"]["result"]["rows"] == 0
+
+    def conflict(session, rows):
+        raise IntegrityError("INSERT INTO etfs", {}, Exception("constraint failed"))
+
+    monkeypatch.setattr(ingest_service, "upsert_etfs", conflict)
+    response = client.post("/api/ingest/etfs", content=csv)
+    assert response.status_code == 409
+    assert "constraint failed" in response.json()["detail"]["message"]
+
+    assert client.post("/api/ingest/nope", content=csv).status_code == 404
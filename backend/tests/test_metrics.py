@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.services.metrics import SAMPLE_SIZE, MetricsMiddleware, RequestMetrics, RouteStats
+
+
+@pytest.fixture
+def metrics():
+    return RequestMetrics()
+
+
+@pytest.fixture
+def client(db, metrics):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, queries: int = 0):
+        session = SessionLocal()
+        try:
+            for _ in range(queries):
+                session.execute(text("SELECT 1"))
+        finally:
+            session.close()
+        if item_id < 0:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def _route(metrics: RequestMetrics, route: str) -> dict:
+    return next(r for r in metrics.snapshot()["routes"] if r["route"] == route)
+
+
+def test_requests_are_grouped_by_route_template_with_query_counts(client, metrics):
+    client.get("/items/1", params={"queries": 2})
+    client.get("/items/2", params={"queries": 4})
+    client.get("/items/-1")
+
+    stats = _route(metrics, "/items/{item_id}")
+    assert (stats["method"], stats["count"], stats["errors"]) == ("GET", 3, 0)
+    assert stats["queries_per_request"] == 2.0
+    assert stats["max_queries"] == 4
+    assert 0 < stats["p50_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_server_errors_and_unmatched_paths(client, metrics):
+    client.get("/boom")
+    client.get("/nope")
+
+    assert _route(metrics, "/boom")["errors"] == 1
+    assert _route(metrics, "(unmatched)")["count"] == 1
+
+    metrics.reset()
+    assert metrics.snapshot()["routes"] == []
+
+
+def test_route_stats_keep_recent_samples_only():
+    stats = RouteStats()
+    for _ in range(SAMPLE_SIZE):
+        stats.record(1.0, 1, False)
+    for _ in range(SAMPLE_SIZE):
+        stats.record(0.001, 1, False)
+
+    snapshot = stats.snapshot()
+    assert snapshot["count"] == 2 * SAMPLE_SIZE
+    assert snapshot["p99_ms"] == pytest.approx(1.0)
+    assert snapshot["max_ms"] == 1000.0
+    assert snapshot["mean_ms"] == pytest.approx(500.5)
@@ -0,0 +1,84 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.services.price_history import PriceHistoryStore, downsample
+
+from conftest import add_closes, business_days
+
+
+def test_extend_is_append_only(store):
+    add_closes(store, "SCHD", [1.0, 2.0, 3.0], end=date(2024, 1, 5))
+
+    with pytest.raises(ValueError):
+        add_closes(store, "SCHD", [4.0], end=date(2024, 1, 5))
+    with pytest.raises(ValueError):
+        add_closes(store, "SCHD", [4.0, 5.0], days=np.array(["2024-01-09", "2024-01-08"], dtype="datetime64[D]"))
+    assert store.series("SCHD").size == 3
+
+
+def test_extend_grows_capacity_and_keeps_order(store):
+    days = business_days(100)
+    for i in range(0, 100, 7):
+        add_closes(store, "SCHD", [float(x) for x in range(i, min(i + 7, 100))], days=days[i:i + 7])
+
+    series = store.series("SCHD")
+    assert series.size == 100
+    assert series.capacity >= 100
+    np.testing.assert_array_equal(series.view()["close"], np.arange(100.0))
+    assert series.last_date == days[-1]
+
+
+def test_slice_returns_views_for_date_range(store):
+    days = business_days(10, end=date(2024, 1, 12))
+    add_closes(store, "SCHD", [float(x) for x in range(10)], days=days)
+
+    bars = store.slice("SCHD", start=date(2024, 1, 3), end=date(2024, 1, 5))
+    assert bars["date"].tolist() == [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)]
+    assert np.shares_memory(bars["close"], store.series("SCHD").columns["close"])
+
+
+def test_downsample_aggregates_ohlcv():
+    bars = {
+        "date": business_days(6, end=date(2024, 1, 8)),
+        "open": np.array([1.0, 2, 3, 4, 5, 6]),
+        "high": np.array([10.0, 20, 30, 40, 50, 60]),
+        "low": np.array([0.5, 1, 1.5, 2, 2.5, 3]),
+        "close": np.array([1.5, 2.5, 3.5, 4.5, 5.5, 6.5]),
+        "volume": np.array([1, 2, 3, 4, 5, 6]),
+    }
+
+    result = downsample(bars, 2)
+    assert result["open"].tolist() == [1.0, 4.0]
+    assert result["high"].tolist() == [30.0, 60.0]
+    assert result["low"].tolist() == [0.5, 2.0]
+    assert result["close"].tolist() == [3.5, 6.5]
+    assert result["volume"].tolist() == [6, 15]
+    assert result["date"].tolist() == [bars["date"][2], bars["date"][5]]
+    assert downsample(bars, 10) is bars
+
+
+def test_save_and_load_memory_maps_then_appends(store, tmp_path):
+    add_closes(store, "SCHD", [1.0, 2.0, 3.0], end=date(2024, 1, 5))
+    store.save(tmp_path)
+
+    loaded = PriceHistoryStore.load(tmp_path)
+    assert loaded.tickers() == ["SCHD"]
+    assert isinstance(loaded.series("SCHD").columns["close"], np.memmap)
+    np.testing.assert_array_equal(loaded.slice("SCHD")["close"], [1.0, 2.0, 3.0])
+
+    # memory-map은 읽기 전용이므로 새 봉을 추가하면 메모리로 복사된 뒤 저장
+    loaded.append_bar("SCHD", date(2024, 1, 8), 4.0, 4.0, 4.0, 4.0, 10)
+    loaded.save(tmp_path)
+    np.testing.assert_array_equal(PriceHistoryStore.load(tmp_path).slice("SCHD")["close"], [1.0, 2.0, 3.0, 4.0])
+
+
+def test_subscribers_receive_only_added_bars(store):
+    received = []
+    store.subscribe(lambda ticker, bars: received.append((ticker, bars["close"].tolist())))
+
+    add_closes(store, "SCHD", [1.0, 2.0], end=date(2024, 1, 5))
+    store.append_bar("SCHD", date(2024, 1, 8), 3.0, 3.0, 3.0, 3.0, 10)
+
+    assert received == [("SCHD", [1.0, 2.0]), ("SCHD", [3.0])]
@@ -0,0 +1,72 @@
+import numpy as np
+
+from app.services.rankings import ALL, DIVIDEND, RankingIndex, load_etf_meta
+
+
+def _index() -> RankingIndex:
+    index = RankingIndex()
+    index.set_meta("SCHD", "SCHD ETF", "Diversified", "US", 3.8)
+    index.set_meta("JEPI", "JEPI ETF", "Income", "US", 8.3)
+    index.set_meta("VIGI", "VIGI ETF", "Diversified", "International", 2.8)
+    index.load_metric("1y", ["SCHD", "JEPI", "VIGI"], np.array([14.8, 9.5, np.nan]))
+    return index
+
+
+def _tickers(rows):
+    return [ticker for ticker, _, _ in rows]
+
+
+def test_top_is_sorted_and_skips_missing_values():
+    index = _index()
+
+    assert index.top("1y", 10) == [
+        ("SCHD", 14.8, index._meta["SCHD"]),
+        ("JEPI", 9.5, index._meta["JEPI"]),
+    ]
+    assert _tickers(index.top(DIVIDEND, 2)) == ["JEPI", "SCHD"]
+
+
+def test_sector_and_region_partitions():
+    index = _index()
+
+    assert _tickers(index.top(DIVIDEND, 10, sector="Diversified")) == ["SCHD", "VIGI"]
+    assert _tickers(index.top(DIVIDEND, 10, region="International")) == ["VIGI"]
+    assert _tickers(index.top(DIVIDEND, 10, sector="Diversified", region="US")) == ["SCHD"]
+
+
+def test_value_and_meta_updates_move_entries():
+    index = _index()
+
+    index.set_value("1y", "JEPI", 20.0)
+    index.set_value("1y", "SCHD", None)
+    assert _tickers(index.top("1y", 10)) == ["JEPI"]
+
+    # 섹터가 바뀌면 기존 값을 유지한 채 파티션 이동
+    index.set_meta("JEPI", "JEPI ETF", "Diversified", "US", 8.3)
+    assert _tickers(index.top("1y", 10, sector="Diversified")) == ["JEPI"]
+    assert index.top("1y", 10, sector="Income") == []
+
+    index.remove("JEPI")
+    assert index.top("1y", 10) == []
+    assert _tickers(index.top(DIVIDEND, 10, sector="Diversified")) == ["SCHD", "VIGI"]
+
+
+def test_sorted_partitions_match_values_after_updates():
+    index = _index()
+    rng = np.random.default_rng(0)
+    for ticker, value in zip(rng.choice(["SCHD", "JEPI", "VIGI"], 50), rng.normal(0, 10, 50)):
+        index.set_value("1y", str(ticker), float(value))
+
+    expected = sorted(index._values["1y"].items(), key=lambda item: (-item[1], item[0]))
+    assert [(t, v) for t, v, _ in index.top("1y", 10)] == expected
+    assert len(index._sorted[("1y", ALL)]) == len(index._values["1y"])
+
+
+def test_load_etf_meta_removes_deleted_etfs(db, add_etf):
+    add_etf("SCHD", dividend_yield=3.8)
+    index = RankingIndex()
+    index.set_meta("GONE", "Gone ETF", "Income", "US", 9.0)
+
+    load_etf_meta(index)
+    assert index.tickers() == ["SCHD"]
+    assert _tickers(index.top(DIVIDEND, 10)) == ["SCHD"]
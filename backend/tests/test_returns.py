@@ -0,0 +1,141 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import etf_returns
+from app.schemas import etf as etf_schemas
+from app.services.returns import ReturnEngine, get_return_engine
+
+from conftest import add_closes, business_days
+
+
+def test_period_returns_use_business_day_offsets(store):
+    add_closes(store, "SCHD", [100.0] * 300 + [110.0])
+    engine = ReturnEngine(store)
+
+    assert engine.get("SCHD", "1d") == 10.0
+    assert engine.get("SCHD", "1y") == 10.0
+    assert engine.get("SCHD", "3y") is None
+    assert engine.get("NOPE", "1d") is None
+
+
+def test_3y_return_needs_757_bars(store):
+    add_closes(store, "LONG", [50.0] + [100.0] * 756)
+    add_closes(store, "SHORT", [100.0] * 756)
+    engine = ReturnEngine(store)
+
+    assert engine.get("LONG", "3y") == 100.0
+    assert engine.get("SHORT", "3y") is None
+
+
+def test_ring_buffer_updates_match_rebuild(store):
+    rng = np.random.default_rng(0)
+    days = business_days(400)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, 400))
+    add_closes(store, "SCHD", closes[:300].tolist(), days=days[:300])
+    engine = ReturnEngine(store)
+    updated = []
+    engine.subscribe(updated.append)
+
+    for i in range(300, 400, 10):
+        add_closes(store, "SCHD", closes[i:i + 10].tolist(), days=days[i:i + 10])
+
+    incremental = engine.values("SCHD")
+    engine.rebuild()
+    assert updated[:10] == ["SCHD"] * 10
+    assert engine.values("SCHD") == pytest.approx(incremental, nan_ok=True)
+    assert incremental["1y"] == pytest.approx((closes[-1] / closes[-253] - 1) * 100)
+
+
+def test_new_ticker_is_added_on_extend(store):
+    engine = ReturnEngine(store)
+    add_closes(store, "JEPI", [100.0, 105.0])
+
+    assert engine.tickers == ["JEPI"]
+    assert engine.get("JEPI", "1d") == 5.0
+
+
+def test_ytd_uses_previous_year_last_close(store):
+    add_closes(store, "SCHD", [80.0, 100.0, 90.0, 120.0],
+               days=np.array(["2023-12-28", "2023-12-29", "2024-01-02", "2024-01-03"], dtype="datetime64[D]"))
+    engine = ReturnEngine(store)
+    assert engine.get("SCHD", "ytd") == 20.0
+
+    # 해가 바뀌면 직전 종가가 새 기준가
+    store.append_bar("SCHD", date(2025, 1, 2), 150.0, 150.0, 150.0, 150.0, 10)
+    assert engine.get("SCHD", "ytd") == 25.0
+
+
+def test_live_prices_after_last_bar_act_as_next_bar(store):
+    add_closes(store, "SCHD", [100.0, 100.0])
+    engine = ReturnEngine(store)
+
+    engine.set_live_prices({"SCHD": 110.0})
+    assert engine.get("SCHD", "1d") == 10.0
+    engine.set_live_prices({"SCHD": 121.0})
+    assert engine.get("SCHD", "1d") == 21.0
+    assert engine.set_live_prices({"NOPE": 1.0}) == []
+
+    # 현재가는 rebuild 후에도 유지되고, 당일 봉이 들어오면 저장된 종가가 우선
+    engine.rebuild()
+    assert engine.get("SCHD", "1d") == 21.0
+    store.append_bar("SCHD", date.today(), 105.0, 105.0, 105.0, 105.0, 10)
+    assert engine.get("SCHD", "1d") == 5.0
+
+
+def test_live_price_on_same_day_bar_uses_previous_close(store):
+    today = date.today()
+    add_closes(store, "SCHD", [100.0, 110.0], days=np.array([today - timedelta(days=1), today], dtype="datetime64[D]"))
+    engine = ReturnEngine(store)
+
+    engine.set_live_prices({"SCHD": 121.0})
+    assert engine.get("SCHD", "1d") == 21.0
+
+
+def test_add_period(store):
+    add_closes(store, "SCHD", [100.0] * 10 + [110.0])
+    engine = ReturnEngine(store)
+
+    engine.add_period("2w", 10)
+    assert "2w" in engine.periods
+    assert engine.get("SCHD", "2w") == 10.0
+    with pytest.raises(ValueError):
+        engine.add_period("ytd", 5)
+
+
+def test_returns_endpoint_averages_known_values(store):
+    add_closes(store, "SCHD", [100.0, 110.0])
+    add_closes(store, "JEPI", [100.0, 120.0])
+    add_closes(store, "NEW", [100.0])
+    engine = ReturnEngine(store)
+    app = FastAPI()
+    app.include_router(etf_returns.router)
+    app.dependency_overrides[get_return_engine] = lambda: engine
+    client = TestClient(app)
+
+    body = client.get("/api/etfs/returns", params={"tickers": "schd,jepi,new,nope", "periods": "1d,1w"}).json()
+    assert body["periods"] == ["1d", "1w"]
+    assert set(body["returns"]) == {"SCHD", "JEPI", "NEW"}
+    assert body["returns"]["NEW"] == {"1d": None, "1w": None}
+    assert body["average"] == {"1d": 15.0, "1w": None}
+    assert client.get("/api/etfs/returns", params={"tickers": "SCHD", "periods": "5y"}).status_code == 400
+
+
+def test_etf_response_fills_returns_from_engine(store, monkeypatch):
+    add_closes(store, "SCHD", [100.0, 110.0])
+    engine = ReturnEngine(store)
+    monkeypatch.setattr(etf_schemas, "get_return_engine", lambda: engine)
+    now = datetime.utcnow()
+    values = {
+        "id": 1, "ticker": "SCHD", "name": "SCHD ETF", "current_price": 110.0, "previous_price": 100.0,
+        "dividend_yield": 3.5, "expense_ratio": 0.06, "aum": 1000.0, "volume": 10, "sector": "Diversified",
+        "region": "US", "created_at": now, "updated_at": now,
+    }
+
+    response = etf_schemas.ETFResponse(**values)
+    assert response.return_1d == 10.0
+    assert response.return_1y is None
+    assert etf_schemas.ETFResponse(**values, return_1d=1.5).return_1d == 1.5
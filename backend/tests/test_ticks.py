@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from app.models import ETF
+from app.services import ticks
+from app.services.aggregates import build_aggregates
+from app.services.events import on_commit
+from app.services.returns import ReturnEngine
+from app.services.ticks import TickStream
+
+from conftest import add_closes
+
+
+@pytest.fixture
+def engine(store):
+    add_closes(store, "SCHD", [100.0, 100.0])
+    return ReturnEngine(store)
+
+
+@pytest.fixture
+def aggregates(db, add_etf):
+    add_etf("SCHD", current_price=100.0, previous_price=100.0)
+    add_etf("JEPI", current_price=50.0, previous_price=40.0)
+    return build_aggregates()
+
+
+@pytest.fixture
+def stream(engine, aggregates, monkeypatch):
+    monkeypatch.setattr(ticks, "get_return_engine", lambda: engine)
+    monkeypatch.setattr(ticks, "get_aggregates", lambda: aggregates)
+    stream = TickStream(flush_interval=0.01)
+    stream.reload_meta()
+    return stream
+
+
+def _db_prices(db):
+    db.expire_all()
+    return {etf.ticker: etf.current_price for etf in db.query(ETF)}
+
+
+def test_submit_keeps_latest_price_per_ticker(stream):
+    stream.submit("schd", 101.0)
+    stream.submit("SCHD", 102.0)
+    stream.submit("JEPI", 0)
+    stream.submit("JEPI", float("nan"))
+
+    assert stream._pending == {"SCHD": 102.0}
+    assert stream.ticks_received == 2
+
+
+def test_flush_writes_batch_and_notifies_subscribers(db, engine, stream):
+    everything = stream.subscribe()
+    jepi_only = stream.subscribe(["jepi"])
+    stream.submit("SCHD", 110.0)
+    stream.submit("JEPI", 55.0)
+    stream.submit("NOPE", 1.0)
+
+    deltas = asyncio.run(stream.flush())
+    assert {d["ticker"]: d["current_price"] for d in deltas} == {"SCHD": 110.0, "JEPI": 55.0}
+    assert _db_prices(db) == {"SCHD": 110.0, "JEPI": 55.0}
+    assert stream.prices() == {"SCHD": 110.0, "JEPI": 55.0}
+    assert engine.get("SCHD", "1d") == 10.0
+    jepi = next(d for d in deltas if d["ticker"] == "JEPI")
+    assert (jepi["change"], jepi["return_1d"]) == (15.0, None)
+
+    assert len(everything.queue.get_nowait()) == 2
+    assert [d["ticker"] for d in jepi_only.queue.get_nowait()] == ["JEPI"]
+
+    # 가격이 그대로면 다시 쓰지 않음
+    stream.submit("SCHD", 110.0)
+    assert asyncio.run(stream.flush()) == []
+
+
+def test_failed_flush_is_retried_with_newer_prices_first(db, aggregates, stream, monkeypatch):
+    subscription = stream.subscribe()
+    on_prices_changed = aggregates.on_prices_changed
+    failures = []
+
+    def failing(prices):
+        if not failures:
+            failures.append(prices)
+            raise RuntimeError("aggregate update failed")
+        on_prices_changed(prices)
+
+    monkeypatch.setattr(aggregates, "on_prices_changed", failing)
+    stream.submit("SCHD", 110.0)
+    stream.submit("JEPI", 55.0)
+    with pytest.raises(RuntimeError):
+        asyncio.run(stream.flush())
+
+    # DB 커밋 후 실패해도 반영 완료로 기록하지 않고 다음 flush에서 다시 반영
+    assert stream.prices() == {"SCHD": 100.0, "JEPI": 50.0}
+    assert subscription.queue.empty()
+    stream.submit("JEPI", 56.0)
+
+    deltas = asyncio.run(stream.flush())
+    assert {d["ticker"]: d["current_price"] for d in deltas} == {"SCHD": 110.0, "JEPI": 56.0}
+    assert stream.prices() == {"SCHD": 110.0, "JEPI": 56.0}
+    assert _db_prices(db) == {"SCHD": 110.0, "JEPI": 56.0}
+    assert len(subscription.queue.get_nowait()) == 2
+
+
+def test_run_counts_errors_and_keeps_flushing(stream, monkeypatch):
+    write = stream._write
+    calls = []
+
+    def flaky_write(prices):
+        calls.append(prices)
+        if len(calls) == 1:
+            raise RuntimeError("db unavailable")
+        return write(prices)
+
+    monkeypatch.setattr(stream, "_write", flaky_write)
+
+    async def scenario():
+        stream.submit("SCHD", 120.0)
+        stream.start()
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if stream.flushes:
+                break
+        await stream.stop()
+
+    asyncio.run(scenario())
+    assert stream.flush_errors == 1
+    assert stream.flushes >= 1
+    assert stream.prices()["SCHD"] == 120.0
+
+
+def test_slow_subscriber_drops_oldest_batches():
+    subscription = ticks.Subscription(["SCHD"])
+    for i in range(ticks.SUBSCRIBER_QUEUE_SIZE + 5):
+        subscription.offer([{"ticker": "SCHD", "current_price": float(i)}, {"ticker": "JEPI", "current_price": 1.0}])
+
+    assert subscription.queue.qsize() == ticks.SUBSCRIBER_QUEUE_SIZE
+    assert subscription.queue.get_nowait() == [{"ticker": "SCHD", "current_price": 5.0}]
+
+
+def test_meta_follows_etf_commits(db, add_etf, stream):
+    on_commit(ETF, stream.on_etf_changed)
+    etf = add_etf("VNQ", current_price=80.0)
+    assert stream.prices()["VNQ"] == 80.0
+
+    etf.ticker = "VNQ2"
+    db.commit()
+    assert "VNQ" not in stream.prices()
+    assert stream.prices()["VNQ2"] == 80.0
@@ -0,0 +1,17 @@
+import axios from 'axios'
+import type { ReturnTable } from '@/types'
+
+const client = axios.create({
+  baseURL: 'http://localhost:8000/api',
+})
+
+export const returnsApi = {
+  // 선택한 ETF들의 기간별 수익률과 평균 (평균은 서버에서 null 제외 후 계산)
+  get: (tickers: string[], periods?: string[]) =>
+    client.get<ReturnTable>('/etfs/returns', {
+      params: {
+        tickers: tickers.join(','),
+        periods: periods?.join(','),
+      },
+    }),
+}
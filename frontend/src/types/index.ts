@@ -15,10 +15,10 @@ export interface ETF {
   volume: number
   sector: string
   region: string
-  return_1d: number
-  return_1w: number
-  return_1m: number
-  return_1y: number
+  return_1d: number | null
+  return_1w: number | null
+  return_1m: number | null
+  return_1y: number | null
   investment_strategy?: string
   top_holdings?: Holding[]
   created_at: string
@@ -66,7 +66,8 @@ export interface Dividend {
 }
 
 export interface DividendCalendarItem {
-  id: number
+  id: number | null  // 예측 일정은 null
+  source_id: number  // 실제 기록은 id와 같고, 예측 일정은 기준이 된 기록 ID
   ticker: string
   name: string
   ex_dividend_date: string
@@ -74,6 +75,19 @@ export interface DividendCalendarItem {
   dividend_per_share: number
   frequency: string
   dividend_yield?: number
+  projected?: boolean
+}
+
+export interface MonthlyCashFlow {
+  month: string
+  amount: number
+  payments: number
+}
+
+export interface DividendForecast {
+  months: MonthlyCashFlow[]
+  total: number
+  monthly_average: number
 }
 
 export interface SectorAllocation {
@@ -83,3 +97,81 @@ export interface SectorAllocation {
 export interface RegionAllocation {
   [region: string]: number
 }
+
+export interface PriceHistory {
+  ticker: string
+  dates: string[]
+  open: number[]
+  high: number[]
+  low: number[]
+  close: number[]
+  volume: number[]
+}
+
+export interface ReturnTable {
+  periods: string[]
+  returns: { [ticker: string]: { [period: string]: number | null } }
+  average: { [period: string]: number | null }
+}
+
+export interface PriceDelta {
+  id: number
+  ticker: string
+  current_price: number
+  previous_price?: number
+  change?: number
+  return_1d?: number
+  timestamp: number
+}
+
+export interface RouteMetrics {
+  method: string
+  route: string
+  count: number
+  errors: number
+  mean_ms: number
+  p50_ms: number
+  p99_ms: number
+  max_ms: number
+  queries_per_request: number
+  max_queries: number
+}
+
+export interface ServerMetrics {
+  uptime_seconds: number
+  process: {
+    rss_mb: number | null
+    peak_rss_mb: number | null
+  }
+  routes: RouteMetrics[]
+}
+
+export interface PortfolioAnalytics {
+  tickers: string[]
+  weights: number[]
+  as_of: string
+  days: number
+  annual_return: number
+  volatility: number
+  sharpe: number | null
+  max_drawdown: number
+  dividend_yield: number
+  yield_on_cost: number | null
+  correlation: (number | null)[][]
+}
+
+export interface WhatIfScore {
+  index: number
+  annual_return: number
+  volatility: number
+  sharpe: number | null
+  max_drawdown: number
+  dividend_yield: number
+}
+
+export interface WhatIfResult {
+  tickers: string[]
+  as_of: string
+  days: number
+  scores: WhatIfScore[]
+}